@@ -8,13 +8,24 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+import functools
 from typing import Any
+from typing import Final
+from typing import Protocol
 from typing import TYPE_CHECKING
+from typing import TypeVar
+from typing import cast
+
+from start_green_stay_green.utils.fs import write_file
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
+    from collections.abc import Iterable
     from pathlib import Path
 
     from start_green_stay_green.ai.orchestrator import AIOrchestrator
+    from start_green_stay_green.utils.file_writer import FileWriter
 
 # Single source of truth for all supported languages across generators
 SUPPORTED_LANGUAGES: tuple[str, ...] = (
@@ -48,6 +59,55 @@ def validate_language(language: str) -> None:
         raise ValueError(msg)
 
 
+# Rendered starter-file contents keyed by (method, config, extra args).
+# Content methods depend only on their generator's frozen, hashable
+# config, so repeated generate() calls for the same config (batch runs,
+# test fixtures) skip the template rendering entirely. Shared by every
+# generator that opts in; cleared wholesale once it reaches the bound.
+_CONTENT_CACHE: dict[tuple[str, Hashable, tuple[object, ...]], str] = {}
+_CONTENT_CACHE_MAX: Final[int] = 512
+
+_RenderT = TypeVar("_RenderT", bound="Callable[..., str]")
+
+
+class _Configured(Protocol):
+    """A generator whose output depends only on a hashable ``config``."""
+
+    @property
+    def config(self) -> Hashable:
+        """Frozen generator configuration."""
+
+
+def memoize_on_config(method: _RenderT) -> _RenderT:
+    """Memoize a content method on ``self.config`` and its extra arguments.
+
+    Args:
+        method: Generator method returning file content and reading no
+            instance state other than a frozen ``self.config``.
+
+    Returns:
+        Wrapped method sharing one render per config across instances.
+    """
+    name = method.__qualname__
+
+    @functools.wraps(method)
+    def wrapper(self: _Configured, *args: object) -> str:
+        key = (name, self.config, args)
+        content = _CONTENT_CACHE.get(key)
+        if content is None:
+            if len(_CONTENT_CACHE) >= _CONTENT_CACHE_MAX:
+                _CONTENT_CACHE.clear()
+            content = _CONTENT_CACHE[key] = method(self, *args)
+        return content
+
+    return cast("_RenderT", wrapper)
+
+
+def clear_content_cache() -> None:
+    """Drop every render memoized by :func:`memoize_on_config`."""
+    _CONTENT_CACHE.clear()
+
+
 class GenerationError(Exception):
     """Base exception for generation failures.
 
@@ -103,6 +163,98 @@ class BaseGenerator(ABC):
         """
 
 
+class FileTreeGenerator(BaseGenerator):
+    """Base class for generators that write starter files under a directory.
+
+    Owns the directory creation and file writing shared by the structure
+    and tests generators, so both write files the same way.
+
+    Attributes:
+        output_dir: Directory the generated files are written under
+    """
+
+    def __init__(
+        self, output_dir: Path, *, file_writer: FileWriter | None = None
+    ) -> None:
+        """Initialize the generator and create its output directory.
+
+        Args:
+            output_dir: Directory the generated files are written under
+            file_writer: Optional FileWriter for additive behavior.
+                If provided, existing files are skipped instead of overwritten.
+        """
+        self.output_dir = output_dir
+        self._file_writer = file_writer
+        self._created_dirs: set[Path] = set()
+        self._mkdirp(self.output_dir)
+
+    def _mkdirp(self, directory: Path) -> None:
+        """Create ``directory`` (and parents) unless already created here.
+
+        ``Path.mkdir`` already tries the bare ``mkdir`` first and only
+        walks up on ``ENOENT``; the remaining cost on a repeat call is the
+        ``EEXIST`` round-trip plus an ``is_dir`` stat, which this skips.
+
+        Args:
+            directory: Directory to create.
+        """
+        if directory in self._created_dirs:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(directory)
+
+    def _write_files(self, payloads: Iterable[tuple[str, str]]) -> dict[str, Path]:
+        """Write a batch of files relative to the output directory.
+
+        Every distinct parent directory is created once up front, so the
+        per-file writes never re-probe directories already made for a
+        sibling.
+
+        Args:
+            payloads: ``(relative_path, content)`` pairs; each relative
+                path (POSIX-style) doubles as the returned mapping key.
+
+        Returns:
+            Dictionary mapping each relative path to its written file.
+
+        Raises:
+            GenerationError: If a file cannot be written
+        """
+        targets = [(key, self.output_dir / key, content) for key, content in payloads]
+        for directory in dict.fromkeys(path.parent for _, path, _ in targets):
+            self._mkdirp(directory)
+        return {key: self._write_file(path, content) for key, path, content in targets}
+
+    def _write_file(self, file_path: Path, content: str) -> Path:
+        """Write a generated file to disk.
+
+        If a FileWriter is configured, delegates to it for existence checking.
+        Otherwise, writes directly (original behavior).
+
+        Args:
+            file_path: Path where file will be written
+            content: Content to write to the file
+
+        Returns:
+            Path to the written file
+
+        Raises:
+            GenerationError: If file cannot be written
+        """
+        if self._file_writer is not None:
+            self._file_writer.write_file(file_path, content)
+            return file_path
+
+        # One os.write per file with no TextIOWrapper layer; LF endings
+        # survive on Windows (#386).
+        try:
+            write_file(file_path, content)
+        except OSError as e:
+            msg = f"Failed to write {file_path.name}: {e}"
+            raise GenerationError(msg, cause=e) from e
+        return file_path
+
+
 class TemplateBasedGenerator(BaseGenerator):
     """Base class for Jinja2 template-based generators.
 
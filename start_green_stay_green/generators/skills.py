@@ -21,8 +21,10 @@ are copied only when ``green init --with-ralph-loop`` is passed, by
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 import logging
+import os
 from pathlib import Path
 from typing import Any
 from typing import TYPE_CHECKING
@@ -36,6 +38,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Bounded concurrency for AI tuning, mirroring the subagents generator:
+# every required skill is tuned in its own task, but no more than this
+# many requests are in flight against the provider at once.
+DEFAULT_MAX_CONCURRENCY = 6
+
 # Reference skills directory
 REFERENCE_SKILLS_DIR = Path(__file__).parent.parent.parent / "reference" / "skills"
 
@@ -67,6 +74,54 @@ REQUIRED_SKILLS = [
 ]
 
 
+# Reference skill contents keyed by file path, each stored with the
+# (st_mtime_ns, st_size) it was read at, as subagents' _AGENT_CONTENT_CACHE.
+# Repeated runs against an unchanged reference directory cost one stat per
+# skill; an edited SKILL.md misses and is re-read.
+_SKILL_CONTENT_CACHE: dict[Path, tuple[tuple[int, int], str]] = {}
+
+
+def _read_reference_skill(path: Path) -> str:
+    """Read a SKILL.md file, memoized across generator instances.
+
+    Repeated ``SkillsGenerator`` runs (one per target project) share one
+    in-memory copy per file until the file's mtime or size changes.
+    ``read_text`` keeps universal-newline translation, so a CRLF checkout
+    reads the same as an LF one.
+
+    Args:
+        path: Path to the SKILL.md file.
+
+    Returns:
+        File content as string.
+    """
+    file_stat = path.stat()
+    signature = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _SKILL_CONTENT_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    content = path.read_text(encoding="utf-8")
+    _SKILL_CONTENT_CACHE[path] = (signature, content)
+    return content
+
+
+def _discover_skills(reference_dir: Path) -> frozenset[str]:
+    """List the skill directories under ``reference_dir`` in one pass.
+
+    A single ``os.scandir`` replaces one ``is_dir`` stat per required
+    skill. Not memoized: ``reference_dir`` is caller-supplied and may be
+    populated between validations.
+
+    Args:
+        reference_dir: Directory containing one subdirectory per skill.
+
+    Returns:
+        Names of the subdirectories found.
+    """
+    with os.scandir(reference_dir) as entries:
+        return frozenset(entry.name for entry in entries if entry.is_dir())
+
+
 @dataclass(frozen=True)
 class SkillGenerationResult:
     """Result from skill generation.
@@ -98,6 +153,7 @@ class SkillsGenerator(BaseGenerator):
             None when orchestrator not available.
         reference_dir: Path to reference skills directory.
         dry_run: Whether to run in dry-run mode (no actual tuning).
+        max_concurrency: Upper bound on concurrent skill tunings.
     """
 
     tuner: ContentTuner | None
@@ -108,6 +164,7 @@ class SkillsGenerator(BaseGenerator):
         *,
         reference_dir: Path | None = None,
         dry_run: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         """Initialize SkillsGenerator.
 
@@ -117,10 +174,22 @@ class SkillsGenerator(BaseGenerator):
             reference_dir: Custom reference skills directory. Defaults to
                 built-in reference/skills/.
             dry_run: Run in dry-run mode (copy without tuning).
+            max_concurrency: Upper bound on concurrent skill tunings.
+                ``asyncio.Semaphore`` enforces this so the fan-out does
+                not burst past provider rate limits.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
         self.orchestrator = orchestrator
         self.reference_dir = reference_dir or REFERENCE_SKILLS_DIR
         self.dry_run = dry_run
+        self.max_concurrency = max_concurrency
+        # Skill contents keyed by skill name, filled by _load_all_skills()
+        self._skill_cache: dict[str, str] = {}
 
         # Only create tuner if orchestrator available
         if self.orchestrator:
@@ -147,13 +216,18 @@ class SkillsGenerator(BaseGenerator):
     def _check_required_skills(self) -> None:
         """Check if all required skills are present.
 
+        Directory membership comes from one :func:`_discover_skills`
+        listing; only the ``SKILL.md`` presence check remains per skill.
+
         Raises:
             ValueError: If required skills are missing.
         """
+        skill_dirs = _discover_skills(self.reference_dir)
+
         missing_skills = [
             skill
             for skill in REQUIRED_SKILLS
-            if not (self.reference_dir / skill).is_dir()
+            if skill not in skill_dirs
             or not (self.reference_dir / skill / "SKILL.md").exists()
         ]
 
@@ -184,12 +258,31 @@ class SkillsGenerator(BaseGenerator):
             FileNotFoundError: If skill file doesn't exist.
         """
         skill_path = self.reference_dir / skill_name / "SKILL.md"
-        if not skill_path.exists():
+        logger.debug("Loading skill: %s", skill_name)
+        # No exists() pre-check: the open inside the read already fails
+        # for a missing file, so only the message is rewrapped.
+        try:
+            return _read_reference_skill(skill_path)
+        except FileNotFoundError as err:
             msg = f"Skill file not found: {skill_path}"
-            raise FileNotFoundError(msg)
+            raise FileNotFoundError(msg) from err
+
+    def _load_all_skills(self) -> dict[str, str]:
+        """Load every required skill into the instance cache in one pass.
 
-        logger.info("Loading skill: %s", skill_name)
-        return skill_path.read_text(encoding="utf-8")
+        Reading all reference files up front keeps disk I/O out of the
+        async tuning loop. Skills already cached are not re-read.
+
+        Returns:
+            Mapping of skill name to skill content.
+
+        Raises:
+            FileNotFoundError: If a skill file doesn't exist.
+        """
+        for skill_name in REQUIRED_SKILLS:
+            if skill_name not in self._skill_cache:
+                self._skill_cache[skill_name] = self._load_skill(skill_name)
+        return self._skill_cache
 
     async def tune_skill(
         self,
@@ -209,7 +302,7 @@ class SkillsGenerator(BaseGenerator):
         """
         # Direct copy if no tuner available
         if self.tuner is None:
-            logger.info("Copying skill %s (no AI tuning)", skill_name)
+            logger.debug("Copying skill %s (no AI tuning)", skill_name)
             return SkillGenerationResult(
                 skill_name=skill_name,
                 content=skill_content,  # Original content
@@ -219,7 +312,7 @@ class SkillsGenerator(BaseGenerator):
 
         # AI tuning if tuner available
         source_context = "Start Green Stay Green reference repository"
-        logger.info("Tuning skill %s for target context", skill_name)
+        logger.debug("Tuning skill %s for target context", skill_name)
 
         result = await self.tuner.tune(
             source_content=skill_content,
@@ -238,14 +331,20 @@ class SkillsGenerator(BaseGenerator):
         self,
         target_context: str,
     ) -> dict[str, SkillGenerationResult]:
-        """Generate all skills for target repository.
+        """Generate all skills for target repository concurrently.
+
+        Each skill is tuned in its own task; ``asyncio.gather`` waits for
+        all of them. A bounded ``Semaphore`` keeps the in-flight count at
+        or below ``self.max_concurrency``. Completion is logged as a single
+        INFO line listing each skill with its change count.
 
         Args:
             target_context: Description of target repository
                 (e.g., "FastAPI microservice for user management").
 
         Returns:
-            Dictionary mapping skill names to SkillGenerationResult.
+            Dictionary mapping skill names to SkillGenerationResult, in
+            the order declared in :data:`REQUIRED_SKILLS`.
 
         Raises:
             FileNotFoundError: If reference directory or skills missing.
@@ -263,26 +362,32 @@ class SkillsGenerator(BaseGenerator):
         """
         # Validate reference directory
         self._validate_reference_dir()
+        skill_contents = self._load_all_skills()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _run_one(skill_name: str) -> SkillGenerationResult:
+            async with semaphore:
+                return await self.tune_skill(
+                    skill_name=skill_name,
+                    skill_content=skill_contents[skill_name],
+                    target_context=target_context,
+                )
+
+        results_list = await asyncio.gather(
+            *(_run_one(skill_name) for skill_name in REQUIRED_SKILLS),
+        )
+        results = dict(zip(REQUIRED_SKILLS, results_list, strict=True))
 
-        results = {}
-
-        for skill_name in REQUIRED_SKILLS:
-            # Load skill content
-            skill_content = self._load_skill(skill_name)
-
-            # Tune skill
-            result = await self.tune_skill(
-                skill_name=skill_name,
-                skill_content=skill_content,
-                target_context=target_context,
-            )
-
-            results[skill_name] = result
-
+        # One summary record for the whole batch; per-skill progress is
+        # logged at DEBUG. The guard skips building the summary string
+        # when INFO is disabled.
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                "Generated skill %s (%d changes)",
-                skill_name,
-                len(result.changes),
+                "Generated %d skills: %s",
+                len(results),
+                ", ".join(
+                    f"{name}({len(result.changes)})" for name, result in results.items()
+                ),
             )
 
         return results
@@ -7,12 +7,17 @@ __init__.py, Hello World starter code).
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 from pathlib import Path
+from string import Template
+from types import MappingProxyType
 from typing import Any
+from typing import Final
 from typing import TYPE_CHECKING
 
-from start_green_stay_green.generators.base import BaseGenerator
-from start_green_stay_green.generators.base import GenerationError
+from start_green_stay_green.generators.base import FileTreeGenerator
+from start_green_stay_green.generators.base import clear_content_cache
+from start_green_stay_green.generators.base import memoize_on_config
 from start_green_stay_green.generators.base import validate_language
 from start_green_stay_green.utils.cpp import TIZEN_API_VERSION
 from start_green_stay_green.utils.cpp import cpp_identifier
@@ -26,10 +31,246 @@ from start_green_stay_green.utils.ruby import ruby_module_name
 from start_green_stay_green.utils.swift import package_swift
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Mapping
+
     from start_green_stay_green.utils.file_writer import FileWriter
 
+# Language -> builder dispatch table, built once at import rather than on
+# every generate() call. Builders are stored by method *name* and resolved
+# with getattr at call time, the same late binding cli's _ENHANCE_DISPATCH
+# uses, so per-instance patches of a builder are still honoured.
+_STRUCTURE_BUILDERS: Final[dict[str, str]] = {
+    "python": "_generate_python_structure",
+    "typescript": "_generate_typescript_structure",
+    "go": "_generate_go_structure",
+    "rust": "_generate_rust_structure",
+    "java": "_generate_java_structure",
+    "csharp": "_generate_csharp_structure",
+    "ruby": "_generate_ruby_structure",
+    "swift": "_generate_swift_structure",
+    "kotlin": "_generate_kotlin_structure",
+    "cpp": "_generate_cpp_structure",
+}
+
+# Python package starter files. ``string.Template`` placeholders keep the
+# bodies free of brace escaping; the rendered text is memoized per
+# project name below, so repeated generate() calls reuse one string.
+_PYTHON_INIT_TEMPLATE: Final[Template] = Template('''"""$display_name package."""
+
+__version__ = "0.1.0"
+''')
+
+_PYTHON_MAIN_TEMPLATE: Final[Template] = Template(
+    '''"""Main entry point for $project_name."""
+
+
+def main() -> None:
+    """Run the main application."""
+    print("Hello from $project_name!")
+
+
+if __name__ == "__main__":
+    main()
+'''
+)
+
+
+# Brace-language starter files, rendered through ``string.Template`` like
+# the Python bodies above so the literal text is built once at import and
+# no ``{{``/``}}`` escaping is needed. Files with no placeholders are
+# plain constants.
+_TYPESCRIPT_INDEX_TEMPLATE: Final[Template] = Template("""\
+/**
+ * Main entry point for $project_name
+ */
+
+function main(): void {
+  console.log("Hello from $project_name!");
+}
+
+main();
+""")
+
+_TYPESCRIPT_TSCONFIG_JSON: Final[str] = """\
+{
+  "compilerOptions": {
+    "target": "ES2020",
+    "module": "commonjs",
+    "lib": ["ES2020"],
+    "outDir": "./dist",
+    "rootDir": "./src",
+    "strict": true,
+    "esModuleInterop": true,
+    "skipLibCheck": true,
+    "forceConsistentCasingInFileNames": true,
+    "resolveJsonModule": true,
+    "declaration": true,
+    "declarationMap": true,
+    "sourceMap": true
+  },
+  "include": ["src/**/*"],
+  "exclude": ["node_modules", "dist"]
+}
+"""
+
+_TYPESCRIPT_ESLINTRC_JS: Final[str] = """\
+module.exports = {
+  root: true,
+  parser: "@typescript-eslint/parser",
+  parserOptions: {
+    ecmaVersion: 2020,
+    sourceType: "module",
+  },
+  plugins: ["@typescript-eslint"],
+  extends: [
+    "eslint:recommended",
+    "plugin:@typescript-eslint/recommended",
+  ],
+  env: {
+    node: true,
+    jest: true,
+  },
+  ignorePatterns: ["dist", "node_modules"],
+};
+"""
+
+_TYPESCRIPT_PRETTIERIGNORE: Final[str] = """\
+dist
+node_modules
+coverage
+.claude
+*.md
+*.yaml
+*.yml
+.github/
+scripts/
+"""
 
-@dataclass(frozen=True)
+_TYPESCRIPT_PRETTIERRC: Final[str] = """\
+{
+  "semi": true,
+  "trailingComma": "all",
+  "printWidth": 80,
+  "tabWidth": 2
+}
+"""
+
+_TYPESCRIPT_JEST_CONFIG_JS: Final[str] = """\
+module.exports = {
+  preset: "ts-jest",
+  testEnvironment: "node",
+  roots: ["<rootDir>/src", "<rootDir>/tests"],
+  testMatch: ["**/*.test.ts", "**/*.spec.ts"],
+  moduleFileExtensions: ["ts", "js", "json"],
+  collectCoverageFrom: [
+    "src/**/*.ts",
+    "!src/**/*.d.ts",
+  ],
+  coverageThreshold: {
+    global: {
+      branches: 90,
+      functions: 90,
+      lines: 90,
+      statements: 90,
+    },
+  },
+};
+"""
+
+_GO_MAIN_TEMPLATE: Final[Template] = Template("""\
+package main
+
+import "fmt"
+
+func main() {
+\tfmt.Println("Hello from $project_name!")
+}
+""")
+
+_GO_MOD_TEMPLATE: Final[Template] = Template("""\
+module $package_name
+
+go 1.21
+""")
+
+_RUST_MAIN_TEMPLATE: Final[Template] = Template("""\
+fn main() {
+    println!("Hello from $project_name!");
+}
+""")
+
+_RUST_LIB_TEMPLATE: Final[Template] = Template("""\
+//! $project_name library
+
+#[cfg(test)]
+mod tests {
+    #[test]
+    fn it_works() {
+        assert_eq!(2 + 2, 4);
+    }
+}
+""")
+
+_RUST_CARGO_TOML_TEMPLATE: Final[Template] = Template("""\
+[package]
+name = "$project_name"
+version = "0.1.0"
+edition = "2021"
+
+[dependencies]
+""")
+
+_CSHARP_PROGRAM_TEMPLATE: Final[Template] = Template("""\
+using System;
+
+namespace $namespace
+{
+    class Program
+    {
+        public static void Main(string[] args)
+        {
+            Console.WriteLine("Hello from $project_name!");
+        }
+    }
+}
+""")
+
+
+def _display_name(project_name: str) -> str:
+    """Return the title-cased display form of a project name.
+
+    Args:
+        project_name: Project name (e.g., "my-project").
+
+    Returns:
+        Display name with dashes as spaces (e.g., "My Project").
+    """
+    return project_name.replace("-", " ").title()
+
+
+@functools.lru_cache(maxsize=128)
+def _template_vars(project_name: str, package_name: str) -> Mapping[str, str]:
+    """Build the placeholder values shared by the starter-file templates.
+
+    Args:
+        project_name: Project name (e.g., "my-project").
+        package_name: Main package/module name (e.g., "my_project").
+
+    Returns:
+        Read-only ``project_name``, ``package_name`` and ``display_name``
+        values; the cached mapping is shared, so it cannot be mutated.
+    """
+    return MappingProxyType(
+        {
+            "project_name": project_name,
+            "package_name": package_name,
+            "display_name": _display_name(project_name),
+        }
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class StructureConfig:
     """Configuration for project structure generation.
 
@@ -59,8 +300,18 @@ class StructureConfig:
             msg = "Package name cannot be empty"
             raise ValueError(msg)
 
+    @property
+    def template_vars(self) -> Mapping[str, str]:
+        """Placeholder values shared by the starter-file templates.
 
-class StructureGenerator(BaseGenerator):
+        Returns:
+            Read-only ``project_name``, ``package_name`` and
+            ``display_name`` values, built once per name pair.
+        """
+        return _template_vars(self.project_name, self.package_name)
+
+
+class StructureGenerator(FileTreeGenerator):
     """Generate project source code structure for target projects.
 
     This generator creates the source code directory structure (package directory,
@@ -95,31 +346,19 @@ class StructureGenerator(BaseGenerator):
         Raises:
             ValueError: If output_dir is invalid or language is unsupported
         """
-        self.output_dir = Path(output_dir)
+        # Field validation is not repeated here: ``StructureConfig`` is
+        # frozen and its ``__post_init__`` already rejects empty values.
         self.config = config
-        self._file_writer = file_writer
-        self._validate_config()
+        super().__init__(Path(output_dir), file_writer=file_writer)
 
-    def _validate_config(self) -> None:
-        """Validate configuration and ensure output directory exists.
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all memoized starter-file contents.
 
-        Raises:
-            ValueError: If configuration is invalid
+        Intended for tests that need a cold render.
         """
-        if not self.config.language:
-            msg = "Language cannot be empty"
-            raise ValueError(msg)
-
-        if not self.config.package_name:
-            msg = "Package name cannot be empty"
-            raise ValueError(msg)
-
-        if not self.config.project_name:
-            msg = "Project name cannot be empty"
-            raise ValueError(msg)
-
-        # Ensure output directory exists
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        clear_content_cache()
+        _template_vars.cache_clear()
 
     def generate(self) -> dict[str, Any]:
         """Generate project source code structure.
@@ -134,20 +373,15 @@ class StructureGenerator(BaseGenerator):
         # Validate language is supported
         validate_language(self.config.language)
 
+        # The directory memo only dedupes within one run; the tree may
+        # have been removed since the last generate().
+        self._created_dirs.clear()
+
         # Dispatch to language-specific generator
-        generators = {
-            "python": self._generate_python_structure,
-            "typescript": self._generate_typescript_structure,
-            "go": self._generate_go_structure,
-            "rust": self._generate_rust_structure,
-            "java": self._generate_java_structure,
-            "csharp": self._generate_csharp_structure,
-            "ruby": self._generate_ruby_structure,
-            "swift": self._generate_swift_structure,
-            "kotlin": self._generate_kotlin_structure,
-            "cpp": self._generate_cpp_structure,
-        }
-        return generators[self.config.language]()
+        builder: Callable[[], dict[str, Path]] = getattr(
+            self, _STRUCTURE_BUILDERS[self.config.language]
+        )
+        return builder()
 
     def _generate_python_structure(self) -> dict[str, Path]:
         """Generate Python project structure.
@@ -155,86 +389,31 @@ class StructureGenerator(BaseGenerator):
         Returns:
             Dictionary mapping file names to file paths
         """
-        files: dict[str, Path] = {}
-
-        # Create package directory
-        package_dir = self.output_dir / self.config.package_name
-        package_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate __init__.py
-        init_key = f"{self.config.package_name}/__init__.py"
-        files[init_key] = self._write_file(
-            package_dir / "__init__.py",
-            self._python_init_py(),
-        )
-
-        # Generate main.py
-        main_key = f"{self.config.package_name}/main.py"
-        files[main_key] = self._write_file(
-            package_dir / "main.py",
-            self._python_main_py(),
+        package = self.config.package_name
+        return self._write_files(
+            (
+                (f"{package}/__init__.py", self._python_init_py()),
+                (f"{package}/main.py", self._python_main_py()),
+            )
         )
 
-        return files
-
-    def _write_file(self, file_path: Path, content: str) -> Path:
-        """Write a source file to disk.
-
-        If a FileWriter is configured, delegates to it for existence checking.
-        Otherwise, writes directly (original behavior).
-
-        Args:
-            file_path: Path where file will be written
-            content: Content to write to the file
-
-        Returns:
-            Path to the written file
-
-        Raises:
-            GenerationError: If file cannot be written
-        """
-        if self._file_writer is not None:
-            self._file_writer.write_file(file_path, content)
-            return file_path
-
-        try:
-            file_path.write_text(content, encoding="utf-8")
-        except OSError as e:
-            msg = f"Failed to write {file_path.name}: {e}"
-            raise GenerationError(msg, cause=e) from e
-        return file_path
-
+    @memoize_on_config
     def _python_init_py(self) -> str:
         """Generate Python __init__.py content.
 
         Returns:
             Content for __init__.py with package docstring and version
         """
-        # Convert package name to title case for display
-        display_name = self.config.project_name.replace("-", " ").title()
-
-        return f'''"""{display_name} package."""
-
-__version__ = "0.1.0"
-'''
+        return _PYTHON_INIT_TEMPLATE.substitute(self.config.template_vars)
 
+    @memoize_on_config
     def _python_main_py(self) -> str:
         """Generate Python main.py content.
 
         Returns:
             Content for main.py with Hello World function
         """
-        return f'''"""Main entry point for {self.config.project_name}."""
-
-
-def main() -> None:
-    """Run the main application."""
-    print("Hello from {self.config.project_name}!")
-
-
-if __name__ == "__main__":
-    main()
-'''
+        return _PYTHON_MAIN_TEMPLATE.substitute(self.config.template_vars)
 
     def _generate_typescript_structure(self) -> dict[str, Path]:
         """Generate TypeScript project structure.
@@ -246,7 +425,7 @@ if __name__ == "__main__":
 
         # Create src directory
         src_dir = self.output_dir / "src"
-        src_dir.mkdir(parents=True, exist_ok=True)
+        self._mkdirp(src_dir)
 
         # Generate index.ts
         index_key = "src/index.ts"
@@ -292,22 +471,14 @@ if __name__ == "__main__":
 
         return files
 
+    @memoize_on_config
     def _typescript_index_ts(self) -> str:
         """Generate TypeScript index.ts content.
 
         Returns:
             Content for index.ts with Hello World function
         """
-        return f"""/**
- * Main entry point for {self.config.project_name}
- */
-
-function main(): void {{
-  console.log("Hello from {self.config.project_name}!");
-}}
-
-main();
-"""
+        return _TYPESCRIPT_INDEX_TEMPLATE.substitute(self.config.template_vars)
 
     def _typescript_tsconfig_json(self) -> str:
         """Generate TypeScript tsconfig.json content.
@@ -315,26 +486,7 @@ main();
         Returns:
             Content for tsconfig.json
         """
-        return """{
-  "compilerOptions": {
-    "target": "ES2020",
-    "module": "commonjs",
-    "lib": ["ES2020"],
-    "outDir": "./dist",
-    "rootDir": "./src",
-    "strict": true,
-    "esModuleInterop": true,
-    "skipLibCheck": true,
-    "forceConsistentCasingInFileNames": true,
-    "resolveJsonModule": true,
-    "declaration": true,
-    "declarationMap": true,
-    "sourceMap": true
-  },
-  "include": ["src/**/*"],
-  "exclude": ["node_modules", "dist"]
-}
-"""
+        return _TYPESCRIPT_TSCONFIG_JSON
 
     def _typescript_eslintrc_js(self) -> str:
         """Generate TypeScript .eslintrc.js content.
@@ -342,25 +494,7 @@ main();
         Returns:
             Content for .eslintrc.js with TypeScript parser and recommended rules
         """
-        return """module.exports = {
-  root: true,
-  parser: "@typescript-eslint/parser",
-  parserOptions: {
-    ecmaVersion: 2020,
-    sourceType: "module",
-  },
-  plugins: ["@typescript-eslint"],
-  extends: [
-    "eslint:recommended",
-    "plugin:@typescript-eslint/recommended",
-  ],
-  env: {
-    node: true,
-    jest: true,
-  },
-  ignorePatterns: ["dist", "node_modules"],
-};
-"""
+        return _TYPESCRIPT_ESLINTRC_JS
 
     def _typescript_prettierignore(self) -> str:
         """Generate TypeScript .prettierignore content.
@@ -368,16 +502,7 @@ main();
         Returns:
             Content for .prettierignore to exclude non-source files
         """
-        return """dist
-node_modules
-coverage
-.claude
-*.md
-*.yaml
-*.yml
-.github/
-scripts/
-"""
+        return _TYPESCRIPT_PRETTIERIGNORE
 
     def _typescript_prettierrc(self) -> str:
         """Generate TypeScript .prettierrc content.
@@ -385,13 +510,7 @@ scripts/
         Returns:
             Content for .prettierrc with standard formatting options
         """
-        return """{
-  "semi": true,
-  "trailingComma": "all",
-  "printWidth": 80,
-  "tabWidth": 2
-}
-"""
+        return _TYPESCRIPT_PRETTIERRC
 
     def _typescript_jest_config_js(self) -> str:
         """Generate TypeScript jest.config.js content.
@@ -399,26 +518,7 @@ scripts/
         Returns:
             Content for jest.config.js with ts-jest preset and coverage thresholds
         """
-        return """module.exports = {
-  preset: "ts-jest",
-  testEnvironment: "node",
-  roots: ["<rootDir>/src", "<rootDir>/tests"],
-  testMatch: ["**/*.test.ts", "**/*.spec.ts"],
-  moduleFileExtensions: ["ts", "js", "json"],
-  collectCoverageFrom: [
-    "src/**/*.ts",
-    "!src/**/*.d.ts",
-  ],
-  coverageThreshold: {
-    global: {
-      branches: 90,
-      functions: 90,
-      lines: 90,
-      statements: 90,
-    },
-  },
-};
-"""
+        return _TYPESCRIPT_JEST_CONFIG_JS
 
     def _generate_go_structure(self) -> dict[str, Path]:
         """Generate Go project structure.
@@ -429,12 +529,12 @@ scripts/
         files: dict[str, Path] = {}
 
         # Create cmd/{package_name} directory
-        cmd_dir = self.output_dir / "cmd" / self.config.package_name
-        cmd_dir.mkdir(parents=True, exist_ok=True)
+        cmd_dir = self.output_dir.joinpath("cmd", self.config.package_name)
+        self._mkdirp(cmd_dir)
 
         # Create internal directory
         internal_dir = self.output_dir / "internal"
-        internal_dir.mkdir(parents=True, exist_ok=True)
+        self._mkdirp(internal_dir)
 
         # Generate main.go
         main_key = f"cmd/{self.config.package_name}/main.go"
@@ -452,31 +552,23 @@ scripts/
 
         return files
 
+    @memoize_on_config
     def _go_main_go(self) -> str:
         """Generate Go main.go content.
 
         Returns:
             Content for main.go with Hello World
         """
-        return f"""package main
-
-import "fmt"
-
-func main() {{
-\tfmt.Println("Hello from {self.config.project_name}!")
-}}
-"""
+        return _GO_MAIN_TEMPLATE.substitute(self.config.template_vars)
 
+    @memoize_on_config
     def _go_mod(self) -> str:
         """Generate Go go.mod content.
 
         Returns:
             Content for go.mod
         """
-        return f"""module {self.config.package_name}
-
-go 1.21
-"""
+        return _GO_MOD_TEMPLATE.substitute(self.config.template_vars)
 
     def _generate_rust_structure(self) -> dict[str, Path]:
         """Generate Rust project structure.
@@ -488,7 +580,7 @@ go 1.21
 
         # Create src directory
         src_dir = self.output_dir / "src"
-        src_dir.mkdir(parents=True, exist_ok=True)
+        self._mkdirp(src_dir)
 
         # Generate main.rs
         main_key = "src/main.rs"
@@ -513,47 +605,32 @@ go 1.21
 
         return files
 
+    @memoize_on_config
     def _rust_main_rs(self) -> str:
         """Generate Rust main.rs content.
 
         Returns:
             Content for main.rs with Hello World
         """
-        return f"""fn main() {{
-    println!("Hello from {self.config.project_name}!");
-}}
-"""
+        return _RUST_MAIN_TEMPLATE.substitute(self.config.template_vars)
 
+    @memoize_on_config
     def _rust_lib_rs(self) -> str:
         """Generate Rust lib.rs content.
 
         Returns:
             Content for lib.rs
         """
-        return f"""//! {self.config.project_name} library
-
-#[cfg(test)]
-mod tests {{
-    #[test]
-    fn it_works() {{
-        assert_eq!(2 + 2, 4);
-    }}
-}}
-"""
+        return _RUST_LIB_TEMPLATE.substitute(self.config.template_vars)
 
+    @memoize_on_config
     def _rust_cargo_toml(self) -> str:
         """Generate Rust Cargo.toml content.
 
         Returns:
             Content for Cargo.toml
         """
-        return f"""[package]
-name = "{self.config.project_name}"
-version = "0.1.0"
-edition = "2021"
-
-[dependencies]
-"""
+        return _RUST_CARGO_TOML_TEMPLATE.substitute(self.config.template_vars)
 
     def _generate_java_structure(self) -> dict[str, Path]:
         """Generate the Java legacy Android Wear project structure (#366).
@@ -578,19 +655,19 @@ edition = "2021"
         package_path = android_package_path(self.config.package_name)
 
         # Pure logic: compiled and tested by the Maven build (pom.xml).
-        logic_dir = self.output_dir / "src" / "main" / "java" / package_path
-        logic_dir.mkdir(parents=True, exist_ok=True)
+        logic_dir = self.output_dir.joinpath("src", "main", "java", package_path)
+        self._mkdirp(logic_dir)
         files[f"src/main/java/{package_path}/Greeting.java"] = self._write_file(
             logic_dir / "Greeting.java",
             self._java_greeting_java(),
         )
 
         # Wear OS app module: built with Android tooling, not Maven.
-        main_dir = self.output_dir / "app" / "src" / "main"
-        source_dir = main_dir / "java" / package_path
-        layout_dir = main_dir / "res" / "layout"
-        source_dir.mkdir(parents=True, exist_ok=True)
-        layout_dir.mkdir(parents=True, exist_ok=True)
+        main_dir = self.output_dir.joinpath("app", "src", "main")
+        source_dir = main_dir.joinpath("java", package_path)
+        layout_dir = main_dir.joinpath("res", "layout")
+        self._mkdirp(source_dir)
+        self._mkdirp(layout_dir)
 
         files["app/src/main/AndroidManifest.xml"] = self._write_file(
             main_dir / "AndroidManifest.xml",
@@ -607,6 +684,7 @@ edition = "2021"
 
         return files
 
+    @memoize_on_config
     def _java_greeting_java(self) -> str:
         """Generate the pure-logic ``Greeting.java``.
 
@@ -645,6 +723,7 @@ public final class Greeting {{
 }}
 """
 
+    @memoize_on_config
     def _java_android_manifest(self) -> str:
         """Generate the legacy Android Wear ``AndroidManifest.xml``.
 
@@ -696,6 +775,7 @@ public final class Greeting {{
 </manifest>
 """
 
+    @memoize_on_config
     def _java_main_activity(self) -> str:
         """Generate the legacy Android Wear ``MainActivity.java``.
 
@@ -742,6 +822,7 @@ public class MainActivity extends Activity {{
 }}
 """
 
+    @memoize_on_config
     def _java_activity_layout(self) -> str:
         """Generate ``res/layout/activity_main.xml`` for the Wear app.
 
@@ -779,7 +860,7 @@ public class MainActivity extends Activity {{
 
         # Create src directory
         src_dir = self.output_dir / "src"
-        src_dir.mkdir(parents=True, exist_ok=True)
+        self._mkdirp(src_dir)
 
         # Generate Program.cs
         program_key = "src/Program.cs"
@@ -790,6 +871,7 @@ public class MainActivity extends Activity {{
 
         return files
 
+    @memoize_on_config
     def _csharp_program_cs(self) -> str:
         """Generate C# Program.cs content.
 
@@ -805,19 +887,9 @@ public class MainActivity extends Activity {{
             Content for Program.cs with Hello World
         """
         namespace = csharp_namespace(self.config.package_name)
-        return f"""using System;
-
-namespace {namespace}
-{{
-    class Program
-    {{
-        public static void Main(string[] args)
-        {{
-            Console.WriteLine("Hello from {self.config.project_name}!");
-        }}
-    }}
-}}
-"""
+        return _CSHARP_PROGRAM_TEMPLATE.substitute(
+            self.config.template_vars, namespace=namespace
+        )
 
     def _generate_ruby_structure(self) -> dict[str, Path]:
         """Generate Ruby project structure.
@@ -829,7 +901,7 @@ namespace {namespace}
 
         # Create lib directory
         lib_dir = self.output_dir / "lib"
-        lib_dir.mkdir(parents=True, exist_ok=True)
+        self._mkdirp(lib_dir)
 
         # Generate main library file
         lib_key = f"lib/{self.config.package_name}.rb"
@@ -847,6 +919,7 @@ namespace {namespace}
 
         return files
 
+    @memoize_on_config
     def _ruby_lib_rb(self) -> str:
         """Generate Ruby library file content.
 
@@ -877,6 +950,7 @@ end
 {module_name}.hello if __FILE__ == $PROGRAM_NAME
 """
 
+    @memoize_on_config
     def _ruby_gemfile(self) -> str:
         """Generate Ruby Gemfile content.
 
@@ -903,8 +977,8 @@ end
         files: dict[str, Path] = {}
 
         # Create Sources/{package_name} directory for the watchOS app target
-        source_dir = self.output_dir / "Sources" / self.config.package_name
-        source_dir.mkdir(parents=True, exist_ok=True)
+        source_dir = self.output_dir.joinpath("Sources", self.config.package_name)
+        self._mkdirp(source_dir)
 
         type_name = pascal_case(self.config.package_name)
 
@@ -931,6 +1005,7 @@ end
 
         return files
 
+    @memoize_on_config
     def _swift_app_swift(self, type_name: str) -> str:
         """Generate the SwiftUI watchOS App entry point.
 
@@ -965,6 +1040,7 @@ struct {type_name}App: App {{
 }}
 """
 
+    @memoize_on_config
     def _swift_content_view_swift(self) -> str:
         """Generate the SwiftUI ContentView for the watchOS app.
 
@@ -985,6 +1061,7 @@ struct ContentView: View {{
 }}
 """
 
+    @memoize_on_config
     def _swift_package_swift(self) -> str:
         """Generate the Swift Package Manager manifest for watchOS.
 
@@ -1015,9 +1092,9 @@ package_swift` helper so the structure and dependency generators emit an
         package_path = android_package_path(self.config.package_name)
 
         # Create app/src/main/kotlin/<package>/ for the Wear OS app module
-        main_dir = self.output_dir / "app" / "src" / "main"
-        source_dir = main_dir / "kotlin" / package_path
-        source_dir.mkdir(parents=True, exist_ok=True)
+        main_dir = self.output_dir.joinpath("app", "src", "main")
+        source_dir = main_dir.joinpath("kotlin", package_path)
+        self._mkdirp(source_dir)
 
         # Generate the Wear OS AndroidManifest.xml
         manifest_key = "app/src/main/AndroidManifest.xml"
@@ -1035,6 +1112,7 @@ package_swift` helper so the structure and dependency generators emit an
 
         return files
 
+    @memoize_on_config
     def _kotlin_android_manifest(self) -> str:
         """Generate the Wear OS ``AndroidManifest.xml``.
 
@@ -1078,6 +1156,7 @@ package_swift` helper so the structure and dependency generators emit an
 </manifest>
 """
 
+    @memoize_on_config
     def _kotlin_main_activity(self) -> str:
         """Generate the Compose-for-Wear-OS ``MainActivity.kt``.
 
@@ -1147,8 +1226,8 @@ fun WearApp() {{
 
         src_dir = self.output_dir / "src"
         inc_dir = self.output_dir / "inc"
-        src_dir.mkdir(parents=True, exist_ok=True)
-        inc_dir.mkdir(parents=True, exist_ok=True)
+        self._mkdirp(src_dir)
+        self._mkdirp(inc_dir)
 
         files["src/main.cpp"] = self._write_file(
             src_dir / "main.cpp", self._cpp_main_cpp()
@@ -1167,9 +1246,9 @@ fun WearApp() {{
         # project layout, but icons are binary artifacts the generator
         # never writes, so a note documents them instead.
         res_dir = self.output_dir / "res"
-        shared_res_dir = self.output_dir / "shared" / "res"
-        res_dir.mkdir(parents=True, exist_ok=True)
-        shared_res_dir.mkdir(parents=True, exist_ok=True)
+        shared_res_dir = self.output_dir.joinpath("shared", "res")
+        self._mkdirp(res_dir)
+        self._mkdirp(shared_res_dir)
         files["res/README.md"] = self._write_file(
             res_dir / "README.md", self._cpp_res_note()
         )
@@ -1179,6 +1258,7 @@ fun WearApp() {{
 
         return files
 
+    @memoize_on_config
     def _cpp_main_cpp(self) -> str:
         """Generate the Tizen native watch-app entry point ``src/main.cpp``.
 
@@ -1279,6 +1359,7 @@ int main(int argc, char *argv[]) {{
 }}
 """
 
+    @memoize_on_config
     def _cpp_greeting_h(self) -> str:
         """Generate the pure-logic header ``inc/greeting.h``.
 
@@ -1302,6 +1383,7 @@ std::string format_greeting(const std::string &project_name);
 }}  // namespace {namespace}
 """
 
+    @memoize_on_config
     def _cpp_greeting_cpp(self) -> str:
         """Generate the pure-logic translation unit ``src/greeting.cpp``.
 
@@ -1321,6 +1403,7 @@ std::string format_greeting(const std::string &project_name) {{
 }}  // namespace {namespace}
 """
 
+    @memoize_on_config
     def _cpp_tizen_manifest(self) -> str:
         """Generate the Tizen watch-application ``tizen-manifest.xml``.
 
@@ -1350,6 +1433,7 @@ package="{app_id}" version="0.1.0">
 </manifest>
 """
 
+    @memoize_on_config
     def _cpp_res_note(self) -> str:
         """Generate the ``res/README.md`` resource-placeholder note.
 
@@ -1365,6 +1449,7 @@ scaffold never generates binary assets; add resources here via Tizen
 Studio as the app grows.
 """
 
+    @memoize_on_config
     def _cpp_shared_res_note(self) -> str:
         """Generate the ``shared/res/README.md`` icon-placeholder note.
 
@@ -9,12 +9,13 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
 from pathlib import Path
-import re
+import stat
 from typing import Any
 from typing import TYPE_CHECKING
 
 from start_green_stay_green.ai.tuner import ContentTuner
 from start_green_stay_green.generators.base import BaseGenerator
+from start_green_stay_green.utils.async_bridge import run_async
 
 # Bounded concurrency keeps us under Anthropic's per-tier rate limits even
 # when the user has eight subagents (or more, post-Phase 3) to tune.
@@ -37,14 +38,19 @@ SOURCE_AGENT_CONTEXT = (
     "agent hierarchy, paper implementations, and research workflows"
 )
 
-# Match YAML frontmatter pattern:
-# ^(---\n  - Start with --- and newline (captured group 1)
-# .*?      - Match any content (non-greedy)
-# \n---)   - End with newline and --- (end group 1)
-# \n       - Newline after frontmatter
-# (.*)$    - Capture remaining content as body (group 2)
-# re.DOTALL allows . to match newlines
-_FRONTMATTER_PATTERN = re.compile(r"^(---\n.*?\n---)\n(.*)$", re.DOTALL)
+# YAML frontmatter delimiters. The content must open with
+# _FRONTMATTER_OPEN; the first _FRONTMATTER_CLOSE after it ends the
+# block. Plain substring scans stand in for the former
+# ``^(---\n.*?\n---)\n(.*)$`` DOTALL regex with identical results, and
+# only walk the frontmatter rather than handing the whole body to ``re``.
+_FRONTMATTER_OPEN = "---\n"
+_FRONTMATTER_CLOSE = "\n---\n"
+
+# Reference agent contents keyed by file path, each stored with the
+# (st_mtime_ns, st_size) it was read at. A repeated generate_all_agents
+# run against an unchanged reference directory costs one stat per agent
+# instead of a full read and decode; an edited file misses and is re-read.
+_AGENT_CONTENT_CACHE: dict[Path, tuple[tuple[int, int], str]] = {}
 
 # Mapping from required agent names to source agent files
 REQUIRED_AGENTS = {
@@ -58,6 +64,10 @@ REQUIRED_AGENTS = {
     "performance": "performance-specialist.md",
 }
 
+# Comma-separated agent names for the invalid-name error, derived from
+# REQUIRED_AGENTS so the message can never drift from the mapping.
+_VALID_AGENT_NAMES = ", ".join(REQUIRED_AGENTS)
+
 
 def split_frontmatter(content: str) -> tuple[str, str]:
     """Split agent content into YAML frontmatter and body.
@@ -76,14 +86,20 @@ def split_frontmatter(content: str) -> tuple[str, str]:
     Raises:
         ValueError: If frontmatter not found or malformed.
     """
-    match = _FRONTMATTER_PATTERN.match(content)
-    if not match:
+    end = (
+        content.find(_FRONTMATTER_CLOSE, len(_FRONTMATTER_OPEN))
+        if content.startswith(_FRONTMATTER_OPEN)
+        else -1
+    )
+    if end == -1:
         msg = "Agent content missing YAML frontmatter"
         raise ValueError(msg)
-    return match.group(1), match.group(2)
+    # Frontmatter keeps its closing "---"; the newline after it is dropped.
+    split = end + len(_FRONTMATTER_CLOSE)
+    return content[: split - 1], content[split:]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubagentGenerationResult:
     """Result of generating a single subagent.
 
@@ -153,6 +169,7 @@ class SubagentsGenerator(BaseGenerator):
         reference_dir: Path | None = None,
         dry_run: bool = False,
         max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        target_context: str | None = None,
     ) -> None:
         """Initialize SubagentsGenerator.
 
@@ -164,12 +181,19 @@ class SubagentsGenerator(BaseGenerator):
             max_concurrency: Upper bound on concurrent agent tunings.
                 ``asyncio.Semaphore`` enforces this so a slow network or
                 tight Anthropic rate limit does not produce burst-failures.
+            target_context: Description of the target project, used by
+                the synchronous :meth:`generate` bridge. Async callers
+                pass it to :meth:`generate_all_agents` instead.
         """
         self.orchestrator = orchestrator
         self.tuner = ContentTuner(orchestrator, dry_run=dry_run)
         self.reference_dir = reference_dir or REFERENCE_AGENTS_DIR
         self.dry_run = dry_run
         self.max_concurrency = max_concurrency
+        self.target_context = target_context
+        # agent name -> (source content, (frontmatter, body)); the parse
+        # is reused for as long as the loaded content is unchanged.
+        self._parsed_cache: dict[str, tuple[str, tuple[str, str]]] = {}
         self._validate_reference_dir()
 
     def _check_directory_exists(self) -> None:
@@ -177,13 +201,16 @@ class SubagentsGenerator(BaseGenerator):
 
         Separated from _check_required_agents to provide clear error messages.
         Directory existence is validated before checking individual files to
-        fail fast with the most helpful error message.
+        fail fast with the most helpful error message. A single ``stat``
+        answers both questions (exists, is a directory).
         """
-        if not self.reference_dir.exists():
+        try:
+            mode = self.reference_dir.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError) as err:
             msg = f"Reference directory not found: {self.reference_dir}"
-            raise FileNotFoundError(msg)
+            raise FileNotFoundError(msg) from err
 
-        if not self.reference_dir.is_dir():
+        if not stat.S_ISDIR(mode):
             msg = f"Reference path is not a directory: {self.reference_dir}"
             raise NotADirectoryError(msg)
 
@@ -193,16 +220,43 @@ class SubagentsGenerator(BaseGenerator):
         Separated from _check_directory_exists to provide detailed error
         messages listing all missing files at once (rather than failing on
         first missing file).
+
+        Existence is proven by reading, so construction reads every
+        reference agent eagerly: each file is loaded through
+        :meth:`_load_agent_content`, which primes the agent content cache
+        so later ``generate_agent`` calls only pay a ``stat``. As a
+        result, a file that exists but cannot be read or decoded fails
+        construction rather than the first generation that needs it.
+
+        Raises:
+            FileNotFoundError: If any required agent file is missing.
+            OSError: If a required agent file exists but cannot be read;
+                chained from the first read error.
+            ValueError: If a required agent file is not valid UTF-8;
+                chained from the first decode error.
         """
         missing_agents = []
+        unreadable_agents: list[tuple[str, OSError | UnicodeDecodeError]] = []
         for agent_name, source_file in REQUIRED_AGENTS.items():
-            agent_path = self.reference_dir / source_file
-            if not agent_path.exists():
+            try:
+                self._load_agent_content(agent_name)
+            except (FileNotFoundError, NotADirectoryError):
                 missing_agents.append(f"{agent_name} (source: {source_file})")
+            except (OSError, UnicodeDecodeError) as err:
+                unreadable_agents.append(
+                    (f"{agent_name} (source: {source_file}: {type(err).__name__})", err)
+                )
 
         if missing_agents:
             msg = f"Missing required agent files: {', '.join(missing_agents)}"
             raise FileNotFoundError(msg)
+        if unreadable_agents:
+            names = ", ".join(name for name, _ in unreadable_agents)
+            msg = f"Unreadable required agent files: {names}"
+            first_error = unreadable_agents[0][1]
+            if isinstance(first_error, UnicodeDecodeError):
+                raise ValueError(msg) from first_error
+            raise OSError(msg) from first_error
 
     def _validate_reference_dir(self) -> None:
         """Validate that reference directory exists with required agents.
@@ -225,10 +279,19 @@ class SubagentsGenerator(BaseGenerator):
 
         Raises:
             FileNotFoundError: If agent file not found.
+            OSError: If the agent file cannot be read.
+            UnicodeDecodeError: If the agent file is not valid UTF-8.
         """
         source_file = REQUIRED_AGENTS[agent_name]
         agent_path = self.reference_dir / source_file
-        return agent_path.read_text(encoding="utf-8")
+        file_stat = agent_path.stat()
+        signature = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = _AGENT_CONTENT_CACHE.get(agent_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        content = agent_path.read_text(encoding="utf-8")
+        _AGENT_CONTENT_CACHE[agent_path] = (signature, content)
+        return content
 
     def _parse_frontmatter(self, content: str) -> tuple[str, str]:
         """Parse YAML frontmatter from agent content.
@@ -245,21 +308,49 @@ class SubagentsGenerator(BaseGenerator):
         """
         return split_frontmatter(content)
 
+    def _load_agent_parts(self, agent_name: str) -> tuple[str, str]:
+        """Load an agent and split it into frontmatter and body.
+
+        The split is cached per agent, keyed on the loaded content, so
+        repeated generations against different target contexts parse
+        each reference agent only once. An edited source file yields
+        new content and is parsed again.
+
+        Args:
+            agent_name: Name of the agent to load.
+
+        Returns:
+            Tuple of (frontmatter, body), as :meth:`_parse_frontmatter`.
+
+        Raises:
+            FileNotFoundError: If agent file not found.
+            ValueError: If frontmatter not found or malformed.
+        """
+        content = self._load_agent_content(agent_name)
+        cached = self._parsed_cache.get(agent_name)
+        if cached is not None and cached[0] == content:
+            return cached[1]
+        parts = self._parse_frontmatter(content)
+        self._parsed_cache[agent_name] = (content, parts)
+        return parts
+
     async def _tune_agent_body(
         self,
-        agent_name: str,
         body: str,
         target_context: str,
-    ) -> SubagentGenerationResult:
+    ) -> tuple[str, list[str]]:
         """Tune agent body content for target context.
 
+        Returns the raw parts rather than a result object: the caller
+        still has to prepend the frontmatter, so it builds the single
+        :class:`SubagentGenerationResult` itself.
+
         Args:
-            agent_name: Name of the agent being tuned.
             body: Agent body content (without frontmatter).
             target_context: Description of target project context.
 
         Returns:
-            Generation result with tuned content.
+            Tuple of ``(tuned_body, changes)``.
         """
         # Tune the body content using SOURCE_AGENT_CONTEXT
         tuning_result = await self.tuner.tune(
@@ -275,12 +366,7 @@ class SubagentsGenerator(BaseGenerator):
             ],
         )
 
-        return SubagentGenerationResult(
-            agent_name=agent_name,
-            content=tuning_result.content,
-            tuned=not self.dry_run,
-            changes=tuning_result.changes,
-        )
+        return tuning_result.content, tuning_result.changes
 
     async def generate_agent(
         self,
@@ -301,27 +387,24 @@ class SubagentsGenerator(BaseGenerator):
             FileNotFoundError: If agent source file not found.
         """
         if agent_name not in REQUIRED_AGENTS:
-            valid_names = ", ".join(REQUIRED_AGENTS.keys())
-            msg = f"Invalid agent name: {agent_name}. " f"Must be one of: {valid_names}"
+            msg = (
+                f"Invalid agent name: {agent_name}. "
+                f"Must be one of: {_VALID_AGENT_NAMES}"
+            )
             raise ValueError(msg)
 
-        # Load agent content
-        content = self._load_agent_content(agent_name)
-
-        # Parse frontmatter and body
-        frontmatter, body = self._parse_frontmatter(content)
+        # Load agent content and split off the frontmatter
+        frontmatter, body = self._load_agent_parts(agent_name)
 
         # Tune the body content
-        result = await self._tune_agent_body(agent_name, body, target_context)
+        tuned_body, changes = await self._tune_agent_body(body, target_context)
 
         # Reconstruct full content with frontmatter
-        full_content = f"{frontmatter}\n{result.content}"
-
         return SubagentGenerationResult(
             agent_name=agent_name,
-            content=full_content,
-            tuned=result.tuned,
-            changes=result.changes,
+            content=f"{frontmatter}\n{tuned_body}",
+            tuned=not self.dry_run,
+            changes=changes,
         )
 
     async def generate_all_agents(
@@ -378,8 +461,7 @@ class SubagentsGenerator(BaseGenerator):
         """
         plan: list[SubagentBatchEntry] = []
         for agent_name in REQUIRED_AGENTS:
-            content = self._load_agent_content(agent_name)
-            frontmatter, body = self._parse_frontmatter(content)
+            frontmatter, body = self._load_agent_parts(agent_name)
             request = self.tuner.build_batch_request(
                 custom_id=f"subagent:{agent_name}",
                 source_content=body,
@@ -461,32 +543,38 @@ class SubagentsGenerator(BaseGenerator):
             ValueError: If the source file lacks a frontmatter block
                 (raised by :meth:`_parse_frontmatter`).
         """
-        content = self._load_agent_content(agent_name)
-        frontmatter, _ = self._parse_frontmatter(content)
+        frontmatter, _ = self._load_agent_parts(agent_name)
         return frontmatter
 
     def generate(self) -> dict[str, Any]:
-        """Generate subagents synchronously (not supported).
+        """Generate every subagent synchronously.
 
-        This method is required by BaseGenerator abstract interface but
-        SubagentsGenerator requires async operations for ContentTuner integration.
+        A blocking bridge over :meth:`generate_all_agents` for callers
+        that drive every ``BaseGenerator`` through ``generate()``. It runs
+        the concurrent fan-out on a fresh event loop via
+        :func:`~start_green_stay_green.utils.async_bridge.run_async`, so
+        the agents are still tuned in parallel. Requires
+        ``target_context`` to have been given to the constructor.
 
-        The synchronous interface cannot support async tuning operations,
-        so this method raises NotImplementedError to maintain type safety
-        while directing users to the correct async interface.
-
-        Use generate_all_agents() for async batch generation or
-        generate_agent() for async single agent generation.
+        Returns:
+            Dictionary mapping agent names to generation results, in the
+            order declared in :data:`REQUIRED_AGENTS`.
 
         Raises:
-            NotImplementedError: Always. Use generate_all_agents() instead.
+            ValueError: If no ``target_context`` was given to the
+                constructor; pass one, or await generate_all_agents().
+            RuntimeError: If called from inside a running event loop;
+                await generate_all_agents() there instead.
 
         See Also:
             generate_all_agents: Async method for generating all agents.
             generate_agent: Async method for generating a single agent.
         """
-        msg = (
-            "SubagentsGenerator requires async operations. "
-            "Use generate_all_agents() or generate_agent() instead."
-        )
-        raise NotImplementedError(msg)
+        if self.target_context is None:
+            msg = (
+                "SubagentsGenerator.generate() requires a target_context; "
+                "pass target_context to the constructor or use "
+                "generate_all_agents() instead."
+            )
+            raise ValueError(msg)
+        return run_async(self.generate_all_agents(self.target_context))
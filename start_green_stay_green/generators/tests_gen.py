@@ -8,11 +8,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from string import Template
 from typing import Any
+from typing import Final
 from typing import TYPE_CHECKING
 
-from start_green_stay_green.generators.base import BaseGenerator
-from start_green_stay_green.generators.base import GenerationError
+from start_green_stay_green.generators.base import FileTreeGenerator
+from start_green_stay_green.generators.base import clear_content_cache
+from start_green_stay_green.generators.base import memoize_on_config
 from start_green_stay_green.generators.base import validate_language
 from start_green_stay_green.utils.cpp import cpp_identifier
 from start_green_stay_green.utils.csharp import csharp_namespace
@@ -22,9 +25,242 @@ from start_green_stay_green.utils.naming import pascal_case
 from start_green_stay_green.utils.ruby import ruby_module_name
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from start_green_stay_green.utils.file_writer import FileWriter
 
 
+# Language -> builder dispatch table, built once at import and resolved
+# by method name with getattr, as in structure.py's _STRUCTURE_BUILDERS.
+_TESTS_BUILDERS: Final[dict[str, str]] = {
+    "python": "_generate_python_tests",
+    "typescript": "_generate_typescript_tests",
+    "go": "_generate_go_tests",
+    "rust": "_generate_rust_tests",
+    "java": "_generate_java_tests",
+    "csharp": "_generate_csharp_tests",
+    "ruby": "_generate_ruby_tests",
+    "swift": "_generate_swift_tests",
+    "kotlin": "_generate_kotlin_tests",
+    "cpp": "_generate_cpp_tests",
+}
+
+_TYPESCRIPT_INDEX_TEST_TEMPLATE: Final[Template] = Template("""\
+/**
+ * Tests for $project_name main entry point
+ */
+
+describe("main", () => {
+  it("should run without error", () => {
+    // Import main to ensure it executes
+    expect(() => {
+      require("../src/index");
+    }).not.toThrow();
+  });
+});
+""")
+
+_GO_MAIN_TEST_GO: Final[str] = """\
+package main
+
+import (
+\t"testing"
+)
+
+func TestMain(t *testing.T) {
+\t// Test that main function exists and can be called
+\t// This verifies the Hello World entry point compiles correctly
+\tt.Run("main runs without panic", func(t *testing.T) {
+\t\t// If main() panics, the test will fail
+\t\tdefer func() {
+\t\t\tif r := recover(); r != nil {
+\t\t\t\tt.Errorf("main() panicked: %v", r)
+\t\t\t}
+\t\t}()
+\t\t// Note: main() would normally be called, but it runs indefinitely
+\t\t// For Hello World, we just verify it compiles
+\t})
+}
+"""
+
+_RUST_INTEGRATION_TEST_TEMPLATE: Final[Template] = Template("""\
+//! Integration tests for $project_name
+
+#[test]
+fn test_main_compiles() {
+    // This test verifies that the main entry point compiles
+    // and the crate can be used as a library
+    // The actual main function prints "Hello from $project_name!"
+    assert!(true, "Project compiles successfully");
+}
+
+#[cfg(test)]
+mod tests {
+    #[test]
+    fn test_hello_world_runs() {
+        // Verify the hello world functionality is accessible
+        // In a real implementation, this would call the main logic
+        assert!(true);
+    }
+}
+""")
+
+_JAVA_GREETING_TEST_TEMPLATE: Final[Template] = Template("""\
+package $package;
+
+import static org.junit.Assert.assertEquals;
+
+import org.junit.Test;
+
+/**
+ * Verifies the greeting assembly logic in {@link Greeting}.
+ *
+ * <p>Plain JVM JUnit 4 run by Maven Surefire ({@code mvn test}) -
+ * no Android SDK, emulator, or Robolectric needed.</p>
+ */
+public class GreetingTest {
+
+    @Test
+    public void greetingIsAssembledFromProjectName() {
+        // Greeting.greet() concatenates its argument, so this verifies
+        // real logic rather than comparing two identical literals.
+        assertEquals(
+                "Hello from $project_name!",
+                Greeting.greet("$project_name"));
+    }
+
+    @Test
+    public void greetingReflectsAnArbitraryName() {
+        assertEquals("Hello from wear!", Greeting.greet("wear"));
+    }
+}
+""")
+
+_CSHARP_MAIN_TESTS_TEMPLATE: Final[Template] = Template("""\
+using Xunit;
+
+namespace $namespace.Tests
+{
+    /// <summary>
+    /// Tests for $project_name main entry point
+    /// </summary>
+    public class MainTests
+    {
+        [Fact]
+        public void MainRuns_WithoutError()
+        {
+            // Test that Main method exists and can be called
+            // This verifies the Hello World entry point compiles correctly
+            var exception = Record.Exception(() =>
+            {
+                Program.Main(new string[] {});
+            });
+
+            Assert.Null(exception);
+        }
+
+        [Fact]
+        public void MainMethod_Exists()
+        {
+            // Verify Main method exists in Program class
+            var method = typeof(Program).GetMethod("Main");
+            Assert.NotNull(method);
+        }
+    }
+}
+""")
+
+_RUBY_SPEC_TEMPLATE: Final[Template] = Template("""\
+# frozen_string_literal: true
+
+require "spec_helper"
+require_relative "../lib/$package_name"
+
+RSpec.describe $module_name do
+  describe ".hello" do
+    it "runs without error" do
+      # Test that the hello method exists and can be called.
+      # This verifies the Hello World entry point works correctly.
+      expect { described_class.hello }.not_to raise_error
+    end
+
+    it "prints hello message" do
+      # Capture stdout to verify the hello message.
+      pattern = /Hello from $project_name/
+      expect { described_class.hello }
+        .to output(pattern).to_stdout
+    end
+  end
+end
+""")
+
+_SWIFT_TEST_TEMPLATE: Final[Template] = Template("""\
+import XCTest
+
+@testable import $package_name
+
+final class ${type_name}Tests: XCTestCase {
+    func testContentViewInitialises() throws {
+        // Instantiating the view verifies the SwiftUI view type compiles
+        // and constructs without error.
+        let view = ContentView()
+        XCTAssertNotNil(view.body)
+    }
+
+    func testGreetingMessageIsAssembledFromProjectName() throws {
+        // Build the greeting the same way ContentView does — from the
+        // project name via string interpolation — so the assertion verifies
+        // the interpolation logic rather than comparing identical literals.
+        let projectName = "$project_name"
+        let greeting = "Hello from \\(projectName)!"
+        XCTAssertEqual(greeting, "Hello from $project_name!")
+    }
+}
+""")
+
+_KOTLIN_GREETING_TEST_TEMPLATE: Final[Template] = Template("""\
+package $package
+
+import org.junit.Assert.assertEquals
+import org.junit.Test
+
+/** Verifies the greeting interpolation logic in MainActivity.kt. */
+class GreetingTest {
+    @Test
+    fun greetingIsAssembledFromProjectName() {
+        // greeting() interpolates its argument, so this verifies real
+        // logic rather than comparing two identical literals.
+        assertEquals("Hello from $project_name!", \
+greeting("$project_name"))
+    }
+
+    @Test
+    fun greetingReflectsAnArbitraryName() {
+        assertEquals("Hello from wear!", greeting("wear"))
+    }
+}
+""")
+
+_CPP_GREETING_TEST_TEMPLATE: Final[Template] = Template("""\
+// Catch2 tests for the pure greeting logic (src/greeting.cpp).
+// Builds with plain CMake + Conan — no Tizen Studio required.
+#include <catch2/catch_test_macros.hpp>
+
+#include "greeting.h"
+
+TEST_CASE("greeting is assembled from the project name", "[greeting]") {
+    // format_greeting() assembles its argument into the message, so this
+    // verifies real logic rather than comparing two identical literals.
+    REQUIRE($namespace::format_greeting("$project_name") ==
+            "Hello from $project_name!");
+}
+
+TEST_CASE("greeting reflects an arbitrary name", "[greeting]") {
+    REQUIRE($namespace::format_greeting("tizen") == "Hello from tizen!");
+}
+""")
+
+
 @dataclass(frozen=True)
 class TestsConfig:
     """Configuration for tests structure generation.
@@ -56,7 +292,7 @@ class TestsConfig:
             raise ValueError(msg)
 
 
-class TestsGenerator(BaseGenerator):
+class TestsGenerator(FileTreeGenerator):
     """Generate tests directory structure for target projects.
 
     This generator creates the tests directory structure (tests/, tests/__init__.py,
@@ -91,31 +327,22 @@ class TestsGenerator(BaseGenerator):
         Raises:
             ValueError: If output_dir is invalid or language is unsupported
         """
-        self.output_dir = Path(output_dir)
+        # Field validation is not repeated here: ``TestsConfig`` is frozen
+        # and its ``__post_init__`` already rejects empty values.
         self.config = config
-        self._file_writer = file_writer
-        self._validate_config()
+        # Callers pass a Path per the annotation; only coerce strays.
+        super().__init__(
+            output_dir if isinstance(output_dir, Path) else Path(output_dir),
+            file_writer=file_writer,
+        )
 
-    def _validate_config(self) -> None:
-        """Validate configuration and ensure output directory exists.
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all memoized test-file contents.
 
-        Raises:
-            ValueError: If configuration is invalid
+        Intended for tests that need a cold render.
         """
-        if not self.config.language:
-            msg = "Language cannot be empty"
-            raise ValueError(msg)
-
-        if not self.config.package_name:
-            msg = "Package name cannot be empty"
-            raise ValueError(msg)
-
-        if not self.config.project_name:
-            msg = "Project name cannot be empty"
-            raise ValueError(msg)
-
-        # Ensure output directory exists
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        clear_content_cache()
 
     def generate(self) -> dict[str, Any]:
         """Generate tests directory structure.
@@ -130,20 +357,15 @@ class TestsGenerator(BaseGenerator):
         # Validate language is supported
         validate_language(self.config.language)
 
+        # The directory memo only dedupes within one run; the tree may
+        # have been removed since the last generate().
+        self._created_dirs.clear()
+
         # Dispatch to language-specific generator
-        generators = {
-            "python": self._generate_python_tests,
-            "typescript": self._generate_typescript_tests,
-            "go": self._generate_go_tests,
-            "rust": self._generate_rust_tests,
-            "java": self._generate_java_tests,
-            "csharp": self._generate_csharp_tests,
-            "ruby": self._generate_ruby_tests,
-            "swift": self._generate_swift_tests,
-            "kotlin": self._generate_kotlin_tests,
-            "cpp": self._generate_cpp_tests,
-        }
-        return generators[self.config.language]()
+        builder: Callable[[], dict[str, Path]] = getattr(
+            self, _TESTS_BUILDERS[self.config.language]
+        )
+        return builder()
 
     def _generate_python_tests(self) -> dict[str, Path]:
         """Generate Python tests structure.
@@ -151,55 +373,14 @@ class TestsGenerator(BaseGenerator):
         Returns:
             Dictionary mapping file names to file paths
         """
-        files: dict[str, Path] = {}
-
-        # Create tests directory
-        tests_dir = self.output_dir / "tests"
-        tests_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate tests/__init__.py
-        init_key = "tests/__init__.py"
-        files[init_key] = self._write_file(
-            tests_dir / "__init__.py",
-            self._python_tests_init_py(),
-        )
-
-        # Generate tests/test_main.py
-        test_main_key = "tests/test_main.py"
-        files[test_main_key] = self._write_file(
-            tests_dir / "test_main.py",
-            self._python_test_main_py(),
+        return self._write_files(
+            [
+                ("tests/__init__.py", self._python_tests_init_py()),
+                ("tests/test_main.py", self._python_test_main_py()),
+            ]
         )
 
-        return files
-
-    def _write_file(self, file_path: Path, content: str) -> Path:
-        """Write a test file to disk.
-
-        If a FileWriter is configured, delegates to it for existence checking.
-        Otherwise, writes directly (original behavior).
-
-        Args:
-            file_path: Path where file will be written
-            content: Content to write to the file
-
-        Returns:
-            Path to the written file
-
-        Raises:
-            GenerationError: If file cannot be written
-        """
-        if self._file_writer is not None:
-            self._file_writer.write_file(file_path, content)
-            return file_path
-
-        try:
-            file_path.write_text(content, encoding="utf-8")
-        except OSError as e:
-            msg = f"Failed to write {file_path.name}: {e}"
-            raise GenerationError(msg, cause=e) from e
-        return file_path
-
+    @memoize_on_config
     def _python_tests_init_py(self) -> str:
         """Generate Python tests/__init__.py content.
 
@@ -208,6 +389,7 @@ class TestsGenerator(BaseGenerator):
         """
         return f'"""Tests for {self.config.project_name}."""\n'
 
+    @memoize_on_config
     def _python_test_main_py(self) -> str:
         """Generate Python tests/test_main.py content.
 
@@ -230,40 +412,20 @@ def test_main_runs() -> None:
         Returns:
             Dictionary mapping file names to file paths
         """
-        files: dict[str, Path] = {}
-
-        # Create tests directory
-        tests_dir = self.output_dir / "tests"
-        tests_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate tests/index.test.ts
-        test_index_key = "tests/index.test.ts"
-        files[test_index_key] = self._write_file(
-            tests_dir / "index.test.ts",
-            self._typescript_test_index_ts(),
+        return self._write_files(
+            [("tests/index.test.ts", self._typescript_test_index_ts())]
         )
 
-        return files
-
+    @memoize_on_config
     def _typescript_test_index_ts(self) -> str:
         """Generate TypeScript tests/index.test.ts content.
 
         Returns:
             Content for index.test.ts with Jest test
         """
-        return f"""/**
- * Tests for {self.config.project_name} main entry point
- */
-
-describe("main", () => {{
-  it("should run without error", () => {{
-    // Import main to ensure it executes
-    expect(() => {{
-      require("../src/index");
-    }}).not.toThrow();
-  }});
-}});
-"""
+        return _TYPESCRIPT_INDEX_TEST_TEMPLATE.substitute(
+            project_name=self.config.project_name
+        )
 
     def _generate_go_tests(self) -> dict[str, Path]:
         """Generate Go tests structure.
@@ -271,48 +433,22 @@ describe("main", () => {{
         Returns:
             Dictionary mapping file names to file paths
         """
-        files: dict[str, Path] = {}
-
-        # Create cmd/{package_name} directory
-        cmd_dir = self.output_dir / "cmd" / self.config.package_name
-        cmd_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate cmd/{package_name}/main_test.go
-        test_main_key = f"cmd/{self.config.package_name}/main_test.go"
-        files[test_main_key] = self._write_file(
-            cmd_dir / "main_test.go",
-            self._go_test_main_go(),
+        return self._write_files(
+            [
+                (
+                    f"cmd/{self.config.package_name}/main_test.go",
+                    self._go_test_main_go(),
+                )
+            ]
         )
 
-        return files
-
     def _go_test_main_go(self) -> str:
         """Generate Go main_test.go content.
 
         Returns:
             Content for main_test.go with testing.T test
         """
-        return """package main
-
-import (
-\t"testing"
-)
-
-func TestMain(t *testing.T) {
-\t// Test that main function exists and can be called
-\t// This verifies the Hello World entry point compiles correctly
-\tt.Run("main runs without panic", func(t *testing.T) {
-\t\t// If main() panics, the test will fail
-\t\tdefer func() {
-\t\t\tif r := recover(); r != nil {
-\t\t\t\tt.Errorf("main() panicked: %v", r)
-\t\t\t}
-\t\t}()
-\t\t// Note: main() would normally be called, but it runs indefinitely
-\t\t// For Hello World, we just verify it compiles
-\t})
-}
-"""
+        return _GO_MAIN_TEST_GO
 
     def _generate_rust_tests(self) -> dict[str, Path]:
         """Generate Rust tests structure.
@@ -320,47 +456,20 @@ func TestMain(t *testing.T) {
         Returns:
             Dictionary mapping file names to file paths
         """
-        files: dict[str, Path] = {}
-
-        # Create tests directory
-        tests_dir = self.output_dir / "tests"
-        tests_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate tests/integration_test.rs
-        test_integration_key = "tests/integration_test.rs"
-        files[test_integration_key] = self._write_file(
-            tests_dir / "integration_test.rs",
-            self._rust_test_integration_rs(),
+        return self._write_files(
+            [("tests/integration_test.rs", self._rust_test_integration_rs())]
         )
 
-        return files
-
+    @memoize_on_config
     def _rust_test_integration_rs(self) -> str:
         """Generate Rust tests/integration_test.rs content.
 
         Returns:
             Content for integration_test.rs with #[test] attribute
         """
-        return f"""//! Integration tests for {self.config.project_name}
-
-#[test]
-fn test_main_compiles() {{
-    // This test verifies that the main entry point compiles
-    // and the crate can be used as a library
-    // The actual main function prints "Hello from {self.config.project_name}!"
-    assert!(true, "Project compiles successfully");
-}}
-
-#[cfg(test)]
-mod tests {{
-    #[test]
-    fn test_hello_world_runs() {{
-        // Verify the hello world functionality is accessible
-        // In a real implementation, this would call the main logic
-        assert!(true);
-    }}
-}}
-"""
+        return _RUST_INTEGRATION_TEST_TEMPLATE.substitute(
+            project_name=self.config.project_name
+        )
 
     def _generate_java_tests(self) -> dict[str, Path]:
         """Generate the Java JUnit 4 unit-test scaffold (#366).
@@ -374,20 +483,17 @@ mod tests {{
         Returns:
             Dictionary mapping file names to file paths
         """
-        files: dict[str, Path] = {}
-
         package_path = android_package_path(self.config.package_name)
-        test_dir = self.output_dir / "src" / "test" / "java" / package_path
-        test_dir.mkdir(parents=True, exist_ok=True)
-
-        test_key = f"src/test/java/{package_path}/GreetingTest.java"
-        files[test_key] = self._write_file(
-            test_dir / "GreetingTest.java",
-            self._java_greeting_test(),
+        return self._write_files(
+            [
+                (
+                    f"src/test/java/{package_path}/GreetingTest.java",
+                    self._java_greeting_test(),
+                )
+            ]
         )
 
-        return files
-
+    @memoize_on_config
     def _java_greeting_test(self) -> str:
         """Generate the Java JUnit 4 test content.
 
@@ -401,35 +507,9 @@ mod tests {{
             Content for the JUnit 4 test class file.
         """
         package = android_package(self.config.package_name)
-        return f"""package {package};
-
-import static org.junit.Assert.assertEquals;
-
-import org.junit.Test;
-
-/**
- * Verifies the greeting assembly logic in {{@link Greeting}}.
- *
- * <p>Plain JVM JUnit 4 run by Maven Surefire ({{@code mvn test}}) -
- * no Android SDK, emulator, or Robolectric needed.</p>
- */
-public class GreetingTest {{
-
-    @Test
-    public void greetingIsAssembledFromProjectName() {{
-        // Greeting.greet() concatenates its argument, so this verifies
-        // real logic rather than comparing two identical literals.
-        assertEquals(
-                "Hello from {self.config.project_name}!",
-                Greeting.greet("{self.config.project_name}"));
-    }}
-
-    @Test
-    public void greetingReflectsAnArbitraryName() {{
-        assertEquals("Hello from wear!", Greeting.greet("wear"));
-    }}
-}}
-"""
+        return _JAVA_GREETING_TEST_TEMPLATE.substitute(
+            package=package, project_name=self.config.project_name
+        )
 
     def _generate_csharp_tests(self) -> dict[str, Path]:
         """Generate C# tests structure.
@@ -437,21 +517,9 @@ public class GreetingTest {{
         Returns:
             Dictionary mapping file names to file paths
         """
-        files: dict[str, Path] = {}
-
-        # Create tests directory
-        tests_dir = self.output_dir / "tests"
-        tests_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate tests/MainTests.cs
-        test_main_key = "tests/MainTests.cs"
-        files[test_main_key] = self._write_file(
-            tests_dir / "MainTests.cs",
-            self._csharp_test_main_cs(),
-        )
-
-        return files
+        return self._write_files([("tests/MainTests.cs", self._csharp_test_main_cs())])
 
+    @memoize_on_config
     def _csharp_test_main_cs(self) -> str:
         """Generate C# MainTests.cs content.
 
@@ -467,38 +535,9 @@ public class GreetingTest {{
         """
         namespace = csharp_namespace(self.config.package_name)
 
-        return f"""using Xunit;
-
-namespace {namespace}.Tests
-{{
-    /// <summary>
-    /// Tests for {self.config.project_name} main entry point
-    /// </summary>
-    public class MainTests
-    {{
-        [Fact]
-        public void MainRuns_WithoutError()
-        {{
-            // Test that Main method exists and can be called
-            // This verifies the Hello World entry point compiles correctly
-            var exception = Record.Exception(() =>
-            {{
-                Program.Main(new string[] {{}});
-            }});
-
-            Assert.Null(exception);
-        }}
-
-        [Fact]
-        public void MainMethod_Exists()
-        {{
-            // Verify Main method exists in Program class
-            var method = typeof(Program).GetMethod("Main");
-            Assert.NotNull(method);
-        }}
-    }}
-}}
-"""
+        return _CSHARP_MAIN_TESTS_TEMPLATE.substitute(
+            namespace=namespace, project_name=self.config.project_name
+        )
 
     def _generate_ruby_tests(self) -> dict[str, Path]:
         """Generate Ruby tests structure.
@@ -506,28 +545,17 @@ namespace {namespace}.Tests
         Returns:
             Dictionary mapping file names to file paths
         """
-        files: dict[str, Path] = {}
-
-        # Create spec directory
-        spec_dir = self.output_dir / "spec"
-        spec_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate spec/{package_name}_spec.rb
-        test_spec_key = f"spec/{self.config.package_name}_spec.rb"
-        files[test_spec_key] = self._write_file(
-            spec_dir / f"{self.config.package_name}_spec.rb",
-            self._ruby_test_spec_rb(),
-        )
-
-        # Generate spec/spec_helper.rb
-        spec_helper_key = "spec/spec_helper.rb"
-        files[spec_helper_key] = self._write_file(
-            spec_dir / "spec_helper.rb",
-            self._ruby_spec_helper_rb(),
+        return self._write_files(
+            [
+                (
+                    f"spec/{self.config.package_name}_spec.rb",
+                    self._ruby_test_spec_rb(),
+                ),
+                ("spec/spec_helper.rb", self._ruby_spec_helper_rb()),
+            ]
         )
 
-        return files
-
+    @memoize_on_config
     def _ruby_test_spec_rb(self) -> str:
         """Generate Ruby spec file content.
 
@@ -543,29 +571,13 @@ namespace {namespace}.Tests
             Content for {package_name}_spec.rb with RSpec test
         """
         module_name = ruby_module_name(self.config.package_name)
-        return f"""# frozen_string_literal: true
-
-require "spec_helper"
-require_relative "../lib/{self.config.package_name}"
-
-RSpec.describe {module_name} do
-  describe ".hello" do
-    it "runs without error" do
-      # Test that the hello method exists and can be called.
-      # This verifies the Hello World entry point works correctly.
-      expect {{ described_class.hello }}.not_to raise_error
-    end
-
-    it "prints hello message" do
-      # Capture stdout to verify the hello message.
-      pattern = /Hello from {self.config.project_name}/
-      expect {{ described_class.hello }}
-        .to output(pattern).to_stdout
-    end
-  end
-end
-"""
+        return _RUBY_SPEC_TEMPLATE.substitute(
+            module_name=module_name,
+            package_name=self.config.package_name,
+            project_name=self.config.project_name,
+        )
 
+    @memoize_on_config
     def _ruby_spec_helper_rb(self) -> str:
         """Generate Ruby spec_helper.rb content.
 
@@ -630,22 +642,18 @@ end
         Returns:
             Dictionary mapping file names to file paths
         """
-        files: dict[str, Path] = {}
-
-        # Create Tests/{package_name}Tests directory per SPM convention
+        # Tests/{package_name}Tests/ per SPM convention
         test_target = f"{self.config.package_name}Tests"
-        test_dir = self.output_dir / "Tests" / test_target
-        test_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate Tests/{package_name}Tests/{package_name}Tests.swift
-        test_key = f"Tests/{test_target}/{test_target}.swift"
-        files[test_key] = self._write_file(
-            test_dir / f"{test_target}.swift",
-            self._swift_test_swift(),
+        return self._write_files(
+            [
+                (
+                    f"Tests/{test_target}/{test_target}.swift",
+                    self._swift_test_swift(),
+                )
+            ]
         )
 
-        return files
-
+    @memoize_on_config
     def _swift_test_swift(self) -> str:
         """Generate Swift XCTest content.
 
@@ -659,28 +667,11 @@ end
             Content for the XCTest test file with an XCTestCase subclass
         """
         type_name = pascal_case(self.config.package_name)
-        return f"""import XCTest
-
-@testable import {self.config.package_name}
-
-final class {type_name}Tests: XCTestCase {{
-    func testContentViewInitialises() throws {{
-        // Instantiating the view verifies the SwiftUI view type compiles
-        // and constructs without error.
-        let view = ContentView()
-        XCTAssertNotNil(view.body)
-    }}
-
-    func testGreetingMessageIsAssembledFromProjectName() throws {{
-        // Build the greeting the same way ContentView does — from the
-        // project name via string interpolation — so the assertion verifies
-        // the interpolation logic rather than comparing identical literals.
-        let projectName = "{self.config.project_name}"
-        let greeting = "Hello from \\(projectName)!"
-        XCTAssertEqual(greeting, "Hello from {self.config.project_name}!")
-    }}
-}}
-"""
+        return _SWIFT_TEST_TEMPLATE.substitute(
+            package_name=self.config.package_name,
+            project_name=self.config.project_name,
+            type_name=type_name,
+        )
 
     def _generate_kotlin_tests(self) -> dict[str, Path]:
         """Generate the Kotlin JUnit unit-test scaffold (#356).
@@ -693,20 +684,17 @@ final class {type_name}Tests: XCTestCase {{
         Returns:
             Dictionary mapping file names to file paths
         """
-        files: dict[str, Path] = {}
-
         package_path = android_package_path(self.config.package_name)
-        test_dir = self.output_dir / "app" / "src" / "test" / "kotlin" / package_path
-        test_dir.mkdir(parents=True, exist_ok=True)
-
-        test_key = f"app/src/test/kotlin/{package_path}/GreetingTest.kt"
-        files[test_key] = self._write_file(
-            test_dir / "GreetingTest.kt",
-            self._kotlin_greeting_test(),
+        return self._write_files(
+            [
+                (
+                    f"app/src/test/kotlin/{package_path}/GreetingTest.kt",
+                    self._kotlin_greeting_test(),
+                )
+            ]
         )
 
-        return files
-
+    @memoize_on_config
     def _kotlin_greeting_test(self) -> str:
         """Generate the Kotlin JUnit test content.
 
@@ -720,27 +708,9 @@ final class {type_name}Tests: XCTestCase {{
             Content for the JUnit 4 test class file.
         """
         package = android_package(self.config.package_name)
-        return f"""package {package}
-
-import org.junit.Assert.assertEquals
-import org.junit.Test
-
-/** Verifies the greeting interpolation logic in MainActivity.kt. */
-class GreetingTest {{
-    @Test
-    fun greetingIsAssembledFromProjectName() {{
-        // greeting() interpolates its argument, so this verifies real
-        // logic rather than comparing two identical literals.
-        assertEquals("Hello from {self.config.project_name}!", \
-greeting("{self.config.project_name}"))
-    }}
-
-    @Test
-    fun greetingReflectsAnArbitraryName() {{
-        assertEquals("Hello from wear!", greeting("wear"))
-    }}
-}}
-"""
+        return _KOTLIN_GREETING_TEST_TEMPLATE.substitute(
+            package=package, project_name=self.config.project_name
+        )
 
     def _generate_cpp_tests(self) -> dict[str, Path]:
         """Generate the C++ Catch2 unit-test scaffold (#361).
@@ -753,18 +723,11 @@ greeting("{self.config.project_name}"))
         Returns:
             Dictionary mapping file names to file paths
         """
-        files: dict[str, Path] = {}
-
-        tests_dir = self.output_dir / "tests"
-        tests_dir.mkdir(parents=True, exist_ok=True)
-
-        files["tests/test_greeting.cpp"] = self._write_file(
-            tests_dir / "test_greeting.cpp",
-            self._cpp_greeting_test(),
+        return self._write_files(
+            [("tests/test_greeting.cpp", self._cpp_greeting_test())]
         )
 
-        return files
-
+    @memoize_on_config
     def _cpp_greeting_test(self) -> str:
         """Generate the Catch2 test content.
 
@@ -778,20 +741,6 @@ greeting("{self.config.project_name}"))
             Content for the Catch2 test source file.
         """
         namespace = cpp_identifier(self.config.package_name)
-        return f"""// Catch2 tests for the pure greeting logic (src/greeting.cpp).
-// Builds with plain CMake + Conan — no Tizen Studio required.
-#include <catch2/catch_test_macros.hpp>
-
-#include "greeting.h"
-
-TEST_CASE("greeting is assembled from the project name", "[greeting]") {{
-    // format_greeting() assembles its argument into the message, so this
-    // verifies real logic rather than comparing two identical literals.
-    REQUIRE({namespace}::format_greeting("{self.config.project_name}") ==
-            "Hello from {self.config.project_name}!");
-}}
-
-TEST_CASE("greeting reflects an arbitrary name", "[greeting]") {{
-    REQUIRE({namespace}::format_greeting("tizen") == "Hello from tizen!");
-}}
-"""
+        return _CPP_GREETING_TEST_TEMPLATE.substitute(
+            namespace=namespace, project_name=self.config.project_name
+        )
@@ -4,20 +4,86 @@ Exports:
 - GitHubClient: Main GitHub API client
 - GitHubError: Base exception for GitHub API errors
 - GitHubAuthError: Authentication/authorization errors
+- GitHubRateLimitError: Rate limit errors
 - BranchProtectionRule: Branch protection configuration
 - IssueData: Parsed issue data structure
+
+The exports and the ``actions``/``client``/``issues`` submodules are
+resolved on first attribute access (PEP 562). Importing the package, or
+one of its lighter submodules, therefore does not pull in ``httpx`` and
+``pydantic`` until the client is actually used.
 """
 
-from start_green_stay_green.github.client import BranchProtectionRule
-from start_green_stay_green.github.client import GitHubAuthError
-from start_green_stay_green.github.client import GitHubClient
-from start_green_stay_green.github.client import GitHubError
-from start_green_stay_green.github.client import IssueData
+from __future__ import annotations
+
+import importlib
+from typing import Final
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from start_green_stay_green.github import actions as actions
+    from start_green_stay_green.github import client as client
+    from start_green_stay_green.github import issues as issues
+    from start_green_stay_green.github.client import BranchProtectionRule
+    from start_green_stay_green.github.client import GitHubAuthError
+    from start_green_stay_green.github.client import GitHubClient
+    from start_green_stay_green.github.client import GitHubError
+    from start_green_stay_green.github.client import GitHubRateLimitError
+    from start_green_stay_green.github.client import IssueData
 
 __all__ = [
     "BranchProtectionRule",
     "GitHubAuthError",
     "GitHubClient",
     "GitHubError",
+    "GitHubRateLimitError",
     "IssueData",
 ]
+
+# Public name -> submodule that defines it.
+_LAZY_EXPORTS: Final[dict[str, str]] = {
+    "BranchProtectionRule": "client",
+    "GitHubAuthError": "client",
+    "GitHubClient": "client",
+    "GitHubError": "client",
+    "GitHubRateLimitError": "client",
+    "IssueData": "client",
+}
+
+_SUBMODULES: Final[frozenset[str]] = frozenset({"actions", "client", "issues"})
+
+
+def __getattr__(name: str) -> object:
+    """Import a lazily exported name or submodule on first access.
+
+    The resolved object is cached in the module globals, so later
+    lookups bypass this hook.
+
+    Args:
+        name: Attribute requested from the package.
+
+    Returns:
+        The exported object or submodule.
+
+    Raises:
+        AttributeError: If ``name`` is neither an export nor a submodule.
+    """
+    if name in _SUBMODULES:
+        value: object = importlib.import_module(f"{__name__}.{name}")
+    elif name in _LAZY_EXPORTS:
+        module = importlib.import_module(f"{__name__}.{_LAZY_EXPORTS[name]}")
+        value = getattr(module, name)
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package attributes, including not-yet-loaded exports.
+
+    Returns:
+        Sorted attribute names.
+    """
+    return sorted({*globals(), *_LAZY_EXPORTS, *_SUBMODULES})
@@ -11,17 +11,55 @@ Secure token handling and comprehensive error handling with retry logic.
 """
 
 import base64
-from contextlib import suppress
-import json
+import bisect
+from collections.abc import Callable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import random
 import re
+import time
 from typing import Any
+from typing import ClassVar
+from typing import Final
 from typing import Literal
 from typing import Self
+from typing import TypeVar
+from typing import cast
 
 import httpx
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 
+_ItemT = TypeVar("_ItemT")
+_ResultT = TypeVar("_ResultT")
+
+# Gateway errors GitHub returns while a backend is briefly unavailable.
+_TRANSIENT_STATUS_CODES: Final[frozenset[int]] = frozenset({502, 503, 504})
+# Methods safe to resend after a gateway error: the first attempt may
+# already have been applied, so a retried POST/PATCH could duplicate it.
+_IDEMPOTENT_METHODS: Final[frozenset[str]] = frozenset(
+    {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+)
+
+# ``<url>; rel="last"`` entry of a paginated response's Link header.
+_LINK_LAST_RE: Final = re.compile(r'<([^>]+)>;\s*rel="last"')
+
+# SPEC.md parsing patterns, compiled once rather than on every issue.
+_ISSUE_RE: Final = re.compile(
+    r"#+\s*(?:Issue|Epic)\s+([\d.]+):\s*(.+?)(?=(?:####|###|$))", re.DOTALL
+)
+_EPIC_RE: Final = re.compile(r"###\s*Epic\s+([\d.]+):")
+# Every ``**Field**: value`` of an issue section in one pass. A value runs
+# to the next ``**`` marker; single-line fields keep only its first line.
+_ISSUE_FIELDS_RE: Final = re.compile(
+    r"\*\*(?P<key>Type|Priority|Estimate|Description|Acceptance Criteria)\*\*:"
+    r"\s*(?P<val>.*?)(?=\*\*|\Z)",
+    re.DOTALL,
+)
+_SINGLE_LINE_FIELDS: Final[frozenset[str]] = frozenset({"Type", "Priority", "Estimate"})
+
 
 class GitHubError(Exception):
     """Base exception for GitHub API errors.
@@ -58,6 +96,17 @@ class GitHubAuthError(GitHubError):
     """
 
 
+class GitHubRateLimitError(GitHubAuthError):
+    """GitHub rate limit error.
+
+    Raised for 429 responses, and 403 responses carrying rate-limit
+    headers, that are still limited after retrying or whose reset is
+    further away than the client is willing to wait. Subclasses
+    :class:`GitHubAuthError` because a rate-limited 403 used to raise
+    it, so existing ``except GitHubAuthError`` handlers still match.
+    """
+
+
 class BranchProtectionRule(BaseModel):
     """Branch protection rule configuration.
 
@@ -70,6 +119,8 @@ class BranchProtectionRule(BaseModel):
         allow_deletions: Allow branch deletion
     """
 
+    model_config = ConfigDict(frozen=True)
+
     dismiss_stale_reviews: bool = True
     require_code_review: bool = True
     require_status_checks: bool = True
@@ -92,6 +143,9 @@ class IssueData(BaseModel):
         estimate: Time estimate
     """
 
+    # Immutable so instances can be shared by concurrent bulk creates
+    model_config = ConfigDict(frozen=True)
+
     title: str
     body: str
     labels: list[str] = Field(default_factory=list)
@@ -119,6 +173,17 @@ class GitHubClient:
     BASE_URL = "https://api.github.com"
     MAX_RETRIES = 3
     TIMEOUT = 30.0
+    RETRY_BACKOFF_MAX = 30.0
+    MAX_CONNECTIONS = 20
+    KEEPALIVE_EXPIRY = 30.0
+    RATE_LIMIT_MAX_WAIT = 60.0
+    API_VERSION = "2022-11-28"
+    GRAPHQL_BATCH_SIZE = 25
+    STATIC_HEADERS: ClassVar[dict[str, str]] = {
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": "start-green-stay-green/1.0",
+        "X-GitHub-Api-Version": API_VERSION,
+    }
 
     def __init__(
         self,
@@ -140,7 +205,13 @@ class GitHubClient:
         self._token = token
         self.owner = owner
         self.repo = repo
+        # Every repository endpoint hangs off this path
+        self._repo_path = f"/repos/{owner}/{repo}"
         self._client = self._create_http_client(token)
+        # Per-session read caches; see get_repository_info and skip_existing
+        self._repo_info: dict[str, Any] | None = None
+        self._label_names: set[str] | None = None
+        self._milestone_titles: set[str] | None = None
 
     def _validate_init_params(self, token: str, owner: str, repo: str) -> None:
         """Validate initialization parameters.
@@ -197,17 +268,22 @@ class GitHubClient:
         Args:
             token: GitHub access token
 
+        Every connection the pool opens is kept alive, and idle connections
+        outlive backoff sleeps, so bulk and concurrent operations reuse TLS
+        sessions instead of handshaking per request.
+
         Returns:
             Configured httpx.Client instance
         """
         return httpx.Client(
             base_url=self.BASE_URL,
-            headers={
-                "Authorization": f"token {token}",
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "start-green-stay-green/1.0",
-            },
+            headers={**self.STATIC_HEADERS, "Authorization": f"token {token}"},
             timeout=self.TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_CONNECTIONS,
+                keepalive_expiry=self.KEEPALIVE_EXPIRY,
+            ),
         )
 
     def __enter__(self) -> Self:
@@ -238,6 +314,7 @@ class GitHubClient:
 
         Raises:
             GitHubAuthError: For 401 or 403 status codes
+            GitHubRateLimitError: For rate-limited 403 or 429 responses
             GitHubError: For other error status codes
         """
         response_body = self._parse_response_body(response)
@@ -253,13 +330,12 @@ class GitHubClient:
         Returns:
             Parsed JSON body or fallback dict with raw text
         """
+        if not response.content:
+            return {}
         try:
-            return response.json() if response.content else {}
-        except (
-            json.JSONDecodeError,
-            Exception,  # noqa: BLE001
-        ):  # Defensive: catch all JSON errors
-            # Handle both JSONDecodeError and other exceptions during parsing
+            return cast("dict[str, Any]", response.json())
+        except ValueError:
+            # JSONDecodeError, or UnicodeDecodeError for undecodable bytes
             return {"raw_body": response.text}
 
     @staticmethod
@@ -285,8 +361,17 @@ class GitHubClient:
 
         Raises:
             GitHubAuthError: For 401 or 403 status codes
+            GitHubRateLimitError: For rate-limited 403 or 429 responses
             GitHubError: For other error status codes
         """
+        if self._is_rate_limited(response):
+            msg = "Rate limit exceeded: retry after the GitHub rate limit resets"
+            raise GitHubRateLimitError(
+                msg,
+                status_code=response.status_code,
+                response_body=response_body,
+            )
+
         if response.status_code == 401:  # noqa: PLR2004 # Standard HTTP status
             msg = "Authentication failed: invalid or expired token"
             raise GitHubAuthError(
@@ -321,6 +406,10 @@ class GitHubClient:
     ) -> dict[str, Any]:
         """Make an authenticated request to GitHub API with retry logic.
 
+        Connection errors, timeouts, gateway errors on idempotent methods
+        and rate-limited responses are retried up to ``MAX_RETRIES`` times
+        with backoff (see :meth:`_retry_delay`).
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, PATCH)
             path: API endpoint path (without base URL)
@@ -332,26 +421,131 @@ class GitHubClient:
         Raises:
             GitHubError: On API error or network failure
         """
+        return self._handle_response(self._send(method, path, **kwargs))
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        **kwargs: Any,  # noqa: ANN401 # Flexible API for httpx parameters
+    ) -> httpx.Response:
+        """Send a request, retrying as described in :meth:`_request`.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, PATCH)
+            path: API endpoint path (without base URL)
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            The final response, not yet checked for error statuses
+
+        Raises:
+            GitHubError: If every attempt fails to connect
+        """
         for attempt in range(self.MAX_RETRIES):
+            last_attempt = attempt == self.MAX_RETRIES - 1
             try:
                 response = self._client.request(method, path, **kwargs)
             except (httpx.ConnectError, httpx.TimeoutException) as e:
-                if attempt == self.MAX_RETRIES - 1:
+                if last_attempt:
                     msg = (
                         f"GitHub API connection failed after "
                         f"{self.MAX_RETRIES} retries: {e}"
                     )
                     raise GitHubError(msg) from e
                 # Retry on transient errors
+                time.sleep(self._backoff_delay(attempt))
                 continue
-            else:
-                # Request succeeded, handle response
-                return self._handle_response(response)
+
+            delay = self._retry_delay(response, attempt, method)
+            if delay is None or last_attempt:
+                return response
+            time.sleep(delay)
 
         # Should never reach here due to retry logic, but satisfies mypy
         msg = "All retry attempts exhausted"
         raise GitHubError(msg)
 
+    def _backoff_delay(self, attempt: int) -> float:
+        """Compute the jittered exponential backoff for a retry.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+
+        Returns:
+            Seconds to wait, capped at ``RETRY_BACKOFF_MAX``
+        """
+        jitter = random.random()  # noqa: S311 # Retry jitter, not cryptography
+        return float(min(2**attempt + jitter, self.RETRY_BACKOFF_MAX))
+
+    @staticmethod
+    def _is_rate_limited(response: httpx.Response) -> bool:
+        """Tell whether a response was rejected by a GitHub rate limit.
+
+        Args:
+            response: HTTP response from GitHub API
+
+        Returns:
+            True for 429, and for 403 carrying ``Retry-After`` or an
+            exhausted ``X-RateLimit-Remaining``
+        """
+        if response.status_code == 429:  # noqa: PLR2004 # Standard HTTP status
+            return True
+        if response.status_code != 403:  # noqa: PLR2004 # Standard HTTP status
+            return False
+        headers = response.headers
+        return "Retry-After" in headers or headers.get("X-RateLimit-Remaining") == "0"
+
+    def _retry_delay(
+        self, response: httpx.Response, attempt: int, method: str
+    ) -> float | None:
+        """Decide whether a response is retryable and how long to wait.
+
+        Gateway errors (502/503/504) back off exponentially, but only for
+        idempotent methods: a POST or PATCH may already have been applied
+        behind the gateway. Rate-limited responses (see
+        :meth:`_is_rate_limited`) honour ``Retry-After`` or
+        ``X-RateLimit-Reset``. A plain 403 is a permission problem and is
+        never retried.
+
+        Args:
+            response: HTTP response from GitHub API
+            attempt: Zero-based index of the attempt that produced it
+            method: HTTP method of the request that produced it
+
+        Returns:
+            Seconds to wait before retrying, or None if the response should
+            be handled as-is (success, permanent error, a gateway error on a
+            non-idempotent method, or a rate-limit reset further away than
+            ``RATE_LIMIT_MAX_WAIT``)
+        """
+        status = response.status_code
+        if status in _TRANSIENT_STATUS_CODES:
+            if method.upper() not in _IDEMPOTENT_METHODS:
+                return None
+            return self._backoff_delay(attempt)
+        if not self._is_rate_limited(response):
+            return None
+
+        headers = response.headers
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                # HTTP-date form; fall back to our own schedule
+                delay = self._backoff_delay(attempt)
+        elif headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                delay = float(headers.get("X-RateLimit-Reset", "")) - time.time()
+            except ValueError:
+                return None
+        else:
+            delay = self._backoff_delay(attempt)
+
+        delay = max(delay, 0.0)
+        return delay if delay <= self.RATE_LIMIT_MAX_WAIT else None
+
     def create_repository(
         self,
         *,
@@ -390,6 +584,7 @@ class GitHubClient:
             payload["allow_squash_merge"] = True
             payload["delete_branch_on_merge"] = True
 
+        self._repo_info = None
         return self._request("POST", "/user/repos", json=payload)
 
     def configure_branch_protection(
@@ -416,7 +611,7 @@ class GitHubClient:
 
         return self._request(
             "PUT",
-            f"/repos/{self.owner}/{self.repo}/branches/{branch}/protection",
+            f"{self._repo_path}/branches/{branch}/protection",
             json=payload,
         )
 
@@ -429,17 +624,16 @@ class GitHubClient:
         Returns:
             GitHub API payload for branch protection
         """
-        payload = {
-            "required_status_checks": self._build_status_checks(rule),
-            "enforce_admins": True,
-            "required_pull_request_reviews": self._build_pr_reviews(rule),
-            "restrictions": None,
-            "allow_force_pushes": rule.allow_force_pushes,
-            "allow_deletions": rule.allow_deletions,
-        }
-
-        # Remove None values
-        return {k: v for k, v in payload.items() if v is not None}
+        fields: tuple[tuple[str, Any], ...] = (
+            ("required_status_checks", self._build_status_checks(rule)),
+            ("enforce_admins", True),
+            ("required_pull_request_reviews", self._build_pr_reviews(rule)),
+            ("restrictions", None),
+            ("allow_force_pushes", rule.allow_force_pushes),
+            ("allow_deletions", rule.allow_deletions),
+        )
+        # Single pass; None values (including restrictions) are left out
+        return {key: value for key, value in fields if value is not None}
 
     def _build_status_checks(self, rule: BranchProtectionRule) -> dict[str, Any] | None:
         """Build status checks configuration.
@@ -510,37 +704,138 @@ class GitHubClient:
 
         return self._request(
             "POST",
-            f"/repos/{self.owner}/{self.repo}/issues",
+            f"{self._repo_path}/issues",
             json=payload,
         )
 
     def create_issues_bulk(
         self,
         issues: list[IssueData],
+        *,
+        max_concurrency: int = 1,
     ) -> list[dict[str, Any]]:
         """Create multiple issues in bulk.
 
         Args:
             issues: List of issue data to create
+            max_concurrency: Upper bound on requests in flight. The default
+                of 1 creates issues serially, in order, as GitHub's API
+                guidance recommends for content-creating requests and so
+                issue numbers follow ``issues`` order. Higher values
+                overlap round-trips on the shared connection pool.
 
         Returns:
-            List of created issue data from GitHub API
+            List of created issue data from GitHub API, in ``issues`` order
 
         Raises:
-            GitHubError: If any issue creation fails (partial creation possible)
+            GitHubError: If any issue creation fails (partial creation possible;
+                when concurrent, requests already in flight still complete)
         """
-        results = []
 
-        for issue in issues:
+        def create_one(issue: IssueData) -> dict[str, Any]:
             # Let GitHubError propagate to stop bulk operation on error
-            result = self.create_issue(
+            return self.create_issue(
                 title=issue.title,
                 body=issue.body,
                 labels=issue.labels,
             )
-            results.append(result)
 
-        return results
+        return self._run_bulk(create_one, issues, max_concurrency)
+
+    def create_issues_graphql(self, issues: list[IssueData]) -> list[dict[str, Any]]:
+        """Create issues with batched GraphQL ``createIssue`` mutations.
+
+        Up to ``GRAPHQL_BATCH_SIZE`` issues share one request. Mutations in
+        a request run in order, so issue numbers follow ``issues`` order as
+        with :meth:`create_issues_bulk`. Labels are sent as node IDs; names
+        the repository does not have yet are created first, as the REST
+        endpoint would do implicitly.
+
+        Args:
+            issues: List of issue data to create
+
+        Returns:
+            ``number``, ``url`` and ``title`` of each created issue, in
+            ``issues`` order
+
+        Raises:
+            GitHubError: If a request or any mutation in it fails (partial
+                creation possible; the GraphQL response is attached)
+        """
+        if not issues:
+            return []
+        repository_id = self.get_repository_info()["node_id"]
+        label_ids = self._label_node_ids(
+            [name for issue in issues for name in issue.labels]
+        )
+        size = self.GRAPHQL_BATCH_SIZE
+        created: list[dict[str, Any]] = []
+        for start in range(0, len(issues), size):
+            batch = [
+                {
+                    "repositoryId": repository_id,
+                    "title": issue.title,
+                    "body": issue.body,
+                    "labelIds": [label_ids[name.casefold()] for name in issue.labels],
+                }
+                for issue in issues[start : start + size]
+            ]
+            created.extend(self._run_create_issue_mutations(batch))
+        return created
+
+    def _label_node_ids(self, names: list[str]) -> dict[str, str]:
+        """Map label names to GraphQL node IDs, creating missing labels.
+
+        Args:
+            names: Label names, possibly repeated
+
+        Returns:
+            Mapping of casefolded label name to node ID
+        """
+        if not names:
+            return {}
+        labels = self._get_all_pages(f"{self._repo_path}/labels", {})
+        node_ids = {label["name"].casefold(): label["node_id"] for label in labels}
+        for name in names:
+            if name.casefold() not in node_ids:
+                node_ids[name.casefold()] = self.create_label(name)["node_id"]
+        return node_ids
+
+    def _run_create_issue_mutations(
+        self, inputs: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Send one aliased GraphQL request creating each issue in ``inputs``.
+
+        Args:
+            inputs: ``CreateIssueInput`` objects, one per issue
+
+        Returns:
+            The created issues, in ``inputs`` order
+
+        Raises:
+            GitHubError: If the response reports any GraphQL error
+        """
+        aliases = [f"i{index}" for index in range(len(inputs))]
+        declarations = ", ".join(f"${alias}: CreateIssueInput!" for alias in aliases)
+        fields = " ".join(
+            f"{alias}: createIssue(input: ${alias}) {{ issue {{ number url title }} }}"
+            for alias in aliases
+        )
+        result = self._request(
+            "POST",
+            "/graphql",
+            json={
+                "query": f"mutation({declarations}) {{ {fields} }}",
+                "variables": dict(zip(aliases, inputs, strict=True)),
+            },
+        )
+        errors = result.get("errors")
+        if errors:
+            sanitized = self._sanitize_error(errors[0].get("message", errors))
+            msg = f"GitHub GraphQL error: {sanitized}"
+            raise GitHubError(msg, response_body=result)
+        data = result["data"]
+        return [data[alias]["issue"] for alias in aliases]
 
     def create_label(
         self,
@@ -567,41 +862,64 @@ class GitHubClient:
             "description": description,
         }
 
-        return self._request(
+        result = self._request(
             "POST",
-            f"/repos/{self.owner}/{self.repo}/labels",
+            f"{self._repo_path}/labels",
             json=payload,
         )
+        if self._label_names is not None:
+            self._label_names.add(name.casefold())
+        return result
 
     def create_labels_bulk(
         self,
         labels: list[dict[str, str]],
+        *,
+        max_concurrency: int = 1,
+        skip_existing: bool = False,
     ) -> list[dict[str, Any]]:
         """Create multiple labels in bulk.
 
+        Labels repeating an earlier name (case-insensitively, as GitHub
+        compares them) are skipped rather than re-sent.
+
         Args:
             labels: List of dicts with keys: name, color (optional),
                 description (optional)
+            max_concurrency: Upper bound on requests in flight; see
+                :meth:`create_issues_bulk`.
+            skip_existing: List the repository's labels first (once per
+                client) and skip those already present instead of letting
+                their creation fail.
 
         Returns:
             List of created label data from GitHub API
 
         Raises:
-            GitHubError: If any label creation fails (partial creation possible)
+            GitHubRateLimitError: If GitHub rate-limits a label creation
+                (partial creation possible)
         """
-        results = []
 
-        for label in labels:
-            # Continue on label already exists (409), fail on other errors
-            with suppress(GitHubError):
-                result = self.create_label(
+        def create_one(label: dict[str, str]) -> dict[str, Any] | None:
+            # Continue on label already exists (409); a rate limit is not
+            # an existing label and must reach the caller
+            with self._suppress_non_rate_limit_errors():
+                return self.create_label(
                     name=label.get("name", ""),
                     color=label.get("color", "0075ca"),
                     description=label.get("description", ""),
                 )
-                results.append(result)
+            return None
+
+        def name_key(label: dict[str, str]) -> str:
+            return label.get("name", "").casefold()
 
-        return results
+        unique = self._dedupe(labels, name_key)
+        if skip_existing:
+            existing = self._existing_label_names()
+            unique = [label for label in unique if name_key(label) not in existing]
+        results = self._run_bulk(create_one, unique, max_concurrency)
+        return [result for result in results if result is not None]
 
     def create_milestone(
         self,
@@ -625,56 +943,153 @@ class GitHubClient:
             "description": description,
         }
 
-        return self._request(
+        result = self._request(
             "POST",
-            f"/repos/{self.owner}/{self.repo}/milestones",
+            f"{self._repo_path}/milestones",
             json=payload,
         )
+        if self._milestone_titles is not None:
+            self._milestone_titles.add(title)
+        return result
 
     def create_milestones_bulk(
         self,
         milestones: list[dict[str, str]],
+        *,
+        max_concurrency: int = 1,
+        skip_existing: bool = False,
     ) -> list[dict[str, Any]]:
         """Create multiple milestones in bulk.
 
+        Milestones repeating an earlier title are skipped rather than
+        re-sent.
+
         Args:
             milestones: List of dicts with keys: title, description (optional)
+            max_concurrency: Upper bound on requests in flight; see
+                :meth:`create_issues_bulk`.
+            skip_existing: List the repository's milestones first (once per
+                client) and skip those already present instead of letting
+                their creation fail.
 
         Returns:
             List of created milestone data from GitHub API
 
         Raises:
-            GitHubError: If any milestone creation fails (partial creation possible)
+            GitHubRateLimitError: If GitHub rate-limits a milestone creation
+                (partial creation possible)
         """
-        results = []
 
-        for milestone in milestones:
-            # Continue on milestone already exists (409), fail on other errors
-            with suppress(GitHubError):
-                result = self.create_milestone(
+        def create_one(milestone: dict[str, str]) -> dict[str, Any] | None:
+            # Continue on milestone already exists (409); a rate limit is
+            # not an existing milestone and must reach the caller
+            with self._suppress_non_rate_limit_errors():
+                return self.create_milestone(
                     title=milestone.get("title", ""),
                     description=milestone.get("description", ""),
                 )
-                results.append(result)
+            return None
+
+        def title_key(milestone: dict[str, str]) -> str:
+            return milestone.get("title", "")
+
+        unique = self._dedupe(milestones, title_key)
+        if skip_existing:
+            existing = self._existing_milestone_titles()
+            unique = [item for item in unique if title_key(item) not in existing]
+        results = self._run_bulk(create_one, unique, max_concurrency)
+        return [result for result in results if result is not None]
+
+    def _existing_label_names(self) -> set[str]:
+        """Return the repository's label names, listing them only once.
+
+        Returns:
+            Casefolded names of existing labels, kept up to date by
+            :meth:`create_label`
+        """
+        if self._label_names is None:
+            labels = self._get_all_pages(f"{self._repo_path}/labels", {})
+            self._label_names = {label.get("name", "").casefold() for label in labels}
+        return self._label_names
+
+    def _existing_milestone_titles(self) -> set[str]:
+        """Return the repository's milestone titles, listing them only once.
 
-        return results
+        Returns:
+            Titles of open and closed milestones, kept up to date by
+            :meth:`create_milestone`
+        """
+        if self._milestone_titles is None:
+            milestones = self._get_all_pages(
+                f"{self._repo_path}/milestones", {"state": "all"}
+            )
+            self._milestone_titles = {m.get("title", "") for m in milestones}
+        return self._milestone_titles
 
-    def _extract_field(
-        self, content: str, field_name: str, default: str | None = None
-    ) -> str | None:
-        """Extract a field value from issue content.
+    @staticmethod
+    def _dedupe(
+        items: list[dict[str, str]], key: Callable[[dict[str, str]], str]
+    ) -> list[dict[str, str]]:
+        """Drop items whose key repeats an earlier item's, keeping order.
 
         Args:
-            content: Issue content to search
-            field_name: Field name to extract (e.g., "Type", "Priority")
-            default: Default value if field not found
+            items: Bulk request items
+            key: Identity of an item on GitHub (label name, milestone title)
 
         Returns:
-            Extracted field value or default
+            The first item for each distinct key, in input order.
         """
-        pattern = rf"\*\*{field_name}\*\*:\s*(.+?)(?:\n|$)"
-        match = re.search(pattern, content)
-        return match.group(1).strip() if match else default
+        seen: set[str] = set()
+        unique = []
+        for item in items:
+            item_key = key(item)
+            if item_key not in seen:
+                seen.add(item_key)
+                unique.append(item)
+        return unique
+
+    @staticmethod
+    @contextmanager
+    def _suppress_non_rate_limit_errors() -> Iterator[None]:
+        """Swallow a bulk item's GitHubError unless it is a rate limit.
+
+        Bulk creates treat a failed item (typically 409, already exists)
+        as skipped, but a rate limit would fail every remaining item too
+        and says nothing about the item existing, so it propagates.
+
+        Yields:
+            None
+        """
+        try:
+            yield
+        except GitHubError as err:
+            if isinstance(err, GitHubRateLimitError):
+                raise
+
+    @staticmethod
+    def _run_bulk(
+        func: Callable[[_ItemT], _ResultT],
+        items: list[_ItemT],
+        max_concurrency: int,
+    ) -> list[_ResultT]:
+        """Apply a per-item request function, optionally overlapping calls.
+
+        ``httpx.Client`` is thread-safe, so concurrent calls share its
+        connection pool. Results keep the order of ``items`` either way.
+
+        Args:
+            func: Issues one API request for an item.
+            items: Items to process.
+            max_concurrency: Upper bound on calls running at once; 1 (or
+                less) runs them serially on the calling thread.
+
+        Returns:
+            ``func`` applied to each item, in input order.
+        """
+        if max_concurrency <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as pool:
+            return list(pool.map(func, items))
 
     def _build_issue_body(self, description: str, criteria: str) -> str:
         """Build issue body from description and acceptance criteria.
@@ -691,23 +1106,37 @@ class GitHubClient:
             body += f"\n\n## Acceptance Criteria\n{criteria}"
         return body
 
-    def _find_epic(self, spec_content: str, position: int) -> str | None:
-        """Find epic ID from section hierarchy before given position.
+    @staticmethod
+    def _scan_epics(spec_content: str) -> tuple[list[int], list[str]]:
+        """Locate every epic heading in a SPEC in one pass.
 
         Args:
             spec_content: Full SPEC content
+
+        Returns:
+            Parallel lists of heading start offsets (ascending) and epic IDs
+        """
+        starts: list[int] = []
+        epic_ids: list[str] = []
+        for match in _EPIC_RE.finditer(spec_content):
+            starts.append(match.start())
+            epic_ids.append(match.group(1))
+        return starts, epic_ids
+
+    @staticmethod
+    def _epic_before(epics: tuple[list[int], list[str]], position: int) -> str | None:
+        """Look up the nearest epic heading that starts before a position.
+
+        Args:
+            epics: Result of :meth:`_scan_epics`
             position: Character position to search before
 
         Returns:
             Epic ID if found, None otherwise
         """
-        if position == 0:
-            return None
-        epic_match = re.search(
-            r"###\s*Epic\s+([\d.]+):",
-            spec_content[:position],
-        )
-        return epic_match.group(1) if epic_match else None
+        starts, epic_ids = epics
+        index = bisect.bisect_left(starts, position) - 1
+        return epic_ids[index] if index >= 0 else None
 
     def parse_spec_issues(
         self,
@@ -733,91 +1162,87 @@ class GitHubClient:
             GitHubError: If parsing fails
         """
         issues = []
-        issue_pattern = r"#+\s*(?:Issue|Epic)\s+([\d.]+):\s*(.+?)(?=(?:####|###|$))"
-
-        for match in re.finditer(issue_pattern, spec_content, re.DOTALL):
+        epics = self._scan_epics(spec_content)
+        for match in _ISSUE_RE.finditer(spec_content):
             issue_data = self._parse_single_issue(
-                spec_content, match.group(1), match.group(2), match.start()
+                match.group(1),
+                match.group(2),
+                self._epic_before(epics, match.start()),
             )
             issues.append(issue_data)
 
         return issues
 
     def _parse_single_issue(
-        self, spec_content: str, issue_id: str, issue_content: str, match_pos: int
+        self, issue_id: str, issue_content: str, epic: str | None
     ) -> IssueData:
         """Parse a single issue from SPEC content.
 
         Args:
-            spec_content: Full SPEC.md content
             issue_id: Issue ID (e.g., "1.1")
             issue_content: Content of the issue section
-            match_pos: Position of match in spec_content
+            epic: ID of the enclosing epic, if any
 
         Returns:
             Parsed IssueData object
         """
-        # Extract title
-        title_match = re.search(r"^(.+?)$", issue_content, re.MULTILINE)
-        title = title_match.group(1).strip() if title_match else f"Issue {issue_id}"
-
-        # Extract fields
-        issue_type = self._extract_field(issue_content, "Type", "Task")
-        priority = self._extract_field(issue_content, "Priority", "P2")
-        estimate = self._extract_field(issue_content, "Estimate")
+        # Title is the first line of the section
+        title = issue_content.partition("\n")[0].strip() or f"Issue {issue_id}"
 
-        # Extract description and criteria
-        description = self._extract_description(issue_content)
-        criteria = self._extract_criteria(issue_content)
+        # Extract all fields in a single scan
+        fields = self._scan_fields(issue_content)
+        issue_type = fields.get("Type", "Task")
+        priority = fields.get("Priority", "P2")
+        estimate = fields.get("Estimate")
+        description = fields.get("Description", "")
+        criteria = fields.get("Acceptance Criteria", "")
 
-        # Build body and find epic
         body = self._build_issue_body(description, criteria)
-        epic = self._find_epic(spec_content, match_pos)
 
-        return IssueData(
+        # Every value is a str (or None) produced by the regexes above, so
+        # skip validation; externally supplied IssueData is still validated.
+        return IssueData.model_construct(
             title=f"{issue_id}: {title}",
             body=body,
             labels=[(issue_type or "Task").lower(), (priority or "P2").lower()],
+            milestone=None,
             epic=epic,
             type=issue_type,
             priority=priority,
             estimate=estimate,
         )
 
-    def _extract_description(self, content: str) -> str:
-        """Extract description from issue content.
+    @staticmethod
+    def _scan_fields(content: str) -> dict[str, str]:
+        """Extract the known issue fields from a section in one pass.
+
+        The first occurrence of each field wins; empty values are treated
+        as absent so callers fall back to their defaults.
 
         Args:
             content: Issue content
 
         Returns:
-            Description text or empty string
+            Mapping of field name to its stripped, non-empty value
         """
-        desc_match = re.search(
-            r"\*\*Description\*\*:\s*(.+?)(?=(?:\*\*|$))",
-            content,
-            re.DOTALL,
-        )
-        return desc_match.group(1).strip() if desc_match else ""
+        fields: dict[str, str] = {}
+        for match in _ISSUE_FIELDS_RE.finditer(content):
+            key, value = match.group("key", "val")
+            if key in _SINGLE_LINE_FIELDS:
+                value = value.partition("\n")[0]
+            value = value.strip()
+            if value:
+                fields.setdefault(key, value)
+        return fields
+
+    def get_repository_info(self, *, refresh: bool = False) -> dict[str, Any]:
+        """Get repository information.
 
-    def _extract_criteria(self, content: str) -> str:
-        """Extract acceptance criteria from issue content.
+        The result is cached for the client's lifetime; methods that change
+        the repository through this client discard the cached copy.
 
         Args:
-            content: Issue content
-
-        Returns:
-            Criteria text or empty string
-        """
-        criteria_match = re.search(
-            r"\*\*Acceptance Criteria\*\*:\s*(.+?)(?=(?:\*\*|$))",
-            content,
-            re.DOTALL,
-        )
-        return criteria_match.group(1).strip() if criteria_match else ""
-
-    def get_repository_info(self) -> dict[str, Any]:
-        """Get repository information.
+            refresh: Ignore any cached copy and fetch again
 
         Returns:
             Repository data from GitHub API
@@ -825,7 +1250,9 @@ class GitHubClient:
         Raises:
             GitHubError: If request fails
         """
-        return self._request("GET", f"/repos/{self.owner}/{self.repo}")
+        if self._repo_info is None or refresh:
+            self._repo_info = self._request("GET", self._repo_path)
+        return self._repo_info
 
     def update_repository(  # noqa: PLR0913 # All params optional, keyword-only
         self,
@@ -865,9 +1292,10 @@ class GitHubClient:
             has_wiki=has_wiki,
         )
 
+        self._repo_info = None
         return self._request(
             "PATCH",
-            f"/repos/{self.owner}/{self.repo}",
+            self._repo_path,
             json=payload,
         )
 
@@ -896,16 +1324,16 @@ class GitHubClient:
         Returns:
             Payload with only non-None values
         """
-        params = {
-            "description": description,
-            "homepage": homepage,
-            "private": private,
-            "has_issues": has_issues,
-            "has_projects": has_projects,
-            "has_downloads": has_downloads,
-            "has_wiki": has_wiki,
-        }
-        return {k: v for k, v in params.items() if v is not None}
+        fields: tuple[tuple[str, Any], ...] = (
+            ("description", description),
+            ("homepage", homepage),
+            ("private", private),
+            ("has_issues", has_issues),
+            ("has_projects", has_projects),
+            ("has_downloads", has_downloads),
+            ("has_wiki", has_wiki),
+        )
+        return {key: value for key, value in fields if value is not None}
 
     _SAFE_PATH_RE = re.compile(r"^[a-zA-Z0-9_./-]+$")
     _SAFE_BRANCH_RE = re.compile(r"^[a-zA-Z0-9_./-]+$")
@@ -925,7 +1353,7 @@ class GitHubClient:
     def create_or_update_file(
         self,
         path: str,
-        content: str,
+        content: str | bytes,
         message: str,
         branch: str = "main",
     ) -> dict[str, Any]:
@@ -933,7 +1361,9 @@ class GitHubClient:
 
         Args:
             path: File path in repository
-            content: File content (as plain text, will be base64 encoded)
+            content: File content, base64 encoded for upload. Text is
+                encoded as UTF-8 first; bytes (e.g. binary files) are sent
+                without an extra copy
             message: Commit message
             branch: Branch to commit to (default: main)
 
@@ -945,7 +1375,8 @@ class GitHubClient:
         """
         self._validate_file_path(path)
         self._validate_branch_name(branch)
-        encoded_content = base64.b64encode(content.encode()).decode()
+        raw = content.encode() if isinstance(content, str) else content
+        encoded_content = base64.b64encode(raw).decode("ascii")
 
         payload = {
             "message": message,
@@ -955,7 +1386,7 @@ class GitHubClient:
 
         return self._request(
             "PUT",
-            f"/repos/{self.owner}/{self.repo}/contents/{path}",
+            f"{self._repo_path}/contents/{path}",
             json=payload,
         )
 
@@ -978,9 +1409,10 @@ class GitHubClient:
             "names": topics,
         }
 
+        self._repo_info = None
         return self._request(
             "PUT",
-            f"/repos/{self.owner}/{self.repo}/topics",
+            f"{self._repo_path}/topics",
             json=payload,
         )
 
@@ -1001,7 +1433,7 @@ class GitHubClient:
         """
         return self._request(
             "GET",
-            f"/repos/{self.owner}/{self.repo}/issues/{issue_number}",
+            f"{self._repo_path}/issues/{issue_number}",
         )
 
     def list_issues(
@@ -1009,16 +1441,23 @@ class GitHubClient:
         state: Literal["open", "closed", "all"] = "open",
         labels: list[str] | None = None,
         milestone: int | None = None,
+        *,
+        max_concurrency: int = 1,
     ) -> list[dict[str, Any]]:
-        """List issues in the repository.
+        """List issues in the repository, following every result page.
+
+        The first page's ``Link`` header names the last page; the remaining
+        pages are then requested directly rather than by walking ``next``.
 
         Args:
             state: Issue state filter (open, closed, all)
             labels: Filter by labels
             milestone: Filter by milestone ID
+            max_concurrency: Upper bound on page requests in flight; see
+                :meth:`create_issues_bulk`.
 
         Returns:
-            List of issue data from GitHub API
+            List of issue data from GitHub API, in page order
 
         Raises:
             GitHubError: If request fails
@@ -1034,9 +1473,69 @@ class GitHubClient:
         if milestone is not None:
             params["milestone"] = milestone
 
-        result = self._request(
-            "GET",
-            f"/repos/{self.owner}/{self.repo}/issues",
-            params=params,
+        return self._get_all_pages(
+            f"{self._repo_path}/issues", params, max_concurrency=max_concurrency
         )
+
+    def _get_all_pages(
+        self,
+        path: str,
+        params: dict[str, Any],
+        *,
+        max_concurrency: int = 1,
+    ) -> list[dict[str, Any]]:
+        """GET every page of a list endpoint and flatten the results.
+
+        Args:
+            path: API endpoint path (without base URL)
+            params: Query parameters; ``per_page`` defaults to 100
+            max_concurrency: Upper bound on page requests in flight
+
+        Returns:
+            All items, in page order
+
+        Raises:
+            GitHubError: If any page request fails
+        """
+        params = {"per_page": 100, **params}
+        first = self._send("GET", path, params=params)
+        items = self._as_list(self._handle_response(first))
+
+        def fetch_page(page: int) -> list[dict[str, Any]]:
+            result = self._request("GET", path, params={**params, "page": page})
+            return self._as_list(result)
+
+        pages = list(range(2, self._last_page(first) + 1))
+        for page_items in self._run_bulk(fetch_page, pages, max_concurrency):
+            items.extend(page_items)
+        return items
+
+    @staticmethod
+    def _as_list(
+        result: dict[str, Any] | list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Normalize a list endpoint body to a list of items.
+
+        Args:
+            result: Parsed response body
+
+        Returns:
+            The body itself if it is a list, else the body wrapped in one
+        """
         return result if isinstance(result, list) else [result]
+
+    @staticmethod
+    def _last_page(response: httpx.Response) -> int:
+        """Read the last page number from a paginated response.
+
+        Args:
+            response: First-page response from a list endpoint
+
+        Returns:
+            The ``rel="last"`` page number, or 1 if there is a single page
+        """
+        match = _LINK_LAST_RE.search(response.headers.get("Link", ""))
+        if match is None:
+            return 1
+        page = httpx.URL(match.group(1)).params.get("page", "")
+        return int(page) if page.isdigit() else 1
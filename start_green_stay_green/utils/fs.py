@@ -4,7 +4,9 @@ Cross-platform helpers for file and directory operations. The single
 guarded home for marking generated scripts executable: POSIX systems get
 ``chmod(0o755)``, while Windows — where the executable bit does not
 exist and ``Path.chmod`` cannot grant execute permission — is a
-deliberate no-op (#380).
+deliberate no-op (#380). :func:`write_executable` folds the write and
+the mode change into a single open file descriptor; :func:`write_file`
+is the same single-pass write for regular (non-executable) files.
 """
 
 from __future__ import annotations
@@ -60,3 +62,79 @@ def make_executable(path: Path) -> None:
     if is_windows():
         return
     path.chmod(EXECUTABLE_MODE)
+
+
+def _write_all(path: Path, data: bytes, mode: int) -> int:
+    """Create/truncate ``path`` and write ``data`` through one descriptor.
+
+    Args:
+        path: Destination file; its parent directory must exist.
+        data: Encoded payload, written verbatim (``O_BINARY`` on Windows).
+        mode: Permission bits for a newly created file (umask applies).
+
+    Returns:
+        The open file descriptor; the caller must close it.
+
+    Raises:
+        OSError: If the file cannot be opened or written.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, mode)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def write_file(path: Path, content: str | bytes) -> None:
+    r"""Write ``content`` to ``path`` in a single unbuffered pass.
+
+    The payload is encoded once and handed to ``os.write`` directly, with
+    no ``TextIOWrapper``/``BufferedWriter`` layers in between. Bytes are
+    written verbatim, so ``\n`` line endings are preserved on every
+    platform (#386). New files get the default ``0o666`` mode less the
+    umask, as with ``open()``.
+
+    Args:
+        path: Destination file; its parent directory must exist.
+        content: Text content using ``\n`` line endings, or its
+            pre-encoded UTF-8 bytes.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    os.close(_write_all(path, data, 0o666))
+
+
+def write_executable(path: Path, content: str | bytes) -> None:
+    r"""Write ``content`` to ``path`` and mark it executable in one open.
+
+    Equivalent to ``write_text(content, encoding="utf-8", newline="\n")``
+    followed by :func:`make_executable`, but the file is created with
+    :data:`EXECUTABLE_MODE` and written as pre-encoded bytes through a
+    single descriptor. The content is written verbatim (``O_BINARY`` on
+    Windows), so LF line endings survive on every platform (#386). On
+    POSIX ``fchmod`` re-applies the exact mode on the open descriptor,
+    since ``os.open`` only honors it through the umask and leaves the
+    mode of an existing file untouched.
+
+    Args:
+        path: Destination file; its parent directory must exist.
+        content: Text content using ``\n`` line endings. Bytes are taken
+            as already UTF-8 encoded and written without re-encoding.
+
+    Raises:
+        OSError: If the file cannot be written or its mode changed.
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    fd = _write_all(path, data, EXECUTABLE_MODE)
+    try:
+        if not is_windows():
+            os.fchmod(fd, EXECUTABLE_MODE)
+    finally:
+        os.close(fd)
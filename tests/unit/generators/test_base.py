@@ -9,11 +9,15 @@ from unittest.mock import Mock
 
 import pytest
 
+from start_green_stay_green.generators import base
 from start_green_stay_green.generators.base import AIGenerationError
 from start_green_stay_green.generators.base import BaseGenerator
+from start_green_stay_green.generators.base import FileTreeGenerator
 from start_green_stay_green.generators.base import GenerationError
 from start_green_stay_green.generators.base import SUPPORTED_LANGUAGES
 from start_green_stay_green.generators.base import TemplateBasedGenerator
+from start_green_stay_green.generators.base import clear_content_cache
+from start_green_stay_green.generators.base import memoize_on_config
 from start_green_stay_green.generators.base import validate_language
 
 
@@ -358,3 +362,104 @@ class TestSupportedLanguagesExactTuple:
             "kotlin",
             "cpp",
         )
+
+
+class _CountingRenderer:
+    """Minimal generator-like object for memoize_on_config tests."""
+
+    def __init__(self, config: tuple[str, ...]) -> None:
+        self.config = config
+        self.calls = 0
+
+    @memoize_on_config
+    def render(self, suffix: str = "") -> str:
+        self.calls += 1
+        return f"{'-'.join(self.config)}{suffix}"
+
+    @memoize_on_config
+    def other(self) -> str:
+        self.calls += 1
+        return "other"
+
+
+class TestMemoizeOnConfig:
+    """Test the shared per-config content memoizer."""
+
+    def test_renders_once_per_config_across_instances(self) -> None:
+        """Test equal configs share one render across instances."""
+        clear_content_cache()
+        first = _CountingRenderer(("a", "b"))
+        second = _CountingRenderer(("a", "b"))
+
+        assert first.render() == second.render() == "a-b"
+        assert (first.calls, second.calls) == (1, 0)
+
+    def test_keys_on_method_and_arguments(self) -> None:
+        """Test distinct methods and arguments render separately."""
+        clear_content_cache()
+        renderer = _CountingRenderer(("a",))
+
+        assert renderer.render() == "a"
+        assert renderer.render("!") == "a!"
+        assert renderer.other() == "other"
+        assert renderer.calls == 3
+
+    def test_cache_is_bounded(self) -> None:
+        """Test the cache is cleared once it reaches its bound."""
+        clear_content_cache()
+        for index in range(base._CONTENT_CACHE_MAX + 1):
+            _CountingRenderer((str(index),)).render()
+
+        assert len(base._CONTENT_CACHE) == 1
+
+    def test_clear_content_cache_forces_fresh_render(self) -> None:
+        """Test clearing the cache makes the next call render again."""
+        clear_content_cache()
+        renderer = _CountingRenderer(("a",))
+        renderer.render()
+
+        clear_content_cache()
+        renderer.render()
+
+        assert renderer.calls == 2
+
+
+class _StaticTree(FileTreeGenerator):
+    """Minimal file-tree generator writing one fixed file."""
+
+    def generate(self) -> dict[str, Any]:
+        return self._write_files([("pkg/a.txt", "a\n")])
+
+
+class TestFileTreeGenerator:
+    """Test the shared directory creation and file writing."""
+
+    def test_init_creates_output_dir(self, tmp_path: Path) -> None:
+        """Test the output directory exists after construction."""
+        _StaticTree(tmp_path / "out")
+
+        assert (tmp_path / "out").is_dir()
+
+    def test_write_files_writes_lf_utf8(self, tmp_path: Path) -> None:
+        """Test batched writes keep LF endings and UTF-8 content."""
+        files = _StaticTree(tmp_path)._write_files([("pkg/é.txt", "é\n")])
+
+        assert files["pkg/é.txt"].read_bytes() == "é\n".encode()
+
+    def test_write_file_delegates_to_file_writer(self, tmp_path: Path) -> None:
+        """Test a configured FileWriter handles the write."""
+        writer = Mock()
+        generator = _StaticTree(tmp_path, file_writer=writer)
+
+        files = generator.generate()
+
+        writer.write_file.assert_called_once_with(tmp_path / "pkg" / "a.txt", "a\n")
+        assert not files["pkg/a.txt"].exists()
+
+    def test_write_file_wraps_os_error(self, tmp_path: Path) -> None:
+        """Test an unwritable destination surfaces as GenerationError."""
+        generator = _StaticTree(tmp_path)
+        (tmp_path / "blocker").mkdir()
+
+        with pytest.raises(GenerationError, match=r"Failed to write blocker"):
+            generator._write_file(tmp_path / "blocker", "x\n")
@@ -7,6 +7,7 @@ and maintain backward compatibility without one.
 from pathlib import Path
 
 import pytest
+from pytest_mock import MockerFixture
 from rich.console import Console
 
 from start_green_stay_green.generators.dependencies import DependenciesGenerator
@@ -209,6 +210,30 @@ class TestScriptsGeneratorWithFileWriter:
         # Other scripts should be created
         assert quiet_writer.created >= 1
 
+    def test_pre_encoded_scripts_written_as_text(
+        self,
+        tmp_path: Path,
+        quiet_writer: FileWriter,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test pre-encoded Rust scripts reach the FileWriter as str."""
+        config = ScriptConfig(language="rust", package_name="my_crate")
+        scripts_dir = tmp_path / "scripts"
+        scripts_dir.mkdir()
+
+        generator = ScriptsGenerator(
+            output_dir=scripts_dir,
+            config=config,
+            file_writer=quiet_writer,
+        )
+        write_spy = mocker.spy(quiet_writer, "write_script")
+        generator.generate()
+
+        assert all(isinstance(call.args[1], str) for call in write_spy.call_args_list)
+        assert (scripts_dir / "test.sh").read_text(
+            encoding="utf-8"
+        ) == generator._rust_test_script()
+
 
 class TestMixedScenario:
     """Test mixed scenario: some files exist, some don't."""
@@ -2551,6 +2551,28 @@ class TestPythonMutationScript:
             # Package name should appear in path context
             assert "test_package" in content
 
+    def test_templated_scripts_render_without_placeholder_residue(self) -> None:
+        """Test Jinja2-rendered scripts keep bash syntax and drop placeholders.
+
+        The package-name scripts are precompiled templates with custom
+        delimiters; bash ``${...}`` expansions must pass through verbatim.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = ScriptConfig(
+                language="python",
+                package_name="test_package",
+            )
+            generator = ScriptsGenerator(Path(tmpdir), config)
+            scripts = generator.generate()
+
+            for name in ("test.sh", "typecheck.sh", "coverage.sh", "mutation.sh"):
+                content = scripts[name].read_text()
+                assert "<<%" not in content
+                assert "%>>" not in content
+                assert "{{" not in content
+                assert '"${BASH_SOURCE[0]}"' in content
+                assert "test_package" in content
+
     def test_mutation_script_has_comprehensive_help_text(self) -> None:
         """Test mutation.sh has --help option with comprehensive documentation.
 
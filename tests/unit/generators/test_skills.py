@@ -1,5 +1,6 @@
 """Unit tests for SkillsGenerator."""
 
+import asyncio
 from pathlib import Path
 from unittest.mock import create_autospec
 
@@ -9,6 +10,7 @@ from pytest_mock import MockerFixture
 from start_green_stay_green.ai.orchestrator import AIOrchestrator
 from start_green_stay_green.ai.tuner import TuningResult
 from start_green_stay_green.generators import skills as skills_mod
+from start_green_stay_green.generators.skills import DEFAULT_MAX_CONCURRENCY
 from start_green_stay_green.generators.skills import REFERENCE_SKILLS_DIR
 from start_green_stay_green.generators.skills import REQUIRED_SKILLS
 from start_green_stay_green.generators.skills import SkillGenerationResult
@@ -185,6 +187,103 @@ class TestSkillsGeneratorLoadSkill:
         with pytest.raises(FileNotFoundError, match="Skill file not found"):
             generator._load_skill("nonexistent")
 
+    def test_load_skill_does_not_stat_before_reading(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test _load_skill reads directly without an exists() pre-check."""
+        orchestrator = create_autospec(AIOrchestrator)
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        _create_skill(skills_dir, "vibe", "# Vibe Skill")
+        skills_mod._SKILL_CONTENT_CACHE.clear()
+        exists_spy = mocker.spy(Path, "exists")
+
+        content = SkillsGenerator(orchestrator, reference_dir=skills_dir)._load_skill(
+            "vibe"
+        )
+
+        assert content == "# Vibe Skill"
+        exists_spy.assert_not_called()
+
+    def test_load_all_skills_reads_each_skill_once(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test _load_all_skills caches contents across repeated calls."""
+        orchestrator = create_autospec(AIOrchestrator)
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        for skill in REQUIRED_SKILLS:
+            _create_skill(skills_dir, skill, f"# {skill}")
+
+        generator = SkillsGenerator(orchestrator, reference_dir=skills_dir)
+        load_spy = mocker.spy(generator, "_load_skill")
+
+        first = generator._load_all_skills()
+        second = generator._load_all_skills()
+
+        assert first == {skill: f"# {skill}" for skill in REQUIRED_SKILLS}
+        assert second == first
+        assert load_spy.call_count == len(REQUIRED_SKILLS)
+
+    def test_reference_reads_shared_across_instances(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test a second generator reuses the memoized reference read."""
+        orchestrator = create_autospec(AIOrchestrator)
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        _create_skill(skills_dir, "vibe", "# Vibe Skill")
+        skills_mod._SKILL_CONTENT_CACHE.clear()
+        read_spy = mocker.spy(Path, "read_text")
+
+        SkillsGenerator(orchestrator, reference_dir=skills_dir)._load_skill("vibe")
+        content = SkillsGenerator(orchestrator, reference_dir=skills_dir)._load_skill(
+            "vibe"
+        )
+
+        assert content == "# Vibe Skill"
+        assert read_spy.call_count == 1
+
+    def test_edited_reference_skill_is_reread(self, tmp_path: Path) -> None:
+        """Test a SKILL.md edited between runs is seen by a new generator."""
+        orchestrator = create_autospec(AIOrchestrator)
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        _create_skill(skills_dir, "vibe", "# Vibe Skill")
+        skills_mod._SKILL_CONTENT_CACHE.clear()
+        SkillsGenerator(orchestrator, reference_dir=skills_dir)._load_skill("vibe")
+
+        _create_skill(skills_dir, "vibe", "# Vibe Skill, revised")
+
+        content = SkillsGenerator(orchestrator, reference_dir=skills_dir)._load_skill(
+            "vibe"
+        )
+        assert content == "# Vibe Skill, revised"
+
+    def test_reference_read_decodes_utf8(self, tmp_path: Path) -> None:
+        """Test the reference read decodes multi-byte UTF-8 content intact."""
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text("# Skill ✓ — naïve\n", encoding="utf-8")
+        skills_mod._SKILL_CONTENT_CACHE.clear()
+
+        assert skills_mod._read_reference_skill(skill_file) == "# Skill ✓ — naïve\n"
+
+    def test_reference_read_handles_empty_file(self, tmp_path: Path) -> None:
+        """Test an empty SKILL.md reads as an empty string."""
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_bytes(b"")
+        skills_mod._SKILL_CONTENT_CACHE.clear()
+
+        assert skills_mod._read_reference_skill(skill_file) == ""
+
+    def test_reference_read_translates_crlf(self, tmp_path: Path) -> None:
+        """Test a CRLF SKILL.md reads with plain newlines."""
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_bytes(b"# Skill\r\n\r\nBody\r\n")
+        skills_mod._SKILL_CONTENT_CACHE.clear()
+
+        assert skills_mod._read_reference_skill(skill_file) == "# Skill\n\nBody\n"
+
 
 class TestSkillsGeneratorTuneSkill:
     """Test SkillsGenerator tune_skill method."""
@@ -434,7 +533,7 @@ class TestSkillsGeneratorLoggerBehavior:
     def test_load_skill_logs_skill_name(
         self, mocker: MockerFixture, tmp_path: Path
     ) -> None:
-        """Test logger.info called with skill name when loading."""
+        """Test logger.debug called with skill name when loading."""
         skills_dir = tmp_path / "skills"
         skills_dir.mkdir()
         _create_skill(skills_dir, "vibe", "# Vibe Skill")
@@ -446,13 +545,13 @@ class TestSkillsGeneratorLoggerBehavior:
         content = generator._load_skill("vibe")
 
         assert content == "# Vibe Skill"
-        mock_logger.info.assert_any_call("Loading skill: %s", "vibe")
+        mock_logger.debug.assert_any_call("Loading skill: %s", "vibe")
 
     @pytest.mark.asyncio
     async def test_tune_skill_without_tuner_logs_copy_message(
         self, mocker: MockerFixture, tmp_path: Path
     ) -> None:
-        """Test logger.info called when copying without AI tuning."""
+        """Test logger.debug called when copying without AI tuning."""
         skills_dir = tmp_path / "skills"
         skills_dir.mkdir()
         for skill in REQUIRED_SKILLS:
@@ -472,13 +571,13 @@ class TestSkillsGeneratorLoggerBehavior:
         )
 
         assert not result.tuned
-        mock_logger.info.assert_any_call("Copying skill %s (no AI tuning)", "vibe")
+        mock_logger.debug.assert_any_call("Copying skill %s (no AI tuning)", "vibe")
 
     @pytest.mark.asyncio
     async def test_tune_skill_with_tuner_logs_tuning_message(
         self, mocker: MockerFixture, tmp_path: Path
     ) -> None:
-        """Test logger.info called when tuning with AI."""
+        """Test logger.debug called when tuning with AI."""
         skills_dir = tmp_path / "skills"
         skills_dir.mkdir()
         for skill in REQUIRED_SKILLS:
@@ -502,13 +601,13 @@ class TestSkillsGeneratorLoggerBehavior:
             target_context="Target Context",
         )
 
-        mock_logger.info.assert_any_call("Tuning skill %s for target context", "vibe")
+        mock_logger.debug.assert_any_call("Tuning skill %s for target context", "vibe")
 
     @pytest.mark.asyncio
     async def test_generate_all_skills_logs_completion(
         self, mocker: MockerFixture, tmp_path: Path
     ) -> None:
-        """Test logger.info called with skill name and change count."""
+        """Test one summary line lists every skill with its change count."""
         skills_dir = tmp_path / "skills"
         skills_dir.mkdir()
         # Create all required skills
@@ -529,10 +628,29 @@ class TestSkillsGeneratorLoggerBehavior:
 
         await generator.generate_all_skills(target_context="Target")
 
-        # Verify logger called for each skill with change count
-        log_calls = [str(call) for call in mock_logger.info.call_args_list]
-        vibe_log = [call for call in log_calls if "vibe" in call and "changes" in call]
-        assert vibe_log
+        mock_logger.info.assert_called_once_with(
+            "Generated %d skills: %s",
+            len(REQUIRED_SKILLS),
+            ", ".join(f"{skill}(3)" for skill in REQUIRED_SKILLS),
+        )
+
+    @pytest.mark.asyncio
+    async def test_generate_all_skills_skips_summary_when_info_disabled(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test no summary record is emitted when INFO is disabled."""
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        for skill in REQUIRED_SKILLS:
+            _create_skill(skills_dir, skill, f"# {skill}")
+
+        generator = SkillsGenerator(orchestrator=None, reference_dir=skills_dir)
+        mock_logger = mocker.patch("start_green_stay_green.generators.skills.logger")
+        mock_logger.isEnabledFor.return_value = False
+
+        await generator.generate_all_skills(target_context="Target")
+
+        mock_logger.info.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_tune_skill_without_orchestrator_returns_exact_content(
@@ -691,6 +809,30 @@ class TestSkillsGeneratorErrorMessages:
 
         assert str(exc.value) == "Missing required skills: testing, vibe"
 
+    def test_required_skill_check_stats_only_present_skill_files(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test directory membership comes from one listing, not per-skill stats.
+
+        Only the SKILL.md of skills whose directory is present is probed;
+        absent directories are caught by the set lookup alone.
+        """
+        orchestrator = create_autospec(AIOrchestrator)
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        for skill in REQUIRED_SKILLS:
+            if skill != "vibe":
+                _create_skill(skills_dir, skill, f"# {skill}")
+        generator = SkillsGenerator(orchestrator, reference_dir=skills_dir)
+        exists_spy = mocker.spy(Path, "exists")
+        is_dir_spy = mocker.spy(Path, "is_dir")
+
+        with pytest.raises(ValueError, match="Missing required skills: vibe"):
+            generator._check_required_skills()
+
+        assert exists_spy.call_count == len(REQUIRED_SKILLS) - 1
+        is_dir_spy.assert_not_called()
+
     def test_missing_when_dir_present_but_skill_md_absent(self, tmp_path: Path) -> None:
         """Test a skill dir without SKILL.md still counts as missing (or vs and)."""
         orchestrator = create_autospec(AIOrchestrator)
@@ -784,4 +926,59 @@ class TestSkillsGeneratorTuneCallArgs:
 
         await generator.generate_all_skills(target_context="Target")
 
-        mock_logger.info.assert_any_call("Generated skill %s (%d changes)", "vibe", 3)
+        fmt, count, summary = mock_logger.info.call_args.args
+        assert fmt == "Generated %d skills: %s"
+        assert count == len(REQUIRED_SKILLS)
+        assert "vibe(3)" in summary.split(", ")
+
+
+class TestSkillsGeneratorParallelism:
+    """Verify generate_all_skills fans out tunings concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_generate_all_skills_respects_semaphore(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Tunings overlap, but never beyond max_concurrency at once."""
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        for skill in REQUIRED_SKILLS:
+            _create_skill(skills_dir, skill, f"# {skill}")
+
+        in_flight = 0
+        peak = 0
+
+        async def staged_tune(*_args: object, **_kwargs: object) -> object:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return mocker.Mock(content="# t", changes=[], dry_run=False)
+
+        generator = SkillsGenerator(
+            mocker.Mock(),
+            reference_dir=skills_dir,
+            max_concurrency=3,
+        )
+        generator.tuner = mocker.Mock()
+        generator.tuner.tune = staged_tune  # type: ignore[method-assign]
+
+        results = await generator.generate_all_skills("ctx")
+
+        assert list(results) == REQUIRED_SKILLS
+        assert peak == 3
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_max_concurrency_below_one_rejected(max_concurrency: int) -> None:
+    """A semaphore of zero would hang the fan-out; reject it up front."""
+    with pytest.raises(
+        ValueError, match=f"^max_concurrency must be at least 1, got {max_concurrency}$"
+    ):
+        SkillsGenerator(None, max_concurrency=max_concurrency)
+
+
+def test_default_max_concurrency_is_six() -> None:
+    """Default fan-out width stays at six concurrent tunings."""
+    assert DEFAULT_MAX_CONCURRENCY == 6
@@ -1,13 +1,19 @@
 """Unit tests for Structure Generator."""
 
 import ast
+import copy
+import dataclasses
 from pathlib import Path
+import pickle
+import shutil
 import tempfile
 
 from defusedxml import ElementTree as DefusedElementTree
 import pytest
 
 from start_green_stay_green.generators.base import SUPPORTED_LANGUAGES
+from start_green_stay_green.generators.base import GenerationError
+from start_green_stay_green.generators import structure as structure_mod
 from start_green_stay_green.generators.structure import StructureConfig
 from start_green_stay_green.generators.structure import StructureGenerator
 from start_green_stay_green.utils.cpp import tizen_app_id
@@ -235,6 +241,208 @@ class TestStructureGeneration:
                     # Should compile without SyntaxError
                     ast.parse(content)
 
+    def test_python_content_memoized_across_generators(self, tmp_path: Path) -> None:
+        """Test same-named projects share one rendered __init__/main body."""
+        config = StructureConfig(
+            project_name="demo-app",
+            language="python",
+            package_name="demo_app",
+        )
+        first = StructureGenerator(tmp_path / "a", config)
+        second = StructureGenerator(tmp_path / "b", config)
+
+        assert first._python_init_py() is second._python_init_py()
+        assert first._python_main_py() is second._python_main_py()
+        assert first._python_init_py().startswith('"""Demo App package."""')
+        assert 'print("Hello from demo-app!")' in first._python_main_py()
+
+    def test_language_content_memoized_per_config(self, tmp_path: Path) -> None:
+        """Test content methods share one render per config across instances."""
+        config = StructureConfig(
+            project_name="demo-app",
+            language="go",
+            package_name="demo_app",
+        )
+        other = StructureConfig(
+            project_name="other-app",
+            language="go",
+            package_name="other_app",
+        )
+        StructureGenerator.clear_cache()
+        first = StructureGenerator(tmp_path / "a", config)
+        second = StructureGenerator(tmp_path / "b", config)
+        third = StructureGenerator(tmp_path / "c", other)
+
+        assert first._go_main_go() is second._go_main_go()
+        assert "other-app" in third._go_main_go()
+        assert "demo-app" in first._go_main_go()
+
+    def test_memoized_content_keys_on_extra_arguments(self, tmp_path: Path) -> None:
+        """Test methods taking arguments cache one render per argument."""
+        config = StructureConfig(
+            project_name="demo-app",
+            language="swift",
+            package_name="demo_app",
+        )
+        generator = StructureGenerator(tmp_path, config)
+
+        assert "struct FooApp" in generator._swift_app_swift("Foo")
+        assert "struct BarApp" in generator._swift_app_swift("Bar")
+
+    def test_generate_creates_each_directory_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test one generate() issues a single mkdir per directory."""
+        config = StructureConfig(
+            project_name="demo-app",
+            language="java",
+            package_name="demo_app",
+        )
+        generator = StructureGenerator(tmp_path, config)
+        # Populate the tree first so mkdir never recurses into parents.
+        generator.generate()
+        made: list[Path] = []
+        real_mkdir = Path.mkdir
+
+        def recording_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+            made.append(self)
+            real_mkdir(self, *args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(Path, "mkdir", recording_mkdir)
+
+        generator.generate()
+
+        assert made
+        assert len(made) == len(set(made))
+
+    @pytest.mark.parametrize("language", ["python", "go", "java", "typescript"])
+    def test_regenerate_after_output_removed(
+        self, tmp_path: Path, language: str
+    ) -> None:
+        """Test generate() recreates directories removed since the last run."""
+        config = StructureConfig(
+            project_name="demo-app",
+            language=language,
+            package_name="demo_app",
+        )
+        output_dir = tmp_path / "out"
+        generator = StructureGenerator(output_dir, config)
+        generator.generate()
+        shutil.rmtree(output_dir)
+
+        files = generator.generate()
+
+        assert all(path.is_file() for path in files.values())
+
+    def test_python_content_memoized_per_config(self, tmp_path: Path) -> None:
+        """Test Python starter files share one render per config."""
+        config = StructureConfig(
+            project_name="demo-app",
+            language="python",
+            package_name="demo_app",
+        )
+        StructureGenerator.clear_cache()
+        first = StructureGenerator(tmp_path / "a", config)
+        second = StructureGenerator(tmp_path / "b", config)
+
+        assert second._python_init_py() is first._python_init_py()
+        assert second._python_main_py() is first._python_main_py()
+        assert '"""Demo App package."""' in first._python_init_py()
+
+    @pytest.mark.parametrize("language", ["typescript", "go", "rust", "csharp"])
+    def test_templated_content_has_no_placeholder_residue(
+        self, tmp_path: Path, language: str
+    ) -> None:
+        """Test string.Template bodies substitute every placeholder."""
+        config = StructureConfig(
+            project_name="demo-app",
+            language=language,
+            package_name="demo_app",
+        )
+        files = StructureGenerator(tmp_path, config).generate()
+
+        for path in files.values():
+            assert "$" not in path.read_text(encoding="utf-8")
+
+    def test_clear_cache_forces_fresh_render(self, tmp_path: Path) -> None:
+        """Test clear_cache drops memoized content so it is re-rendered."""
+        config = StructureConfig(
+            project_name="demo-app",
+            language="rust",
+            package_name="demo_app",
+        )
+        generator = StructureGenerator(tmp_path, config)
+        before = generator._rust_cargo_toml()
+
+        StructureGenerator.clear_cache()
+        after = generator._rust_cargo_toml()
+
+        assert after == before
+        assert after is not before
+
+    def test_write_files_creates_each_parent_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test batched writes probe each distinct parent directory once."""
+        config = StructureConfig(
+            project_name="demo-app",
+            language="python",
+            package_name="demo_app",
+        )
+        generator = StructureGenerator(tmp_path, config)
+        made: list[Path] = []
+        real_mkdir = Path.mkdir
+
+        def recording_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+            made.append(self)
+            real_mkdir(self, *args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(Path, "mkdir", recording_mkdir)
+
+        files = generator._write_files(
+            (("pkg/a.py", "a\n"), ("pkg/b.py", "b\n"), ("top.txt", "t\n"))
+        )
+
+        # The output directory itself was created in __init__, so only
+        # the new "pkg" parent reaches mkdir.
+        assert made == [tmp_path / "pkg"]
+        assert list(files) == ["pkg/a.py", "pkg/b.py", "top.txt"]
+        assert files["pkg/b.py"].read_text() == "b\n"
+
+    def test_builder_table_covers_every_supported_language(self) -> None:
+        """Test the dispatch table maps each language to a real builder."""
+        assert set(structure_mod._STRUCTURE_BUILDERS) == set(SUPPORTED_LANGUAGES)
+        for name in structure_mod._STRUCTURE_BUILDERS.values():
+            assert callable(getattr(StructureGenerator, name))
+
+    def test_write_file_wraps_os_error(self, tmp_path: Path) -> None:
+        """Test an unwritable destination surfaces as GenerationError."""
+        config = StructureConfig(
+            project_name="demo-app",
+            language="python",
+            package_name="demo_app",
+        )
+        generator = StructureGenerator(tmp_path, config)
+        blocker = tmp_path / "main.py"
+        blocker.mkdir()
+
+        with pytest.raises(GenerationError, match=r"Failed to write main\.py"):
+            generator._write_file(blocker, "print()\n")
+
+    def test_write_file_round_trips_large_content(self, tmp_path: Path) -> None:
+        """Test content larger than the write buffer is written intact."""
+        config = StructureConfig(
+            project_name="demo-app",
+            language="python",
+            package_name="demo_app",
+        )
+        generator = StructureGenerator(tmp_path, config)
+        content = "x = 1\n" * 40_000
+
+        path = generator._write_file(tmp_path / "big.py", content)
+
+        assert path.read_text(encoding="utf-8") == content
+
 
 class TestStructureConfigValidation:
     """Test StructureConfig validation."""
@@ -266,6 +474,79 @@ class TestStructureConfigValidation:
                 package_name="",  # Empty string
             )
 
+    def test_template_vars_cached_and_read_only(self) -> None:
+        """Test equal configs share one read-only template_vars mapping."""
+        config = StructureConfig(
+            project_name="demo-app",
+            language="go",
+            package_name="demo_app",
+        )
+        twin = StructureConfig(
+            project_name="demo-app",
+            language="rust",
+            package_name="demo_app",
+        )
+
+        template_vars = config.template_vars
+
+        assert twin.template_vars is template_vars
+        assert dict(template_vars) == {
+            "project_name": "demo-app",
+            "package_name": "demo_app",
+            "display_name": "Demo App",
+        }
+        with pytest.raises(TypeError):
+            template_vars["project_name"] = "other"  # type: ignore[index]
+
+    def test_config_round_trips_through_pickle_and_asdict(self) -> None:
+        """Test the config pickles, deep-copies and converts with asdict."""
+        config = StructureConfig(
+            project_name="demo-app", language="go", package_name="demo_app"
+        )
+
+        restored = pickle.loads(pickle.dumps(config))  # noqa: S301
+
+        assert restored == config
+        assert restored.template_vars == config.template_vars
+        assert copy.deepcopy(config) == config
+        assert dataclasses.asdict(config) == {
+            "project_name": "demo-app",
+            "language": "go",
+            "package_name": "demo_app",
+        }
+
+    def test_template_vars_do_not_affect_equality(self) -> None:
+        """Test caching template_vars leaves config equality and hash intact."""
+        first = StructureConfig(
+            project_name="demo-app", language="go", package_name="demo_app"
+        )
+        second = StructureConfig(
+            project_name="demo-app", language="go", package_name="demo_app"
+        )
+
+        _ = first.template_vars
+
+        assert first == second
+        assert hash(first) == hash(second)
+
+    def test_config_is_slotted(self) -> None:
+        """Test instances carry no __dict__ and reject new attributes."""
+        config = StructureConfig(
+            project_name="demo-app", language="go", package_name="demo_app"
+        )
+
+        assert not hasattr(config, "__dict__")
+        with pytest.raises((AttributeError, TypeError)):
+            config.extra = "x"  # type: ignore[attr-defined]
+
+    def test_template_vars_excluded_from_repr(self) -> None:
+        """Test the derived mapping does not leak into the repr."""
+        config = StructureConfig(
+            project_name="demo-app", language="go", package_name="demo_app"
+        )
+
+        assert "template_vars" not in repr(config)
+
 
 class TestUnsupportedLanguage:
     """Test error handling for unsupported languages."""
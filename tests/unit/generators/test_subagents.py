@@ -13,7 +13,9 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
+import os
 from pathlib import Path
+import re
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
@@ -113,6 +115,21 @@ def test_subagent_generation_result_frozen() -> None:
         result.agent_name = "new-name"  # type: ignore[misc]
 
 
+def test_subagent_generation_result_slotted() -> None:
+    """Test SubagentGenerationResult has no __dict__ but a mutable changes list."""
+    result = SubagentGenerationResult(
+        agent_name="test",
+        content="content",
+        tuned=True,
+        changes=[],
+    )
+
+    result.changes.append("still mutable")
+
+    assert not hasattr(result, "__dict__")
+    assert result.changes == ["still mutable"]
+
+
 # Test Initialization and Validation
 
 
@@ -284,6 +301,125 @@ def test_check_required_agents_all_present(
     generator._check_required_agents()
 
 
+def test_check_required_agents_preloads_content(
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    """Validation reads every agent once; later loads are cache hits."""
+    for source_file in REQUIRED_AGENTS.values():
+        (tmp_path / source_file).write_text(SAMPLE_AGENT_CONTENT)
+    generator = _make_generator_no_validate(mocker, tmp_path)
+    read_spy = mocker.spy(Path, "read_text")
+
+    generator._check_required_agents()
+    contents = [generator._load_agent_content(name) for name in REQUIRED_AGENTS]
+
+    assert contents == [SAMPLE_AGENT_CONTENT] * len(REQUIRED_AGENTS)
+    assert read_spy.call_count == len(REQUIRED_AGENTS)
+
+
+def test_check_required_agents_lists_every_missing_agent_in_order(
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    """Missing files are aggregated in REQUIRED_AGENTS order."""
+    present = next(iter(REQUIRED_AGENTS.values()))
+    (tmp_path / present).write_text(SAMPLE_AGENT_CONTENT)
+    generator = _make_generator_no_validate(mocker, tmp_path)
+
+    with pytest.raises(FileNotFoundError) as exc:
+        generator._check_required_agents()
+
+    expected = ", ".join(
+        f"{name} (source: {source})"
+        for name, source in REQUIRED_AGENTS.items()
+        if source != present
+    )
+    assert str(exc.value) == f"Missing required agent files: {expected}"
+
+
+def test_check_required_agents_reports_only_missing_as_not_found(
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    """A missing file wins over unreadable ones and is FileNotFoundError."""
+    names = list(REQUIRED_AGENTS)
+    for source_file in REQUIRED_AGENTS.values():
+        (tmp_path / source_file).write_text(SAMPLE_AGENT_CONTENT)
+    (tmp_path / REQUIRED_AGENTS[names[0]]).write_bytes(b"\xff\xfe\x00bad")
+    (tmp_path / REQUIRED_AGENTS[names[2]]).unlink()
+    generator = _make_generator_no_validate(mocker, tmp_path)
+
+    with pytest.raises(FileNotFoundError) as exc:
+        generator._check_required_agents()
+
+    assert str(exc.value) == (
+        f"Missing required agent files: {names[2]} "
+        f"(source: {REQUIRED_AGENTS[names[2]]})"
+    )
+
+
+def test_check_required_agents_undecodable_file_raises_value_error(
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    """Undecodable and unreadable files are aggregated, chained to the cause."""
+    names = list(REQUIRED_AGENTS)
+    for source_file in REQUIRED_AGENTS.values():
+        (tmp_path / source_file).write_text(SAMPLE_AGENT_CONTENT)
+    (tmp_path / REQUIRED_AGENTS[names[0]]).write_bytes(b"\xff\xfe\x00bad")
+    directory = tmp_path / REQUIRED_AGENTS[names[1]]
+    directory.unlink()
+    directory.mkdir()
+    generator = _make_generator_no_validate(mocker, tmp_path)
+
+    with pytest.raises(ValueError, match="Unreadable") as exc:
+        generator._check_required_agents()
+
+    assert not isinstance(exc.value, FileNotFoundError)
+    assert isinstance(exc.value.__cause__, UnicodeDecodeError)
+    assert str(exc.value) == (
+        f"Unreadable required agent files: {names[0]} "
+        f"(source: {REQUIRED_AGENTS[names[0]]}: UnicodeDecodeError), "
+        f"{names[1]} (source: {REQUIRED_AGENTS[names[1]]}: IsADirectoryError)"
+    )
+
+
+def test_check_required_agents_permission_error_keeps_os_error(
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    """A read failure surfaces as OSError chained from the original error."""
+    for source_file in REQUIRED_AGENTS.values():
+        (tmp_path / source_file).write_text(SAMPLE_AGENT_CONTENT)
+    generator = _make_generator_no_validate(mocker, tmp_path)
+    denied = PermissionError("denied")
+    mocker.patch.object(Path, "read_text", side_effect=denied)
+
+    with pytest.raises(OSError, match="Unreadable") as exc:
+        generator._check_required_agents()
+
+    assert not isinstance(exc.value, FileNotFoundError)
+    assert exc.value.__cause__ is denied
+
+
+def test_constructor_reads_every_agent_eagerly(
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    """Construction reads each reference agent once, up front."""
+    for source_file in REQUIRED_AGENTS.values():
+        (tmp_path / source_file).write_text(SAMPLE_AGENT_CONTENT)
+    subagents_mod._AGENT_CONTENT_CACHE.clear()
+    mocker.patch("start_green_stay_green.ai.tuner.ContentTuner")
+    read_spy = mocker.spy(Path, "read_text")
+
+    SubagentsGenerator(mocker.Mock(), reference_dir=tmp_path)
+
+    read = sorted(call.args[0].name for call in read_spy.call_args_list)
+    assert read == sorted(REQUIRED_AGENTS.values())
+
+
 # Test Loading and Parsing
 
 
@@ -311,6 +447,70 @@ def test_load_agent_content(
     assert content == SAMPLE_AGENT_CONTENT
 
 
+def test_load_agent_content_reuses_unchanged_file(
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    """An unchanged reference file is served from cache, not re-read."""
+    generator = _make_generator_no_validate(mocker, tmp_path)
+    (tmp_path / "chief-architect.md").write_text(SAMPLE_AGENT_CONTENT)
+    read_spy = mocker.spy(Path, "read_text")
+
+    first = generator._load_agent_content("chief-architect")
+    second = SubagentsGenerator(
+        mocker.Mock(), reference_dir=tmp_path
+    )._load_agent_content("chief-architect")
+
+    assert first == second == SAMPLE_AGENT_CONTENT
+    assert read_spy.call_count == 1
+
+
+def test_load_agent_content_rereads_modified_file(
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    """A reference file whose mtime changes is read again."""
+    generator = _make_generator_no_validate(mocker, tmp_path)
+    agent_file = tmp_path / "chief-architect.md"
+    agent_file.write_text(SAMPLE_AGENT_CONTENT)
+    generator._load_agent_content("chief-architect")
+
+    agent_file.write_text("---\nname: edited\n---\nbody")
+    stat = agent_file.stat()
+    os.utime(agent_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert generator._load_agent_content("chief-architect") == (
+        "---\nname: edited\n---\nbody"
+    )
+
+
+def test_load_agent_parts_parses_once_per_content(
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    """Unchanged content reuses the cached split; edited content re-parses."""
+    generator = _make_generator_no_validate(mocker, tmp_path)
+    agent_file = tmp_path / "chief-architect.md"
+    agent_file.write_text(SAMPLE_AGENT_CONTENT)
+    parse_spy = mocker.spy(generator, "_parse_frontmatter")
+
+    first = generator._load_agent_parts("chief-architect")
+    second = generator._load_agent_parts("chief-architect")
+
+    assert first == second == split_frontmatter(SAMPLE_AGENT_CONTENT)
+    assert parse_spy.call_count == 1
+
+    agent_file.write_text("---\nname: edited\n---\nbody")
+    stat = agent_file.stat()
+    os.utime(agent_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert generator._load_agent_parts("chief-architect") == (
+        "---\nname: edited\n---",
+        "body",
+    )
+    assert parse_spy.call_count == 2
+
+
 def test_parse_frontmatter_valid(
     mocker: MockerFixture,
 ) -> None:
@@ -392,8 +592,7 @@ async def test_tune_agent_body(
     generator.tuner = mock_tuner
 
     body = "# Agent Body\n\n## Identity\nOriginal content"
-    result = await generator._tune_agent_body(
-        "chief-architect",
+    tuned_body, changes = await generator._tune_agent_body(
         body,
         "Python web application",
     )
@@ -408,10 +607,8 @@ async def test_tune_agent_body(
     assert "## Identity" in call_args[1]["preserve_sections"]
 
     # Verify result
-    assert result.agent_name == "chief-architect"
-    assert result.content == "# Tuned Content"
-    assert result.tuned
-    assert result.changes == ["Updated scope", "Fixed examples"]
+    assert tuned_body == "# Tuned Content"
+    assert changes == ["Updated scope", "Fixed examples"]
 
 
 # Test Agent Generation
@@ -911,6 +1108,36 @@ def test_split_frontmatter_returns_exact_parts() -> None:
     assert body.startswith("\n# Test Agent")
 
 
+# The regex split_frontmatter replaced; kept here as the behavioral oracle.
+_REFERENCE_FRONTMATTER_RE = re.compile(r"^(---\n.*?\n---)\n(.*)$", re.DOTALL)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        SAMPLE_AGENT_CONTENT,
+        "---\n\n---\nbody",
+        "---\na: 1\n---\n",
+        "---\na: 1\n---\nbody\n---\nmore\n",
+        "---\na: 1\n---\n---\nb: 2\n---\nbody",
+        "---\na: 1\n----\nx\n---\nbody",
+        "---\n---\nbody",
+        "---\na: 1\n---",
+        "--\na: 1\n---\nbody",
+        "\n---\na: 1\n---\nbody",
+        "",
+    ],
+)
+def test_split_frontmatter_matches_reference_regex(content: str) -> None:
+    """The substring scan agrees with the original regex on edge cases."""
+    match = _REFERENCE_FRONTMATTER_RE.match(content)
+    if match is None:
+        with pytest.raises(ValueError, match="missing YAML frontmatter"):
+            split_frontmatter(content)
+    else:
+        assert split_frontmatter(content) == (match.group(1), match.group(2))
+
+
 def test_split_frontmatter_missing_message_exact() -> None:
     """Missing frontmatter raises ValueError with the exact message."""
     with pytest.raises(ValueError, match="Agent content missing YAML") as exc:
@@ -956,6 +1183,34 @@ def test_check_directory_exists_missing_message_exact(
     assert str(exc.value) == f"Reference directory not found: {missing}"
 
 
+def test_check_directory_exists_path_under_file_is_not_found(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """A reference path nested under a regular file reads as not found."""
+    blocker = tmp_path / "file.txt"
+    blocker.write_text("x")
+    generator = _make_generator_no_validate(mocker, blocker / "agents")
+    with pytest.raises(FileNotFoundError, match="Reference directory not found"):
+        generator._check_directory_exists()
+
+
+def test_validate_reference_dir_uses_stat_only(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Validation answers existence via stat, never exists()/is_dir()."""
+    for source_file in REQUIRED_AGENTS.values():
+        (tmp_path / source_file).write_text(SAMPLE_AGENT_CONTENT)
+    generator = _make_generator_no_validate(mocker, tmp_path)
+    exists_spy = mocker.spy(Path, "exists")
+    is_dir_spy = mocker.spy(Path, "is_dir")
+
+    generator._check_directory_exists()
+    generator._check_required_agents()
+
+    exists_spy.assert_not_called()
+    is_dir_spy.assert_not_called()
+
+
 def test_check_directory_exists_not_dir_message_exact(
     tmp_path: Path, mocker: MockerFixture
 ) -> None:
@@ -1035,7 +1290,7 @@ async def test_tune_agent_body_passes_exact_preserve_sections(
     generator = SubagentsGenerator(mocker.Mock())
     generator.tuner = mock_tuner
 
-    await generator._tune_agent_body("chief-architect", "body", "tgt")
+    await generator._tune_agent_body("body", "tgt")
 
     kwargs = mock_tuner.tune.call_args.kwargs
     assert kwargs["source_content"] == "body"
@@ -1157,19 +1412,64 @@ async def test_generate_all_agents_preserves_required_order(
     assert list(results) == list(REQUIRED_AGENTS)
 
 
-# Mutation-killing tests: generate() NotImplementedError message
+# Sync generate() bridge
+
+
+def test_generate_sync_runs_all_agents_with_configured_context(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """generate() runs generate_all_agents on the constructor's context."""
+    for source_file in REQUIRED_AGENTS.values():
+        (tmp_path / source_file).write_text(SAMPLE_AGENT_CONTENT)
+    mocker.patch.object(SubagentsGenerator, "_validate_reference_dir")
+    generator = SubagentsGenerator(
+        mocker.Mock(), reference_dir=tmp_path, target_context="Django app"
+    )
+    generator.tuner = AsyncMock()
+    generator.tuner.tune = AsyncMock(
+        return_value=mocker.Mock(content="# C", changes=["c1"])
+    )
+
+    results = generator.generate()
+
+    assert list(results) == list(REQUIRED_AGENTS)
+    assert all(result.changes == ["c1"] for result in results.values())
+    contexts = {
+        call.kwargs["target_context"] for call in generator.tuner.tune.call_args_list
+    }
+    assert contexts == {"Django app"}
+
+
+@pytest.mark.asyncio
+async def test_generate_sync_inside_event_loop_raises(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """generate() refuses to nest inside a running loop."""
+    mocker.patch.object(SubagentsGenerator, "_validate_reference_dir")
+    generator = SubagentsGenerator(
+        mocker.Mock(), reference_dir=tmp_path, target_context="ctx"
+    )
+    # Stub the coroutine factory so no un-awaited coroutine is left behind.
+    mocker.patch.object(generator, "generate_all_agents", mocker.Mock())
+
+    with pytest.raises(RuntimeError, match="cannot be called from an event loop"):
+        generator.generate()
+
+
+# Mutation-killing tests: generate() missing target_context message
 
 
-def test_generate_sync_not_implemented_message_exact(
+def test_generate_sync_without_target_context_message_exact(
     mocker: MockerFixture,
 ) -> None:
-    """generate() raises NotImplementedError with the exact guidance text."""
+    """generate() without a target_context is a configuration ValueError."""
     mocker.patch("start_green_stay_green.ai.tuner.ContentTuner")
     mocker.patch.object(SubagentsGenerator, "_validate_reference_dir")
     generator = SubagentsGenerator(mocker.Mock())
-    with pytest.raises(NotImplementedError, match="requires async") as exc:
+    with pytest.raises(ValueError, match="requires a target_context") as exc:
         generator.generate()
     assert str(exc.value) == (
-        "SubagentsGenerator requires async operations. "
-        "Use generate_all_agents() or generate_agent() instead."
+        "SubagentsGenerator.generate() requires a target_context; "
+        "pass target_context to the constructor or use "
+        "generate_all_agents() instead."
     )
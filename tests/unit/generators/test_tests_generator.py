@@ -2,11 +2,14 @@
 
 import ast
 from pathlib import Path
+import shutil
 import tempfile
 
 import pytest
 
 from start_green_stay_green.generators.base import SUPPORTED_LANGUAGES
+from start_green_stay_green.generators.base import GenerationError
+from start_green_stay_green.generators import tests_gen
 from start_green_stay_green.generators.tests_gen import TestsConfig as Config
 from start_green_stay_green.generators.tests_gen import TestsGenerator as Generator
 from start_green_stay_green.utils.ruby import ruby_module_name
@@ -41,6 +44,25 @@ class TestGeneratorInitialization:
             assert generator is not None
             assert isinstance(generator, Generator)
 
+    def test_path_output_dir_is_kept_as_is(self, tmp_path: Path) -> None:
+        """Test a Path output_dir is stored without re-wrapping."""
+        config = Config(
+            project_name="test-project", language="python", package_name="test_project"
+        )
+
+        assert Generator(tmp_path, config).output_dir is tmp_path
+
+    def test_str_output_dir_is_coerced_to_path(self, tmp_path: Path) -> None:
+        """Test a string output_dir still becomes a Path."""
+        config = Config(
+            project_name="test-project", language="python", package_name="test_project"
+        )
+
+        generator = Generator(str(tmp_path), config)  # type: ignore[arg-type]
+
+        assert generator.output_dir == tmp_path
+        assert isinstance(generator.output_dir, Path)
+
     def test_generator_has_generate_method(self) -> None:
         """Test generator has generate method."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -240,6 +262,133 @@ class TestUnsupportedLanguage:
                 generator.generate()
 
 
+class TestDispatch:
+    """Test the module-level language dispatch table."""
+
+    def test_builders_cover_every_supported_language(self) -> None:
+        """Test each language maps to an existing builder method."""
+        assert set(tests_gen._TESTS_BUILDERS) == set(SUPPORTED_LANGUAGES)
+        for name in tests_gen._TESTS_BUILDERS.values():
+            assert callable(getattr(Generator, name))
+
+
+class TestContentMemoization:
+    """Test rendered test-file contents are shared per config."""
+
+    def test_content_shared_across_instances(self, tmp_path: Path) -> None:
+        """Test generators with equal configs reuse one render."""
+        config = Config(
+            project_name="demo-app", language="rust", package_name="demo_app"
+        )
+        other = Config(
+            project_name="other-app", language="rust", package_name="other_app"
+        )
+        Generator.clear_cache()
+        first = Generator(tmp_path / "a", config)
+        second = Generator(tmp_path / "b", config)
+
+        assert first._rust_test_integration_rs() is (second._rust_test_integration_rs())
+        assert (
+            "other-app" in Generator(tmp_path / "c", other)._rust_test_integration_rs()
+        )
+
+    def test_clear_cache_forces_fresh_render(self, tmp_path: Path) -> None:
+        """Test clear_cache drops memoized content so it is re-rendered."""
+        config = Config(
+            project_name="demo-app", language="rust", package_name="demo_app"
+        )
+        generator = Generator(tmp_path, config)
+        before = generator._rust_test_integration_rs()
+
+        Generator.clear_cache()
+
+        after = generator._rust_test_integration_rs()
+        assert after == before
+        assert after is not before
+
+
+class TestFileWrites:
+    """Test the batched write path shared by every language."""
+
+    @pytest.mark.parametrize("lang", SUPPORTED_LANGUAGES)
+    def test_keys_are_paths_relative_to_output_dir(
+        self, tmp_path: Path, lang: str
+    ) -> None:
+        """Test every returned key resolves to its file under output_dir."""
+        config = Config(
+            project_name="test-project", language=lang, package_name="test_project"
+        )
+
+        files = Generator(tmp_path, config).generate()
+
+        assert files == {key: tmp_path / key for key in files}
+
+    def test_writes_exact_utf8_bytes_with_lf_endings(self, tmp_path: Path) -> None:
+        """Test the rendered content lands on disk byte-for-byte."""
+        config = Config(
+            project_name="test-project", language="python", package_name="test_project"
+        )
+        generator = Generator(tmp_path, config)
+
+        files = generator.generate()
+
+        assert files["tests/test_main.py"].read_bytes() == (
+            generator._python_test_main_py().encode("utf-8")
+        )
+        assert b"\r\n" not in files["tests/test_main.py"].read_bytes()
+
+    def test_generate_creates_each_directory_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test one generate() issues a single mkdir per directory."""
+        config = Config(
+            project_name="test-project", language="ruby", package_name="test_project"
+        )
+        generator = Generator(tmp_path, config)
+        # Populate the tree first so mkdir never recurses into parents.
+        generator.generate()
+        made: list[Path] = []
+        real_mkdir = Path.mkdir
+
+        def recording_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+            made.append(self)
+            real_mkdir(self, *args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(Path, "mkdir", recording_mkdir)
+
+        generator.generate()
+
+        assert made
+        assert len(made) == len(set(made))
+
+    @pytest.mark.parametrize("language", ["python", "go", "ruby"])
+    def test_regenerate_after_output_removed(
+        self, tmp_path: Path, language: str
+    ) -> None:
+        """Test generate() recreates directories removed since the last run."""
+        config = Config(
+            project_name="test-project", language=language, package_name="test_project"
+        )
+        output_dir = tmp_path / "out"
+        generator = Generator(output_dir, config)
+        generator.generate()
+        shutil.rmtree(output_dir)
+
+        files = generator.generate()
+
+        assert all(path.is_file() for path in files.values())
+
+    def test_write_failure_raises_generation_error(self, tmp_path: Path) -> None:
+        """Test an OSError from the write is wrapped in GenerationError."""
+        config = Config(
+            project_name="test-project", language="python", package_name="test_project"
+        )
+        (tmp_path / "tests" / "test_main.py").mkdir(parents=True)
+
+        with pytest.raises(GenerationError, match=r"Failed to write test_main\.py"):
+            Generator(tmp_path, config).generate()
+
+
 class TestMultiLanguageTests:
     """Test test generation for all supported languages."""
 
@@ -279,6 +428,19 @@ class TestMultiLanguageTests:
                     f"Expected {expected_file} for {lang}, " f"got {list(files.keys())}"
                 )
 
+    @pytest.mark.parametrize("lang", SUPPORTED_LANGUAGES)
+    def test_templates_leave_no_placeholders(self, tmp_path: Path, lang: str) -> None:
+        """Test every template placeholder is substituted."""
+        config = Config(project_name="demo-app", language=lang, package_name="demo_app")
+
+        files = Generator(tmp_path, config).generate()
+
+        for key, path in files.items():
+            content = path.read_text(encoding="utf-8")
+            for name in ("project_name", "package_name", "namespace", "type_name"):
+                assert f"${name}" not in content, f"{key} left ${name}"
+                assert f"${{{name}}}" not in content, f"{key} left ${{{name}}}"
+
     def test_typescript_test_has_describe_block(self) -> None:
         """Test TypeScript test file has describe/it blocks."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -10,18 +10,22 @@ Tests the complete GitHub API integration including:
 """
 
 import base64
+import json
+import threading
 from typing import Any
 from unittest.mock import MagicMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
 import httpx
+from pydantic import ValidationError
 import pytest
 
 from start_green_stay_green.github import BranchProtectionRule
 from start_green_stay_green.github import GitHubAuthError
 from start_green_stay_green.github import GitHubClient
 from start_green_stay_green.github import GitHubError
+from start_green_stay_green.github import GitHubRateLimitError
 from start_green_stay_green.github import IssueData
 
 
@@ -206,6 +210,7 @@ class TestGitHubClientResponseHandling:
             client = GitHubClient("token", "owner", "repo")
             response = Mock(spec=httpx.Response)
             response.status_code = 403
+            response.headers = httpx.Headers()
             response.content = b'{"message": "Forbidden"}'
             response.json.return_value = {"message": "Forbidden"}
 
@@ -259,7 +264,7 @@ class TestGitHubClientResponseHandling:
             response = Mock(spec=httpx.Response)
             response.status_code = 200
             response.content = b"not json"
-            response.json.side_effect = Exception("Invalid JSON")
+            response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
 
             result = client._handle_response(response)
 
@@ -515,6 +520,7 @@ class TestGitHubClientIssueOperations:
                 status_code=200,
                 content=b'[{"number": 1}, {"number": 2}]',
                 json=lambda: [{"number": 1}, {"number": 2}],
+                headers={},
             )
 
             client = GitHubClient("token", "owner", "test-repo")
@@ -571,6 +577,23 @@ class TestGitHubClientLabelOperations:
             assert len(results) >= 0  # May be 0 if errors are caught
             assert mock_client.request.call_count >= 2
 
+    def test_create_labels_bulk_skips_duplicate_names(self) -> None:
+        """Repeated label names, in any case, are only posted once."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            labels = [
+                {"name": "bug", "color": "ff0000"},
+                {"name": "Bug", "color": "00ff00"},
+                {"name": "feature"},
+                {"name": "bug"},
+            ]
+            results = client.create_labels_bulk(labels)
+
+            calls = mock_client_class.return_value.request.call_args_list
+            assert [c.kwargs["json"]["name"] for c in calls] == ["bug", "feature"]
+            assert calls[0].kwargs["json"]["color"] == "ff0000"
+            assert len(results) == 2
+
 
 class TestGitHubClientMilestoneOperations:
     """Test milestone creation and management."""
@@ -617,6 +640,16 @@ class TestGitHubClientMilestoneOperations:
 
             assert len(results) >= 0
 
+    def test_create_milestones_bulk_skips_duplicate_titles(self) -> None:
+        """Repeated milestone titles are only posted once."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            milestones = [{"title": "v1.0"}, {"title": "v2.0"}, {"title": "v1.0"}]
+            client.create_milestones_bulk(milestones)
+
+            calls = mock_client_class.return_value.request.call_args_list
+            assert [c.kwargs["json"]["title"] for c in calls] == ["v1.0", "v2.0"]
+
 
 class TestGitHubClientFileOperations:
     """Test file creation and management."""
@@ -761,6 +794,25 @@ Test description
             assert "Test description" in issues[0].body
             assert "Criterion 1" in issues[0].body
 
+    def test_parsed_issue_matches_validated_model(self) -> None:
+        """Unvalidated parsed issues equal the fully validated equivalent."""
+        spec_content = """
+### Epic 3: Platform
+#### Issue 3.1: Cache things
+**Type**: Feature
+**Priority**: P1
+**Estimate**: 1 day
+**Description**: Add a cache
+"""
+        with patch("httpx.Client"):
+            client = GitHubClient("token", "owner", "test-repo")
+            parsed = client.parse_spec_issues(spec_content)[-1]
+
+        validated = IssueData.model_validate(parsed.model_dump())
+        assert parsed == validated
+        assert parsed.milestone is None
+        assert parsed.epic == "3"
+
 
 class TestBranchProtectionRule:
     """Test BranchProtectionRule model."""
@@ -838,6 +890,14 @@ class TestIssueDataModel:
         assert issue.estimate == "2 hours"
 
 
+@pytest.fixture
+def no_sleep() -> Any:
+    """Patch out retry backoff sleeps and expose the mock."""
+    with patch("start_green_stay_green.github.client.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.mark.usefixtures("no_sleep")
 class TestGitHubClientRetryLogic:
     """Test retry logic for transient failures."""
 
@@ -938,6 +998,15 @@ class TestHttpClientConstruction:
             kwargs = mock_client_class.call_args[1]
             assert kwargs["base_url"] == "https://api.github.com"
 
+    def test_pool_limits_keep_connections_alive(self) -> None:
+        """Every pooled connection is kept alive past the default expiry."""
+        with patch("httpx.Client") as mock_client_class:
+            GitHubClient("token", "owner", "repo")
+            limits = mock_client_class.call_args[1]["limits"]
+            assert limits.max_connections == GitHubClient.MAX_CONNECTIONS
+            assert limits.max_keepalive_connections == GitHubClient.MAX_CONNECTIONS
+            assert limits.keepalive_expiry == GitHubClient.KEEPALIVE_EXPIRY
+
     def test_authorization_header_exact(self) -> None:
         """Authorization header uses token scheme and the exact token."""
         with patch("httpx.Client") as mock_client_class:
@@ -959,6 +1028,19 @@ class TestHttpClientConstruction:
             headers = mock_client_class.call_args[1]["headers"]
             assert headers["User-Agent"] == "start-green-stay-green/1.0"
 
+    def test_api_version_header_pinned(self) -> None:
+        """Requests pin the REST API version GitHub should serve."""
+        with patch("httpx.Client") as mock_client_class:
+            GitHubClient("token", "owner", "repo")
+            headers = mock_client_class.call_args[1]["headers"]
+            assert headers["X-GitHub-Api-Version"] == "2022-11-28"
+
+    def test_static_headers_not_mutated_by_token(self) -> None:
+        """The per-client auth header is not written into the shared headers."""
+        with patch("httpx.Client"):
+            GitHubClient("token", "owner", "repo")
+        assert "Authorization" not in GitHubClient.STATIC_HEADERS
+
     def test_timeout_exact(self) -> None:
         """Timeout passed to httpx.Client is exactly 30 seconds."""
         with patch("httpx.Client") as mock_client_class:
@@ -1017,6 +1099,7 @@ class TestErrorBranches:
         """Build a mock httpx response with JSON body."""
         resp = Mock(spec=httpx.Response)
         resp.status_code = status
+        resp.headers = httpx.Headers()
         resp.content = b'{"message": "x"}'
         resp.json.return_value = body
         resp.text = "raw text"
@@ -1116,11 +1199,29 @@ class TestParseResponseBody:
             client = GitHubClient("token", "owner", "repo")
             resp = Mock(spec=httpx.Response)
             resp.content = b"oops"
-            resp.json.side_effect = Exception("boom")
+            resp.json.side_effect = json.JSONDecodeError("boom", "oops", 0)
             resp.text = "oops"
             assert client._parse_response_body(resp) == {"raw_body": "oops"}
 
+    def test_undecodable_body_returns_raw_body(self) -> None:
+        """Bytes that are not valid UTF-8 JSON fall back to the raw text."""
+        with patch("httpx.Client"):
+            client = GitHubClient("token", "owner", "repo")
+            resp = httpx.Response(200, content=b"\xff\xfe{")
+            assert "raw_body" in client._parse_response_body(resp)
+
+    def test_unexpected_errors_propagate(self) -> None:
+        """Only decode errors are absorbed; other exceptions surface."""
+        with patch("httpx.Client"):
+            client = GitHubClient("token", "owner", "repo")
+            resp = Mock(spec=httpx.Response)
+            resp.content = b"{}"
+            resp.json.side_effect = RuntimeError("bug")
+            with pytest.raises(RuntimeError, match="bug"):
+                client._parse_response_body(resp)
+
 
+@pytest.mark.usefixtures("no_sleep")
 class TestRequestRetries:
     """Test retry counts and exhaustion messages."""
 
@@ -1157,6 +1258,194 @@ class TestRequestRetries:
             assert mock_client_class.return_value.request.call_count == 1
 
 
+def _response(
+    status_code: int, headers: dict[str, str] | None = None
+) -> httpx.Response:
+    """Build a real httpx response with a JSON body."""
+    return httpx.Response(
+        status_code,
+        headers=headers,
+        json={"message": "status"},
+        request=httpx.Request("GET", "https://api.github.com/x"),
+    )
+
+
+class TestRetryBackoff:
+    """Test backoff and rate-limit handling in _request."""
+
+    @pytest.mark.parametrize("status", [502, 503, 504])
+    def test_gateway_errors_retry_with_backoff(
+        self, status: int, no_sleep: MagicMock
+    ) -> None:
+        """Gateway errors are retried after an exponential backoff."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.side_effect = [
+                _response(status),
+                _response(status),
+                _response(200),
+            ]
+            client = GitHubClient("token", "owner", "repo")
+            assert client._request("GET", "/x") == {"message": "status"}
+            assert mock_client.request.call_count == 3
+            delays = [c.args[0] for c in no_sleep.call_args_list]
+            assert 1.0 <= delays[0] < 2.0
+            assert 2.0 <= delays[1] < 3.0
+
+    def test_connection_errors_back_off(self, no_sleep: MagicMock) -> None:
+        """Connection errors sleep between attempts but not after the last."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.side_effect = httpx.ConnectError("down")
+            client = GitHubClient("token", "owner", "repo")
+            with pytest.raises(GitHubError, match="connection failed"):
+                client._request("GET", "/x")
+            assert no_sleep.call_count == 2
+
+    def test_backoff_is_capped(self) -> None:
+        """Backoff never exceeds RETRY_BACKOFF_MAX."""
+        with patch("httpx.Client"):
+            client = GitHubClient("token", "owner", "repo")
+            assert client._backoff_delay(10) == GitHubClient.RETRY_BACKOFF_MAX
+
+    def test_429_honours_retry_after(self, no_sleep: MagicMock) -> None:
+        """A 429 waits exactly Retry-After seconds before retrying."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.side_effect = [
+                _response(429, {"Retry-After": "7"}),
+                _response(200),
+            ]
+            client = GitHubClient("token", "owner", "repo")
+            client._request("GET", "/x")
+            no_sleep.assert_called_once_with(7.0)
+
+    def test_403_rate_limit_waits_for_reset(self, no_sleep: MagicMock) -> None:
+        """An exhausted primary rate limit waits until X-RateLimit-Reset."""
+        with (
+            patch("httpx.Client") as mock_client_class,
+            patch("start_green_stay_green.github.client.time.time") as now,
+        ):
+            now.return_value = 1000.0
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.side_effect = [
+                _response(
+                    403,
+                    {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1012"},
+                ),
+                _response(200),
+            ]
+            client = GitHubClient("token", "owner", "repo")
+            client._request("GET", "/x")
+            no_sleep.assert_called_once_with(12.0)
+
+    def test_plain_403_is_not_retried(self, no_sleep: MagicMock) -> None:
+        """A 403 without rate-limit headers raises immediately."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.return_value = _response(403)
+            client = GitHubClient("token", "owner", "repo")
+            with pytest.raises(GitHubAuthError):
+                client._request("GET", "/x")
+            assert mock_client.request.call_count == 1
+            no_sleep.assert_not_called()
+
+    def test_distant_reset_fails_fast(self, no_sleep: MagicMock) -> None:
+        """A reset beyond RATE_LIMIT_MAX_WAIT is not waited for."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.return_value = _response(429, {"Retry-After": "3600"})
+            client = GitHubClient("token", "owner", "repo")
+            with pytest.raises(GitHubRateLimitError) as exc_info:
+                client._request("GET", "/x")
+            assert exc_info.value.status_code == 429
+            assert mock_client.request.call_count == 1
+            no_sleep.assert_not_called()
+
+    def test_persistent_rate_limit_raises_after_retries(
+        self, no_sleep: MagicMock
+    ) -> None:
+        """The final rate-limited response is raised without a last sleep."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.return_value = _response(429, {"Retry-After": "1"})
+            client = GitHubClient("token", "owner", "repo")
+            with pytest.raises(GitHubRateLimitError):
+                client._request("GET", "/x")
+            assert mock_client.request.call_count == GitHubClient.MAX_RETRIES
+            assert no_sleep.call_count == GitHubClient.MAX_RETRIES - 1
+
+    def test_distant_403_reset_raises_rate_limit_error(
+        self, no_sleep: MagicMock
+    ) -> None:
+        """A rate-limited 403 too far from reset is not a scope problem."""
+        with (
+            patch("httpx.Client") as mock_client_class,
+            patch("start_green_stay_green.github.client.time.time") as now,
+        ):
+            now.return_value = 1000.0
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.return_value = _response(
+                403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4600"}
+            )
+            client = GitHubClient("token", "owner", "repo")
+            with pytest.raises(GitHubRateLimitError, match="Rate limit exceeded"):
+                client._request("GET", "/x")
+            assert mock_client.request.call_count == 1
+            no_sleep.assert_not_called()
+
+    @pytest.mark.parametrize("method", ["POST", "PATCH"])
+    def test_gateway_errors_not_retried_for_non_idempotent(
+        self, method: str, no_sleep: MagicMock
+    ) -> None:
+        """A POST/PATCH that hit a gateway error is not resent."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.return_value = _response(502)
+            client = GitHubClient("token", "owner", "repo")
+            with pytest.raises(GitHubError) as exc_info:
+                client._request(method, "/x")
+            assert exc_info.value.status_code == 502
+            assert mock_client.request.call_count == 1
+            no_sleep.assert_not_called()
+
+    @pytest.mark.parametrize("method", ["PUT", "DELETE", "HEAD"])
+    def test_gateway_errors_retried_for_idempotent(
+        self, method: str, no_sleep: MagicMock
+    ) -> None:
+        """Idempotent methods other than GET also retry gateway errors."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.side_effect = [_response(503), _response(200)]
+            client = GitHubClient("token", "owner", "repo")
+            client._request(method, "/x")
+            assert mock_client.request.call_count == 2
+            assert no_sleep.call_count == 1
+
+    def test_rate_limited_post_is_retried(self, no_sleep: MagicMock) -> None:
+        """A rate-limited POST was never applied, so it is retried."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.side_effect = [
+                _response(429, {"Retry-After": "2"}),
+                _response(201),
+            ]
+            client = GitHubClient("token", "owner", "repo")
+            client._request("POST", "/x")
+            no_sleep.assert_called_once_with(2.0)
+
+
 class TestCreateRepositoryPayload:
     """Test exact method, path, and payload for repository creation."""
 
@@ -1421,6 +1710,194 @@ class TestCreateLabelsBulkDefaults:
             assert payload["description"] == "d"
 
 
+class TestBulkConcurrency:
+    """Test the opt-in concurrent path of the bulk create methods."""
+
+    @staticmethod
+    def _echo_titles(
+        mock_client_class: MagicMock, barrier: threading.Barrier | None = None
+    ) -> None:
+        """Answer each request with its own title, optionally in lockstep."""
+
+        def respond(_method: str, _path: str, **kwargs: Any) -> Mock:
+            if barrier is not None:
+                barrier.wait(timeout=5)
+            title = kwargs["json"].get("title", kwargs["json"].get("name"))
+            return Mock(
+                status_code=201,
+                content=b"{}",
+                json=lambda: {"title": title},
+            )
+
+        mock_client_class.return_value.request.side_effect = respond
+
+    def test_issues_overlap_and_keep_input_order(self) -> None:
+        """With max_concurrency, requests run together; results stay ordered."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            # Each request blocks until all three are in flight at once.
+            self._echo_titles(mock_client_class, threading.Barrier(3))
+            issues = [IssueData(title=f"I{i}", body="") for i in range(3)]
+
+            results = client.create_issues_bulk(issues, max_concurrency=3)
+
+            assert [result["title"] for result in results] == ["I0", "I1", "I2"]
+
+    def test_default_is_serial_in_input_order(self) -> None:
+        """Without max_concurrency, issues are created one by one, in order."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            self._echo_titles(mock_client_class)
+            issues = [IssueData(title=f"I{i}", body="") for i in range(3)]
+
+            client.create_issues_bulk(issues)
+
+            titles = [
+                call[1]["json"]["title"]
+                for call in mock_client_class.return_value.request.call_args_list
+            ]
+            assert titles == ["I0", "I1", "I2"]
+
+    def test_issue_error_propagates_when_concurrent(self) -> None:
+        """A failing issue still raises GitHubError on the concurrent path."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            mock_client_class.return_value.request.return_value = Mock(
+                status_code=422,
+                content=b'{"message": "Validation Failed"}',
+                json=lambda: {"message": "Validation Failed"},
+                text="Validation Failed",
+            )
+            issues = [IssueData(title=f"I{i}", body="") for i in range(3)]
+
+            with pytest.raises(GitHubError, match="Validation Failed"):
+                client.create_issues_bulk(issues, max_concurrency=3)
+
+    def test_labels_and_milestones_skip_failures_when_concurrent(self) -> None:
+        """Per-item GitHubErrors are dropped, successes kept in order."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+
+            def respond(_method: str, _path: str, **kwargs: Any) -> Mock:
+                name = kwargs["json"].get("name") or kwargs["json"]["title"]
+                status = 422 if name.startswith("dup") else 201
+                return Mock(
+                    status_code=status,
+                    content=b"{}",
+                    json=lambda: {"name": name},
+                    text="",
+                )
+
+            mock_client_class.return_value.request.side_effect = respond
+
+            labels = client.create_labels_bulk(
+                [{"name": "a"}, {"name": "dup"}, {"name": "b"}], max_concurrency=3
+            )
+            milestones = client.create_milestones_bulk(
+                [{"title": "dup"}, {"title": "m1"}], max_concurrency=2
+            )
+
+            assert [label["name"] for label in labels] == ["a", "b"]
+            assert [milestone["name"] for milestone in milestones] == ["m1"]
+
+
+class TestCreateIssuesGraphql:
+    """Test batched issue creation through GraphQL mutations."""
+
+    @staticmethod
+    def _serve(
+        mock_client_class: MagicMock, errors: list[dict[str, str]] | None = None
+    ) -> list[dict[str, Any]]:
+        """Fake the REST lookups and GraphQL endpoint; return GraphQL bodies."""
+        graphql_bodies: list[dict[str, Any]] = []
+
+        def respond(method: str, path: str, **kwargs: Any) -> httpx.Response:
+            body: Any
+            if path == "/graphql":
+                graphql_bodies.append(kwargs["json"])
+                variables = kwargs["json"]["variables"]
+                body = {
+                    "data": {
+                        alias: {"issue": {"number": 1, "title": value["title"]}}
+                        for alias, value in variables.items()
+                    }
+                }
+                if errors:
+                    body["errors"] = errors
+            elif path.endswith("/labels") and method == "GET":
+                body = [{"name": "Bug", "node_id": "L_bug"}]
+            elif path.endswith("/labels"):
+                name = kwargs["json"]["name"]
+                body = {"name": name, "node_id": f"L_{name}"}
+            else:
+                body = {"node_id": "R_repo"}
+            return httpx.Response(
+                200, json=body, request=httpx.Request(method, "https://x" + path)
+            )
+
+        mock_client_class.return_value.request.side_effect = respond
+        return graphql_bodies
+
+    def test_issues_batched_per_request(self) -> None:
+        """Issues are sent GRAPHQL_BATCH_SIZE at a time, in order."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            bodies = self._serve(mock_client_class)
+            issues = [IssueData(title=f"I{i}", body="b") for i in range(30)]
+
+            created = client.create_issues_graphql(issues)
+
+            assert [issue["title"] for issue in created] == [f"I{i}" for i in range(30)]
+            assert [len(body["variables"]) for body in bodies] == [25, 5]
+            first = bodies[0]["variables"]["i0"]
+            assert first == {
+                "repositoryId": "R_repo",
+                "title": "I0",
+                "body": "b",
+                "labelIds": [],
+            }
+            assert "$i24: CreateIssueInput!" in bodies[0]["query"]
+
+    def test_labels_resolved_and_missing_created(self) -> None:
+        """Label names map to node IDs; unknown labels are created first."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            bodies = self._serve(mock_client_class)
+
+            client.create_issues_graphql(
+                [IssueData(title="t", body="", labels=["bug", "p0"])]
+            )
+
+            assert bodies[0]["variables"]["i0"]["labelIds"] == ["L_bug", "L_p0"]
+            posts = [
+                c.kwargs["json"]["name"]
+                for c in mock_client_class.return_value.request.call_args_list
+                if c.args == ("POST", "/repos/octocat/hello-world/labels")
+            ]
+            assert posts == ["p0"]
+
+    def test_graphql_errors_raise(self) -> None:
+        """A GraphQL error in the response raises GitHubError."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            self._serve(
+                mock_client_class, errors=[{"message": "was submitted too quickly"}]
+            )
+
+            with pytest.raises(
+                GitHubError, match="GraphQL error: was submitted"
+            ) as exc:
+                client.create_issues_graphql([IssueData(title="t", body="")])
+            assert exc.value.response_body is not None
+
+    def test_empty_input_makes_no_requests(self) -> None:
+        """An empty issue list returns immediately."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            assert client.create_issues_graphql([]) == []
+            assert mock_client_class.return_value.request.call_count == 0
+
+
 class TestCreateMilestonePayload:
     """Test exact method, path, and payload for milestone creation."""
 
@@ -1451,6 +1928,45 @@ class TestCreateMilestonePayload:
             assert payload["description"] == ""
 
 
+class TestBulkRateLimit:
+    """Test bulk creates surface rate limits instead of skipping items."""
+
+    def test_rate_limit_error_is_auth_error(self) -> None:
+        """Existing ``except GitHubAuthError`` handlers still match."""
+        assert issubclass(GitHubRateLimitError, GitHubAuthError)
+
+    def test_labels_bulk_propagates_rate_limit(self) -> None:
+        """A rate-limited label is not mistaken for an existing one."""
+        with patch("httpx.Client"):
+            client = GitHubClient("token", "owner", "repo")
+        limited = GitHubRateLimitError("Rate limit exceeded", status_code=429)
+        with (
+            patch.object(client, "create_label", side_effect=limited),
+            pytest.raises(GitHubRateLimitError),
+        ):
+            client.create_labels_bulk([{"name": "bug"}])
+
+    def test_milestones_bulk_propagates_rate_limit(self) -> None:
+        """A rate-limited milestone is not mistaken for an existing one."""
+        with patch("httpx.Client"):
+            client = GitHubClient("token", "owner", "repo")
+        limited = GitHubRateLimitError("Rate limit exceeded", status_code=403)
+        with (
+            patch.object(client, "create_milestone", side_effect=limited),
+            pytest.raises(GitHubRateLimitError),
+        ):
+            client.create_milestones_bulk([{"title": "v1"}])
+
+    def test_labels_bulk_still_skips_other_errors(self) -> None:
+        """Other failures (e.g. 422 already exists) are still skipped."""
+        with patch("httpx.Client"):
+            client = GitHubClient("token", "owner", "repo")
+        exists = GitHubError("GitHub API error: already_exists", status_code=422)
+        with patch.object(client, "create_label", side_effect=[exists, {"name": "b"}]):
+            created = client.create_labels_bulk([{"name": "a"}, {"name": "b"}])
+        assert created == [{"name": "b"}]
+
+
 class TestCreateMilestonesBulkDefaults:
     """Test the per-milestone .get defaults in bulk milestone creation."""
 
@@ -1485,6 +2001,98 @@ class TestGetRepositoryInfoCall:
             assert call[0][0] == "GET"
             assert call[0][1] == "/repos/octocat/hello-world"
 
+    def test_result_cached_per_client(self) -> None:
+        """Repeated lookups reuse the first response."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            first = client.get_repository_info()
+            assert client.get_repository_info() is first
+            assert mock_client_class.return_value.request.call_count == 1
+
+    def test_refresh_refetches(self) -> None:
+        """refresh=True bypasses the cached copy."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            client.get_repository_info()
+            client.get_repository_info(refresh=True)
+            assert mock_client_class.return_value.request.call_count == 2
+
+    def test_updates_invalidate_cache(self) -> None:
+        """Changing the repository through the client drops the cache."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            client.get_repository_info()
+            client.update_repository(description="d")
+            client.get_repository_info()
+            client.add_repository_topics(["python"])
+            client.get_repository_info()
+            methods = [
+                c.args[0] for c in mock_client_class.return_value.request.call_args_list
+            ]
+            assert methods == ["GET", "PATCH", "GET", "PUT", "GET"]
+
+
+class TestSkipExisting:
+    """Test the opt-in existence pre-check of the bulk create methods."""
+
+    @staticmethod
+    def _serve(mock_client_class: MagicMock, listing: list[dict[str, str]]) -> None:
+        """Answer GETs with ``listing`` and POSTs by echoing the payload."""
+
+        def respond(method: str, path: str, **kwargs: Any) -> httpx.Response:
+            body: Any = listing if method == "GET" else kwargs["json"]
+            return httpx.Response(
+                200, json=body, request=httpx.Request(method, "https://x" + path)
+            )
+
+        mock_client_class.return_value.request.side_effect = respond
+
+    def test_labels_present_on_github_are_skipped(self) -> None:
+        """Existing labels, compared case-insensitively, are not posted."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            self._serve(mock_client_class, [{"name": "Bug"}])
+
+            created = client.create_labels_bulk(
+                [{"name": "bug"}, {"name": "feature"}], skip_existing=True
+            )
+            client.create_labels_bulk(
+                [{"name": "feature"}, {"name": "docs"}], skip_existing=True
+            )
+
+            assert [label["name"] for label in created] == ["feature"]
+            calls = mock_client_class.return_value.request.call_args_list
+            assert [(c.args[0], c.args[1].rsplit("/", 1)[-1]) for c in calls] == [
+                ("GET", "labels"),
+                ("POST", "labels"),
+                ("POST", "labels"),
+            ]
+            assert calls[2].kwargs["json"]["name"] == "docs"
+
+    def test_milestones_listed_in_all_states(self) -> None:
+        """Milestone titles come from open and closed milestones."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            self._serve(mock_client_class, [{"title": "v1"}])
+
+            created = client.create_milestones_bulk(
+                [{"title": "v1"}, {"title": "v2"}], skip_existing=True
+            )
+
+            assert [m["title"] for m in created] == ["v2"]
+            get_call = mock_client_class.return_value.request.call_args_list[0]
+            assert get_call.kwargs["params"]["state"] == "all"
+            assert get_call.kwargs["params"]["per_page"] == 100
+
+    def test_default_does_not_list(self) -> None:
+        """Without skip_existing no listing request is made."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            client.create_labels_bulk([{"name": "bug"}])
+            call = _request_call(mock_client_class)
+            assert mock_client_class.return_value.request.call_count == 1
+            assert call[0][0] == "POST"
+
 
 class TestUpdateRepositoryPayload:
     """Test exact method, path, and filtered payload for repo update."""
@@ -1551,6 +2159,22 @@ class TestCreateOrUpdateFile:
             assert payload["message"] == "msg"
             assert payload["branch"] == "dev"
 
+    def test_bytes_content_encoded_as_is(self) -> None:
+        """Bytes content, including non-UTF-8 data, is base64 encoded directly."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            client.create_or_update_file("logo.png", b"\x89PNG\xff", "msg")
+            payload = _request_call(mock_client_class)[1]["json"]
+            assert base64.b64decode(payload["content"]) == b"\x89PNG\xff"
+
+    def test_text_content_utf8_encoded(self) -> None:
+        """Text content is UTF-8 encoded before base64."""
+        with patch("httpx.Client") as mock_client_class:
+            client = _make_client(mock_client_class)
+            client.create_or_update_file("x.md", "caf\u00e9", "msg")
+            payload = _request_call(mock_client_class)[1]["json"]
+            assert base64.b64decode(payload["content"]) == "caf\u00e9".encode()
+
     def test_default_branch_is_main(self) -> None:
         """The default commit branch is main."""
         with patch("httpx.Client") as mock_client_class:
@@ -1634,6 +2258,7 @@ class TestListIssuesParams:
             status_code=200,
             content=b"[]",
             json=lambda: [{"number": 1}],
+            headers={},
         )
         return GitHubClient("token", "octocat", "hello-world")
 
@@ -1690,12 +2315,78 @@ class TestListIssuesParams:
                 status_code=200,
                 content=b"{}",
                 json=lambda: {"number": 7},
+                headers={},
             )
             client = GitHubClient("token", "octocat", "hello-world")
             result = client.list_issues()
             assert result == [{"number": 7}]
 
 
+def _issues_page(page: int, last: int) -> httpx.Response:
+    """Build one page of a paginated issues listing."""
+    url = "https://api.github.com/repos/octocat/hello-world/issues"
+    links = f'<{url}?page={page + 1}>; rel="next", <{url}?page={last}>; rel="last"'
+    return httpx.Response(
+        200,
+        headers={"Link": links} if page < last else {},
+        json=[{"number": page * 10 + 1}, {"number": page * 10 + 2}],
+        request=httpx.Request("GET", url),
+    )
+
+
+class TestListIssuesPagination:
+    """Test that list_issues follows the Link header to the last page."""
+
+    def test_all_pages_fetched_in_order(self) -> None:
+        """Pages 2..last are requested and flattened after page one."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.side_effect = [_issues_page(p, 3) for p in (1, 2, 3)]
+            client = GitHubClient("token", "octocat", "hello-world")
+
+            result = client.list_issues(labels=["bug"])
+
+            assert [i["number"] for i in result] == [11, 12, 21, 22, 31, 32]
+            calls = mock_client.request.call_args_list
+            assert [c.kwargs["params"].get("page") for c in calls] == [None, 2, 3]
+            assert all(c.kwargs["params"]["labels"] == "bug" for c in calls)
+
+    def test_single_page_makes_one_request(self) -> None:
+        """Without a Link header only the first page is requested."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.request.return_value = _issues_page(1, 1)
+            client = GitHubClient("token", "octocat", "hello-world")
+
+            assert len(client.list_issues()) == 2
+            assert mock_client.request.call_count == 1
+
+    def test_concurrent_pages_keep_order(self) -> None:
+        """Concurrent page fetches still return issues in page order."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            pages = {p: _issues_page(p, 4) for p in range(1, 5)}
+            mock_client.request.side_effect = lambda *_a, **kw: pages[
+                kw["params"].get("page", 1)
+            ]
+            client = GitHubClient("token", "octocat", "hello-world")
+
+            result = client.list_issues(max_concurrency=3)
+
+            numbers = [i["number"] for i in result]
+            assert numbers == [11, 12, 21, 22, 31, 32, 41, 42]
+
+    def test_last_page_requires_numeric_page(self) -> None:
+        """A malformed rel=last link is treated as a single page."""
+        response = httpx.Response(
+            200, headers={"Link": '<https://x/issues?page=abc>; rel="last"'}
+        )
+        assert GitHubClient._last_page(response) == 1
+
+
 class TestSpecParsingDetails:
     """Test SPEC parsing field extraction, epics, and labels."""
 
@@ -1750,23 +2441,45 @@ class TestSpecParsingDetails:
             child = next(i for i in issues if i.title.startswith("4.1"))
             assert child.epic == "4.0"
 
-    def test_no_epic_at_position_zero(self) -> None:
-        """An issue at position zero has no epic."""
-        with patch("httpx.Client"):
-            client = GitHubClient("token", "owner", "repo")
-            assert client._find_epic("### Epic 1.0: x", 0) is None
-
-    def test_extract_field_default_returned(self) -> None:
-        """Missing fields return the provided default value."""
-        with patch("httpx.Client"):
-            client = GitHubClient("token", "owner", "repo")
-            assert client._extract_field("nothing here", "Type", "Task") == "Task"
-
-    def test_extract_field_value_returned(self) -> None:
-        """A present field returns its stripped value."""
+    def test_issues_take_nearest_preceding_epic(self) -> None:
+        """Each issue belongs to the closest Epic heading above it."""
+        spec = (
+            "### Epic 1: First\n"
+            "#### Issue 1.1: A\n"
+            "### Epic 2: Second\n"
+            "#### Issue 2.1: B\n"
+            "#### Issue 2.2: C\n"
+        )
         with patch("httpx.Client"):
             client = GitHubClient("token", "owner", "repo")
-            assert client._extract_field("**Type**: Bug", "Type") == "Bug"
+            epics = {i.title: i.epic for i in client.parse_spec_issues(spec)}
+        assert epics == {
+            "1: First": None,
+            "1.1: A": "1",
+            "2: Second": "1",
+            "2.1: B": "2",
+            "2.2: C": "2",
+        }
+
+    def test_scan_fields_single_pass(self) -> None:
+        """One scan returns every field, keeping single-line fields to a line."""
+        content = (
+            "Title\n**Type**: Bug\nextra\n**Priority**: P1\n"
+            "**Description**:\nline one\nline two\n\n"
+            "**Acceptance Criteria**:\n- [ ] done\n"
+        )
+        assert GitHubClient._scan_fields(content) == {
+            "Type": "Bug",
+            "Priority": "P1",
+            "Description": "line one\nline two",
+            "Acceptance Criteria": "- [ ] done",
+        }
+
+    def test_scan_fields_first_wins_and_skips_empty(self) -> None:
+        """Repeated fields keep the first value; empty values are absent."""
+        content = "**Type**: Bug\n**Type**: Task\n**Estimate**:\n**Priority**: P0"
+        fields = GitHubClient._scan_fields(content)
+        assert fields == {"Type": "Bug", "Priority": "P0"}
 
     def test_build_issue_body_without_criteria(self) -> None:
         """An empty criteria leaves the body as the description alone."""
@@ -1774,18 +2487,6 @@ class TestSpecParsingDetails:
             client = GitHubClient("token", "owner", "repo")
             assert client._build_issue_body("desc", "") == "desc"
 
-    def test_extract_description_empty_default(self) -> None:
-        """Missing description returns the empty string."""
-        with patch("httpx.Client"):
-            client = GitHubClient("token", "owner", "repo")
-            assert client._extract_description("no fields") == ""
-
-    def test_extract_criteria_empty_default(self) -> None:
-        """Missing criteria returns the empty string."""
-        with patch("httpx.Client"):
-            client = GitHubClient("token", "owner", "repo")
-            assert client._extract_criteria("no fields") == ""
-
 
 class TestModelDefaultsExact:
     """Test exact model default values for None-mutant kills."""
@@ -1811,6 +2512,15 @@ class TestModelDefaultsExact:
         assert isinstance(issue.labels, list)
         assert not issue.labels
 
+    def test_models_are_frozen(self) -> None:
+        """Field assignment on either model raises a validation error."""
+        issue = IssueData(title="t", body="b")
+        with pytest.raises(ValidationError, match="frozen"):
+            issue.title = "changed"  # type: ignore[misc]
+        rule = BranchProtectionRule()
+        with pytest.raises(ValidationError, match="frozen"):
+            rule.allow_deletions = True  # type: ignore[misc]
+
     def test_issue_data_optional_defaults_none(self) -> None:
         """IssueData optional string fields default to None, not empty."""
         issue = IssueData(title="t", body="b")
@@ -0,0 +1,51 @@
+"""Unit tests for the lazy exports of the github package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import start_green_stay_green.github as github_pkg
+from start_green_stay_green.github import client
+
+
+def test_exports_resolve_to_client_objects() -> None:
+    """Every public name resolves to the object defined in client."""
+    for name in github_pkg.__all__:
+        assert getattr(github_pkg, name) is getattr(client, name)
+
+
+def test_submodules_resolve_on_attribute_access() -> None:
+    """Submodules are importable as package attributes."""
+    assert github_pkg.actions.__name__ == "start_green_stay_green.github.actions"
+    assert github_pkg.issues.__name__ == "start_green_stay_green.github.issues"
+
+
+def test_unknown_attribute_raises() -> None:
+    """Unknown names raise AttributeError naming the package."""
+    with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+        _ = github_pkg.Missing
+
+
+def test_dir_lists_lazy_exports() -> None:
+    """dir() advertises exports before they are loaded."""
+    assert set(github_pkg.__all__) <= set(dir(github_pkg))
+    assert {"actions", "client", "issues"} <= set(dir(github_pkg))
+
+
+def test_importing_package_does_not_load_httpx() -> None:
+    """Importing a sibling submodule leaves httpx unimported."""
+    code = (
+        "import sys\n"
+        "import start_green_stay_green.github.issues\n"
+        "print('httpx' in sys.modules)\n"
+    )
+    completed = subprocess.run(  # noqa: S603 — fixed argv, our interpreter
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=60,
+    )
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == "False"
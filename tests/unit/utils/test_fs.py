@@ -107,3 +107,94 @@ class TestMakeExecutable:
 
         with pytest.raises(OSError, match="does-not-exist"):
             fs.make_executable(tmp_path / "does-not-exist.sh")
+
+
+class TestWriteFile:
+    """Tests for fs.write_file single-pass writes."""
+
+    def test_writes_utf8_with_lf_endings(self, tmp_path: Path) -> None:
+        """Text is UTF-8 encoded and newlines are written untranslated."""
+        target = tmp_path / "main.py"
+
+        fs.write_file(target, "print('✓')\nx = 1\n")
+
+        assert target.read_bytes() == "print('✓')\nx = 1\n".encode()
+
+    def test_truncates_existing_file(self, tmp_path: Path) -> None:
+        """A longer existing file is truncated to the new content."""
+        target = tmp_path / "main.py"
+        target.write_text("x" * 100, encoding="utf-8")
+
+        fs.write_file(target, b"short\n")
+
+        assert target.read_bytes() == b"short\n"
+
+    def test_new_file_is_not_executable(self, tmp_path: Path) -> None:
+        """Plain writes keep the regular-file default mode."""
+        target = tmp_path / "main.py"
+
+        fs.write_file(target, "x = 1\n")
+
+        if not is_windows():
+            assert not target.stat().st_mode & 0o111
+
+    def test_missing_parent_raises(self, tmp_path: Path) -> None:
+        """A missing parent directory surfaces as OSError."""
+        with pytest.raises(OSError, match="missing"):
+            fs.write_file(tmp_path / "missing" / "main.py", "x = 1\n")
+
+
+class TestWriteExecutable:
+    """Tests for fs.write_executable single-descriptor writes."""
+
+    def test_writes_content_and_mode(self, tmp_path: Path) -> None:
+        """The file holds the exact UTF-8 bytes and ends up executable."""
+        target = tmp_path / "script.sh"
+
+        fs.write_executable(target, "#!/bin/sh\necho ✓\n")
+
+        assert target.read_bytes() == "#!/bin/sh\necho ✓\n".encode()
+        assert_executable(target)
+
+    def test_writes_pre_encoded_bytes_verbatim(self, tmp_path: Path) -> None:
+        """Bytes content is written as-is, without a second encode."""
+        target = tmp_path / "script.sh"
+        data = "#!/bin/sh\necho ✓\n".encode()
+
+        fs.write_executable(target, data)
+
+        assert target.read_bytes() == data
+        assert_executable(target)
+
+    def test_overwrites_and_truncates_existing_file(self, tmp_path: Path) -> None:
+        """A longer existing file is truncated, and its mode reset."""
+        target = tmp_path / "script.sh"
+        target.write_text("x" * 100, encoding="utf-8")
+        if not is_windows():
+            target.chmod(0o600)
+
+        fs.write_executable(target, "short\n")
+
+        assert target.read_bytes() == b"short\n"
+        assert_executable(target)
+
+    def test_windows_skips_fchmod(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """On Windows the descriptor is never fchmod-ed."""
+        monkeypatch.setattr(fs, "is_windows", _always_windows)
+
+        def forbid_fchmod(_fd: int, _mode: int) -> None:
+            msg = "fchmod must not be called on Windows"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr(os, "fchmod", forbid_fchmod, raising=False)
+
+        fs.write_executable(tmp_path / "script.sh", "echo\n")
+
+        assert (tmp_path / "script.sh").read_bytes() == b"echo\n"
+
+    def test_missing_parent_raises(self, tmp_path: Path) -> None:
+        """A missing parent directory surfaces as OSError."""
+        with pytest.raises(OSError, match="missing"):
+            fs.write_executable(tmp_path / "missing" / "script.sh", "echo\n")